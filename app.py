@@ -10,6 +10,7 @@ import logging
 
 from app.models.announcement import AnnouncementModel
 from app.services.data_collector import DataCollectionService
+from app.services.gyeongnam_region_service import gyeongnam_region_service
 from config.database import test_database_connection
 
 # 로깅 설정
@@ -121,23 +122,29 @@ def admin_dashboard():
 def admin_announcements():
     """관리자 - 공고 목록"""
     try:
-        page = int(request.args.get('page', 1))
-        region_filter = request.args.get('region', None)
-        status_filter = request.args.get('status', None)
+        cursor = request.args.get('cursor') or None
+        region_filter = request.args.get('region') or None
+        status_filter = request.args.get('status') or None
         
-        # TODO: 페이징 처리 및 필터링 구현
-        announcements = AnnouncementModel.get_announcements_by_region(region_filter, 50)
+        page = AnnouncementModel.get_announcements_page(
+            [region_filter] if region_filter else None,
+            50,
+            cursor,
+            status_filter
+        )
         
         return render_template('admin/announcements.html', 
-                             announcements=announcements,
-                             current_page=page,
+                             announcements=page['announcements'],
+                             next_cursor=page['next_cursor'],
+                             is_first_page=cursor is None,
+                             regions=gyeongnam_region_service.get_all_regions(),
                              region_filter=region_filter,
                              status_filter=status_filter)
         
     except Exception as e:
         logger.error(f"관리자 공고 목록 오류: {e}")
         flash(f'공고 목록 조회 오류: {e}', 'error')
-        return render_template('admin/announcements.html', announcements=[])
+        return render_template('admin/announcements.html', announcements=[], is_first_page=True)
 
 @app.route('/admin/classify', methods=['POST'])
 @login_required
@@ -152,6 +159,7 @@ def admin_classify():
         )
         
         if success:
+            AnnouncementModel.invalidate_cache()
             return jsonify({'success': True, 'message': '분류 완료'})
         else:
             return jsonify({'success': False, 'error': '분류 실패'}), 500
@@ -0,0 +1,113 @@
+"""
+AI 분류 결과 캐시 모델
+"""
+
+from datetime import datetime, timedelta
+from typing import Dict, List
+import psycopg2.extras
+from config.database import DatabaseManager
+import logging
+
+logger = logging.getLogger(__name__)
+
+class AIClassificationCacheModel:
+    """콘텐츠 해시 기반 AI 분류 결과 캐시"""
+    
+    @staticmethod
+    def get_cached(content_hashes: List[str], model_name: str, max_age_days: int) -> Dict[str, Dict]:
+        """
+        캐시된 분류 결과를 조회하고 적중 횟수를 기록합니다.
+        
+        Args:
+            content_hashes: 조회할 콘텐츠 해시 리스트
+            model_name: 결과를 만든 모델 이름 (다른 모델의 결과는 무시)
+            max_age_days: 이보다 오래된 결과는 무시
+            
+        Returns:
+            Dict[str, Dict]: {content_hash: {'region_code', 'confidence', 'reason'}} (실패 시 빈 딕셔너리)
+        """
+        if not content_hashes:
+            return {}
+        
+        try:
+            with DatabaseManager.get_db_cursor() as (cursor, connection):
+                cursor.execute("""
+                UPDATE ai_classification_cache
+                SET hit_count = hit_count + 1,
+                    last_hit_at = CURRENT_TIMESTAMP
+                WHERE model_name = %s
+                  AND content_hash = ANY(%s)
+                  AND created_at >= %s
+                RETURNING content_hash, region_code, confidence, reason
+                """, (model_name, list(content_hashes), datetime.now() - timedelta(days=max_age_days)))
+                
+                return {
+                    row['content_hash']: {
+                        'region_code': row['region_code'],
+                        'confidence': float(row['confidence']) if row['confidence'] is not None else 0.0,
+                        'reason': row['reason'] or ''
+                    }
+                    for row in cursor.fetchall()
+                }
+                
+        except Exception as e:
+            logger.error(f"AI 분류 캐시 조회 오류: {e}")
+            return {}
+    
+    @staticmethod
+    def store(entries: List[Dict], model_name: str) -> int:
+        """
+        분류 결과를 캐시에 저장합니다. 같은 해시가 있으면 새 결과로 덮어씁니다.
+        
+        Args:
+            entries: [{'content_hash', 'region_code', 'confidence', 'reason'}] 리스트
+            model_name: 결과를 만든 모델 이름
+            
+        Returns:
+            int: 저장된 행 수 (실패 시 0)
+        """
+        if not entries:
+            return 0
+        
+        sql = """
+        INSERT INTO ai_classification_cache (content_hash, model_name, region_code, confidence, reason)
+        VALUES %s
+        ON CONFLICT (content_hash, model_name) DO UPDATE
+        SET region_code = EXCLUDED.region_code,
+            confidence = EXCLUDED.confidence,
+            reason = EXCLUDED.reason,
+            created_at = CURRENT_TIMESTAMP
+        """
+        values = [
+            (entry['content_hash'], model_name, entry['region_code'], entry['confidence'], entry['reason'])
+            for entry in entries
+        ]
+        
+        try:
+            with DatabaseManager.get_db_cursor() as (cursor, connection):
+                psycopg2.extras.execute_values(cursor, sql, values)
+                return len(values)
+                
+        except Exception as e:
+            logger.error(f"AI 분류 캐시 저장 오류 ({len(values)}개): {e}")
+            return 0
+    
+    @staticmethod
+    def purge_stale(model_name: str, max_age_days: int) -> int:
+        """
+        현재 모델이 아닌 결과와 만료된 결과를 삭제합니다.
+        
+        Returns:
+            int: 삭제된 행 수 (실패 시 0)
+        """
+        try:
+            with DatabaseManager.get_db_cursor() as (cursor, connection):
+                cursor.execute("""
+                DELETE FROM ai_classification_cache
+                WHERE model_name <> %s OR created_at < %s
+                """, (model_name, datetime.now() - timedelta(days=max_age_days)))
+                return cursor.rowcount
+                
+        except Exception as e:
+            logger.error(f"AI 분류 캐시 정리 오류: {e}")
+            return 0
@@ -2,33 +2,122 @@
 공고 데이터 모델
 """
 
+import os
+import base64
+import json
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import Iterator, List, Dict, Optional, Tuple
+import psycopg2
+import psycopg2.extras
 from config.database import DatabaseManager
+from app.utils.query_cache import TTLLRUCache
 import logging
 
 logger = logging.getLogger(__name__)
 
+# 공개 공고 조회 캐시 (프로세스 단위)
+announcement_cache = TTLLRUCache(
+    max_size=int(os.getenv('ANNOUNCEMENT_CACHE_SIZE', '256')),
+    ttl_seconds=float(os.getenv('ANNOUNCEMENT_CACHE_TTL', '300'))
+)
+
+# 공고 데이터 버전 캐시 (ETag 응답이 매 요청마다 DB를 조회하지 않도록 짧게 보관)
+data_version_cache = TTLLRUCache(
+    max_size=1,
+    ttl_seconds=float(os.getenv('DATA_VERSION_TTL', '5'))
+)
+
+# announcements 테이블 INSERT 컬럼 (기업마당 API 필드명과 동일)
+ANNOUNCEMENT_COLUMNS = [
+    'pblancId', 'pblancNm', 'jrsdInsttNm', 'excInsttNm', 'bsnsSumryCn', 'trgetNm',
+    'pblancUrl', 'rceptEngnHmpgUrl', 'flpthNm', 'printFlpthNm', 'printFileNm', 'fileNm',
+    'reqstBeginEndDe', 'reqstMthPapersCn', 'refrncNm', 'pldirSportRealmLclasCodeNm',
+    'pldirSportRealmMlsfcCodeNm', 'hashtags', 'totCnt', 'inqireCo', 'creatPnttm',
+    'content_hash', 'classification_hash'
+]
+
+# 재수집한 공고의 분류 필드가 바뀌었을 때 분류를 초기화하는 조건 (수동 분류/검증된 공고는 유지)
+RECLASSIFY_CONDITION = """
+    announcements.classification_hash IS NOT NULL
+    AND announcements.classification_hash IS DISTINCT FROM EXCLUDED.classification_hash
+    AND announcements.classification_method IS DISTINCT FROM 'manual'
+    AND announcements.classification_status IS DISTINCT FROM 'verified'
+"""
+
+# 분류기에 넘기는 공고 컬럼 (따옴표 없는 식별자는 소문자로 접히므로 API 필드명으로 별칭 지정)
+CLASSIFICATION_SELECT = """
+    id, pblancId AS "pblancId", pblancNm AS "pblancNm", jrsdInsttNm AS "jrsdInsttNm",
+    excInsttNm AS "excInsttNm", bsnsSumryCn AS "bsnsSumryCn", hashtags, refrncNm AS "refrncNm"
+"""
+
+# 미분류 공고 조건
+UNCLASSIFIED_WHERE = """
+    region_code IS NULL
+    AND is_active = true
+    AND classification_status = 'pending'
+"""
+
 class AnnouncementModel:
     """공고 데이터베이스 모델"""
     
     @staticmethod
-    def get_existing_ids() -> set:
+    def get_existing_ids(pblanc_ids: List[str]) -> set:
         """
-        데이터베이스에 이미 존재하는 공고 ID들을 가져옵니다.
+        주어진 공고 ID 중 데이터베이스에 이미 존재하는 ID들을 가져옵니다.
         
+        전체 테이블이 아닌 이번에 수집한 ID만 조회하므로 비용이 아카이브 크기와 무관합니다.
+        
+        Args:
+            pblanc_ids: 확인할 공고 ID 리스트
+            
         Returns:
-            set: 기존 공고 ID 집합
+            set: 이미 존재하는 공고 ID 집합
         """
+        if not pblanc_ids:
+            return set()
+        
         try:
             with DatabaseManager.get_db_cursor() as (cursor, connection):
-                cursor.execute("SELECT pblancId FROM announcements WHERE is_active = true")
+                cursor.execute(
+                    'SELECT pblancId AS "pblancId" FROM announcements WHERE pblancId = ANY(%s)',
+                    (list(set(pblanc_ids)),)
+                )
                 results = cursor.fetchall()
                 return {row['pblancId'] for row in results}
         except Exception as e:
             logger.error(f"기존 공고 ID 조회 오류: {e}")
             return set()
     
+    @staticmethod
+    def get_content_hashes(pblanc_ids: List[str]) -> Dict[str, Optional[str]]:
+        """
+        주어진 pblancId 중 이미 존재하는 공고의 내용 해시를 조회합니다.
+        
+        Args:
+            pblanc_ids: 확인할 공고 ID 리스트
+        
+        Returns:
+            Dict[str, Optional[str]]: {pblancId: content_hash} (해시가 아직 없으면 None)
+        """
+        if not pblanc_ids:
+            return {}
+        
+        try:
+            with DatabaseManager.get_db_cursor() as (cursor, connection):
+                cursor.execute(
+                    'SELECT pblancId AS "pblancId", content_hash FROM announcements WHERE pblancId = ANY(%s)',
+                    (list(set(pblanc_ids)),)
+                )
+                return {row['pblancId']: row['content_hash'] for row in cursor.fetchall()}
+        except Exception as e:
+            logger.error(f"기존 공고 해시 조회 오류: {e}")
+            return {}
+    
+    @staticmethod
+    def _announcement_values(data: Dict) -> tuple:
+        """공고 데이터를 INSERT 컬럼 순서의 값 튜플로 변환"""
+        return tuple(data.get(column) for column in ANNOUNCEMENT_COLUMNS)
+    
     @staticmethod
     def insert_announcement(data: Dict) -> bool:
         """
@@ -42,29 +131,12 @@ class AnnouncementModel:
         """
         try:
             with DatabaseManager.get_db_cursor() as (cursor, connection):
-                sql = """
-                INSERT INTO announcements (
-                    pblancId, pblancNm, jrsdInsttNm, excInsttNm, bsnsSumryCn, trgetNm,
-                    pblancUrl, rceptEngnHmpgUrl, flpthNm, printFlpthNm, printFileNm, fileNm,
-                    reqstBeginEndDe, reqstMthPapersCn, refrncNm, pldirSportRealmLclasCodeNm,
-                    pldirSportRealmMlsfcCodeNm, hashtags, totCnt, inqireCo, creatPnttm
-                ) VALUES (
-                    %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
-                )
+                sql = f"""
+                INSERT INTO announcements ({', '.join(ANNOUNCEMENT_COLUMNS)})
+                VALUES ({', '.join(['%s'] * len(ANNOUNCEMENT_COLUMNS))})
                 """
                 
-                values = (
-                    data.get('pblancId'), data.get('pblancNm'), data.get('jrsdInsttNm'),
-                    data.get('excInsttNm'), data.get('bsnsSumryCn'), data.get('trgetNm'),
-                    data.get('pblancUrl'), data.get('rceptEngnHmpgUrl'), data.get('flpthNm'),
-                    data.get('printFlpthNm'), data.get('printFileNm'), data.get('fileNm'),
-                    data.get('reqstBeginEndDe'), data.get('reqstMthPapersCn'), data.get('refrncNm'),
-                    data.get('pldirSportRealmLclasCodeNm'), data.get('pldirSportRealmMlsfcCodeNm'),
-                    data.get('hashtags'), data.get('totCnt'), data.get('inqireCo'),
-                    data.get('creatPnttm')
-                )
-                
-                cursor.execute(sql, values)
+                cursor.execute(sql, AnnouncementModel._announcement_values(data))
                 connection.commit()
                 return True
                 
@@ -73,58 +145,197 @@ class AnnouncementModel:
             return False
     
     @staticmethod
-    def bulk_insert_announcements(announcements: List[Dict]) -> int:
+    def _write_in_chunks(bulk_sql: str, single_sql: str, announcements: List[Dict],
+                         chunk_size: int) -> Tuple[List[Dict], List[Dict]]:
         """
-        여러 공고를 한 번에 삽입합니다.
+        다중 행 문장을 청크 단위로 실행하고, 청크가 실패하면 행 단위로 다시 시도합니다.
+        
+        연결이 끊기는 등 청크/행 단위로 복구할 수 없는 오류가 나면 아직 쓰지 못한 행을
+        모두 실패 행으로 돌려주므로, 호출하는 쪽에서 저장되지 않은 행을 중복/변경 없음으로 오인하지 않습니다.
         
-        Args:
-            announcements: 공고 데이터 리스트
-            
         Returns:
-            int: 성공적으로 삽입된 공고 수
+            Tuple[List[Dict], List[Dict]]: (RETURNING 행 리스트, 실패 행 [{'pblancId', 'error'}])
         """
-        success_count = 0
+        rows = []
+        failed = []
+        position = 0  # 처리가 끝난 행 수 (이 앞의 행은 저장되었거나 실패 행으로 기록됨)
         
         try:
             with DatabaseManager.get_db_cursor() as (cursor, connection):
-                sql = """
-                INSERT INTO announcements (
-                    pblancId, pblancNm, jrsdInsttNm, excInsttNm, bsnsSumryCn, trgetNm,
-                    pblancUrl, rceptEngnHmpgUrl, flpthNm, printFlpthNm, printFileNm, fileNm,
-                    reqstBeginEndDe, reqstMthPapersCn, refrncNm, pldirSportRealmLclasCodeNm,
-                    pldirSportRealmMlsfcCodeNm, hashtags, totCnt, inqireCo, creatPnttm
-                ) VALUES (
-                    %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
-                )
-                """
-                
-                for data in announcements:
+                for i in range(0, len(announcements), chunk_size):
+                    chunk = announcements[i:i + chunk_size]
+                    values = [AnnouncementModel._announcement_values(data) for data in chunk]
+                    
                     try:
-                        values = (
-                            data.get('pblancId'), data.get('pblancNm'), data.get('jrsdInsttNm'),
-                            data.get('excInsttNm'), data.get('bsnsSumryCn'), data.get('trgetNm'),
-                            data.get('pblancUrl'), data.get('rceptEngnHmpgUrl'), data.get('flpthNm'),
-                            data.get('printFlpthNm'), data.get('printFileNm'), data.get('fileNm'),
-                            data.get('reqstBeginEndDe'), data.get('reqstMthPapersCn'), data.get('refrncNm'),
-                            data.get('pldirSportRealmLclasCodeNm'), data.get('pldirSportRealmMlsfcCodeNm'),
-                            data.get('hashtags'), data.get('totCnt'), data.get('inqireCo'),
-                            data.get('creatPnttm')
-                        )
-                        
-                        cursor.execute(sql, values)
-                        success_count += 1
+                        rows.extend(psycopg2.extras.execute_values(
+                            cursor, bulk_sql, values, page_size=len(values), fetch=True
+                        ))
+                        position = i + len(chunk)
+                    
+                    except psycopg2.Error as e:
+                        # 청크 전체가 롤백되므로 행 단위로 다시 시도해 실패 행만 분리
+                        logger.warning(f"청크 삽입 실패, 행 단위로 재시도 ({len(chunk)}개): {e}")
+                        connection.rollback()
                         
-                    except Exception as e:
-                        logger.error(f"개별 공고 삽입 오류 (pblancId: {data.get('pblancId')}): {e}")
-                        continue
+                        for data, row_values in zip(chunk, values):
+                            try:
+                                cursor.execute(single_sql, row_values)
+                                row = cursor.fetchone()
+                                if row:
+                                    rows.append(row)
+                            except psycopg2.Error as row_error:
+                                if connection.closed:
+                                    raise
+                                connection.rollback()
+                                logger.error(f"개별 공고 삽입 오류 (pblancId: {data.get('pblancId')}): {row_error}")
+                                failed.append({
+                                    'pblancId': data.get('pblancId'),
+                                    'error': str(row_error).strip()
+                                })
+                            position += 1
                 
                 connection.commit()
-                
+        
         except Exception as e:
-            logger.error(f"배치 삽입 오류: {e}")
+            logger.error(f"배치 삽입 오류 ({len(announcements) - position}개 저장 실패): {e}")
+            error = str(e).strip() or type(e).__name__
+            failed.extend(
+                {'pblancId': data.get('pblancId'), 'error': error}
+                for data in announcements[position:]
+            )
         
-        logger.info(f"배치 삽입 완료 - 성공: {success_count}개 / 전체: {len(announcements)}개")
-        return success_count
+        return rows, failed
+    
+    @staticmethod
+    def bulk_insert_announcements(announcements: List[Dict], chunk_size: int = 500) -> Dict:
+        """
+        여러 공고를 다중 행 INSERT ... ON CONFLICT로 한 번에 삽입합니다.
+        
+        청크 단위 INSERT가 실패하면 해당 청크만 행 단위로 다시 시도하여
+        실패한 행을 식별하고, 나머지 행은 그대로 삽입합니다.
+        
+        Args:
+            announcements: 공고 데이터 리스트
+            chunk_size: 한 번의 INSERT 문에 담을 행 수
+            
+        Returns:
+            Dict: {
+                'inserted': 삽입된 행 [{'id', 'pblancId'}],
+                'duplicates': 이미 존재하여 건너뛴 pblancId 리스트,
+                'failed': 삽입 실패 행 [{'pblancId', 'error'}]
+            }
+        """
+        result = {'inserted': [], 'duplicates': [], 'failed': []}
+        
+        if not announcements:
+            return result
+        
+        columns = ', '.join(ANNOUNCEMENT_COLUMNS)
+        bulk_sql = f"""
+        INSERT INTO announcements ({columns})
+        VALUES %s
+        ON CONFLICT (pblancId) DO NOTHING
+        RETURNING id, pblancId AS "pblancId"
+        """
+        single_sql = f"""
+        INSERT INTO announcements ({columns})
+        VALUES ({', '.join(['%s'] * len(ANNOUNCEMENT_COLUMNS))})
+        ON CONFLICT (pblancId) DO NOTHING
+        RETURNING id, pblancId AS "pblancId"
+        """
+        
+        result['inserted'], result['failed'] = AnnouncementModel._write_in_chunks(
+            bulk_sql, single_sql, announcements, chunk_size
+        )
+        
+        inserted_ids = {row['pblancId'] for row in result['inserted']}
+        failed_ids = {row['pblancId'] for row in result['failed']}
+        attempted_ids = {data.get('pblancId') for data in announcements}
+        result['duplicates'] = sorted(
+            pblanc_id for pblanc_id in attempted_ids - inserted_ids - failed_ids if pblanc_id
+        )
+        
+        logger.info(f"배치 삽입 완료 - 성공: {len(result['inserted'])}개, "
+                   f"중복: {len(result['duplicates'])}개, 실패: {len(result['failed'])}개 "
+                   f"/ 전체: {len(announcements)}개")
+        return result
+    
+    @staticmethod
+    def upsert_announcements(announcements: List[Dict], chunk_size: int = 500) -> Dict:
+        """
+        새 공고는 삽입하고, 기존 공고는 content_hash가 달라진 경우에만 다시 씁니다.
+        
+        분류 필드의 해시(classification_hash)까지 달라졌으면 분류를 초기화해
+        다음 분류 단계에서 다시 분류되게 합니다 (수동 분류/검증된 공고는 유지).
+        
+        Args:
+            announcements: 공고 데이터 리스트 (content_hash, classification_hash 포함)
+            chunk_size: 한 번의 INSERT 문에 담을 행 수
+        
+        Returns:
+            Dict: {
+                'inserted': 삽입된 행 [{'id', 'pblancId'}],
+                'updated': 내용이 바뀌어 다시 쓴 행 [{'id', 'pblancId', 'pending'}],
+                'unchanged': 해시가 같아 건너뛴 pblancId 리스트,
+                'failed': 실패 행 [{'pblancId', 'error'}]
+            }
+        """
+        result = {'inserted': [], 'updated': [], 'unchanged': [], 'failed': []}
+        
+        if not announcements:
+            return result
+        
+        columns = ', '.join(ANNOUNCEMENT_COLUMNS)
+        assignments = ',\n            '.join(
+            f"{column} = EXCLUDED.{column}" for column in ANNOUNCEMENT_COLUMNS if column != 'pblancId'
+        )
+        conflict_sql = f"""
+        ON CONFLICT (pblancId) DO UPDATE SET
+            {assignments},
+            region_code = CASE WHEN {RECLASSIFY_CONDITION} THEN NULL
+                               ELSE announcements.region_code END,
+            classification_method = CASE WHEN {RECLASSIFY_CONDITION} THEN NULL
+                                         ELSE announcements.classification_method END,
+            classification_confidence = CASE WHEN {RECLASSIFY_CONDITION} THEN NULL
+                                             ELSE announcements.classification_confidence END,
+            classification_status = CASE WHEN {RECLASSIFY_CONDITION} THEN 'pending'
+                                         ELSE announcements.classification_status END,
+            updated_at = CURRENT_TIMESTAMP
+        WHERE announcements.content_hash IS DISTINCT FROM EXCLUDED.content_hash
+        RETURNING id, pblancId AS "pblancId", (xmax = 0) AS inserted,
+                  (region_code IS NULL AND classification_status = 'pending') AS pending
+        """
+        bulk_sql = f"""
+        INSERT INTO announcements ({columns})
+        VALUES %s
+        {conflict_sql}
+        """
+        single_sql = f"""
+        INSERT INTO announcements ({columns})
+        VALUES ({', '.join(['%s'] * len(ANNOUNCEMENT_COLUMNS))})
+        {conflict_sql}
+        """
+        
+        rows, result['failed'] = AnnouncementModel._write_in_chunks(
+            bulk_sql, single_sql, announcements, chunk_size
+        )
+        for row in rows:
+            if row['inserted']:
+                result['inserted'].append({'id': row['id'], 'pblancId': row['pblancId']})
+            else:
+                result['updated'].append({'id': row['id'], 'pblancId': row['pblancId'], 'pending': row['pending']})
+        
+        written_ids = {row['pblancId'] for row in rows}
+        failed_ids = {row['pblancId'] for row in result['failed']}
+        attempted_ids = {data.get('pblancId') for data in announcements}
+        result['unchanged'] = sorted(
+            pblanc_id for pblanc_id in attempted_ids - written_ids - failed_ids if pblanc_id
+        )
+        
+        logger.info(f"배치 저장 완료 - 삽입: {len(result['inserted'])}개, 변경: {len(result['updated'])}개, "
+                   f"변경 없음: {len(result['unchanged'])}개, 실패: {len(result['failed'])}개 "
+                   f"/ 전체: {len(announcements)}개")
+        return result
     
     @staticmethod
     def get_unclassified_announcements(limit: int = 50) -> List[Dict]:
@@ -139,13 +350,10 @@ class AnnouncementModel:
         """
         try:
             with DatabaseManager.get_db_cursor() as (cursor, connection):
-                sql = """
-                SELECT id, pblancId, pblancNm, jrsdInsttNm, excInsttNm, 
-                       bsnsSumryCn, hashtags, refrncNm
+                sql = f"""
+                SELECT {CLASSIFICATION_SELECT}
                 FROM announcements 
-                WHERE region_code IS NULL 
-                  AND is_active = true
-                  AND classification_status = 'pending'
+                WHERE {UNCLASSIFIED_WHERE}
                 ORDER BY created_at DESC
                 LIMIT %s
                 """
@@ -157,6 +365,165 @@ class AnnouncementModel:
             logger.error(f"미분류 공고 조회 오류: {e}")
             return []
     
+    @staticmethod
+    def count_unclassified(after_id: int = 0) -> int:
+        """id가 after_id보다 큰 미분류 공고 수"""
+        try:
+            with DatabaseManager.get_db_cursor() as (cursor, connection):
+                cursor.execute(f"""
+                SELECT COUNT(*) AS count
+                FROM announcements
+                WHERE {UNCLASSIFIED_WHERE}
+                  AND id > %s
+                """, (after_id,))
+                return cursor.fetchone()['count']
+        
+        except Exception as e:
+            logger.error(f"미분류 공고 수 조회 오류: {e}")
+            return 0
+    
+    @staticmethod
+    def iter_unclassified_chunks(chunk_size: int = 500, after_id: int = 0) -> Iterator[List[Dict]]:
+        """
+        미분류 공고 전체를 id 순으로 chunk_size개씩 내보냅니다.
+        
+        서버 측 커서로 읽으므로 백로그가 커도 클라이언트 메모리에는 한 묶음만 올라갑니다.
+        풀 연결은 autocommit이라 커서를 WITH HOLD로 열어 트랜잭션 없이 유지합니다.
+        
+        Args:
+            chunk_size: 한 번에 가져올 공고 수
+            after_id: 이 id 이후부터 조회 (체크포인트 재개용)
+        
+        Yields:
+            List[Dict]: 미분류 공고 묶음
+        
+        Raises:
+            Exception: 조회 실패 시 (호출자가 체크포인트에서 재개)
+        """
+        with DatabaseManager.get_db_connection() as connection:
+            cursor = connection.cursor(
+                name=f"unclassified_{id(connection)}_{after_id}",
+                cursor_factory=psycopg2.extras.RealDictCursor,
+                withhold=True
+            )
+            cursor.itersize = chunk_size
+            try:
+                cursor.execute(f"""
+                SELECT {CLASSIFICATION_SELECT}
+                FROM announcements
+                WHERE {UNCLASSIFIED_WHERE}
+                  AND id > %s
+                ORDER BY id
+                """, (after_id,))
+                
+                while True:
+                    rows = cursor.fetchmany(chunk_size)
+                    if not rows:
+                        break
+                    yield rows
+            finally:
+                if not cursor.closed:
+                    cursor.close()
+    
+    @staticmethod
+    def claim_unclassified(worker_id: str, limit: int = 100, lease_seconds: int = 900) -> List[Dict]:
+        """
+        임대되지 않은(또는 임대가 만료된) 미분류 공고를 최신순으로 limit개까지 임대합니다.
+        
+        FOR UPDATE SKIP LOCKED로 다른 워커가 동시에 고르는 행은 건너뛰므로
+        여러 워커가 같은 공고를 중복 분류하지 않습니다.
+        
+        Args:
+            worker_id: 임대하는 워커 ID
+            limit: 임대할 공고 수
+            lease_seconds: 임대 유지 시간(초), 이후에는 다른 워커가 다시 가져갈 수 있음
+        
+        Returns:
+            List[Dict]: 임대한 공고 리스트 (실패 시 빈 리스트)
+        """
+        try:
+            with DatabaseManager.get_db_cursor() as (cursor, connection):
+                cursor.execute(f"""
+                UPDATE announcements
+                SET claimed_by = %s,
+                    claim_expires_at = CURRENT_TIMESTAMP + make_interval(secs => %s)
+                WHERE id IN (
+                    SELECT id
+                    FROM announcements
+                    WHERE {UNCLASSIFIED_WHERE}
+                      AND (claim_expires_at IS NULL OR claim_expires_at < CURRENT_TIMESTAMP)
+                    ORDER BY created_at DESC
+                    LIMIT %s
+                    FOR UPDATE SKIP LOCKED
+                )
+                RETURNING {CLASSIFICATION_SELECT}
+                """, (worker_id, lease_seconds, limit))
+                return sorted(cursor.fetchall(), key=lambda row: row['id'], reverse=True)
+        
+        except Exception as e:
+            logger.error(f"미분류 공고 임대 오류 ({worker_id}): {e}")
+            return []
+    
+    @staticmethod
+    def claim_announcements(worker_id: str, announcement_ids: List[int],
+                            lease_seconds: int = 900) -> set:
+        """
+        지정한 미분류 공고 중 임대 가능한 것만 임대합니다 (일괄 분류 묶음용).
+        
+        Returns:
+            set: 임대에 성공한 공고 ID 집합 (실패 시 빈 집합)
+        """
+        if not announcement_ids:
+            return set()
+        
+        try:
+            with DatabaseManager.get_db_cursor() as (cursor, connection):
+                cursor.execute(f"""
+                UPDATE announcements
+                SET claimed_by = %s,
+                    claim_expires_at = CURRENT_TIMESTAMP + make_interval(secs => %s)
+                WHERE id IN (
+                    SELECT id
+                    FROM announcements
+                    WHERE id = ANY(%s)
+                      AND {UNCLASSIFIED_WHERE}
+                      AND (claim_expires_at IS NULL OR claim_expires_at < CURRENT_TIMESTAMP
+                           OR claimed_by = %s)
+                    FOR UPDATE SKIP LOCKED
+                )
+                RETURNING id
+                """, (worker_id, lease_seconds, list(announcement_ids), worker_id))
+                return {row['id'] for row in cursor.fetchall()}
+        
+        except Exception as e:
+            logger.error(f"공고 임대 오류 ({worker_id}, {len(announcement_ids)}개): {e}")
+            return set()
+    
+    @staticmethod
+    def release_claims(worker_id: str, announcement_ids: List[int]) -> int:
+        """
+        워커가 처리하지 못한 공고의 임대를 해제해 다른 워커가 바로 가져갈 수 있게 합니다.
+        
+        Returns:
+            int: 해제된 공고 수
+        """
+        if not announcement_ids:
+            return 0
+        
+        try:
+            with DatabaseManager.get_db_cursor() as (cursor, connection):
+                cursor.execute("""
+                UPDATE announcements
+                SET claimed_by = NULL, claim_expires_at = NULL
+                WHERE claimed_by = %s
+                  AND id = ANY(%s)
+                """, (worker_id, list(announcement_ids)))
+                return cursor.rowcount
+        
+        except Exception as e:
+            logger.error(f"공고 임대 해제 오류 ({worker_id}): {e}")
+            return 0
+    
     @staticmethod
     def update_classification(announcement_id: int, region_code: str, 
                             method: str, confidence: float = None) -> bool:
@@ -180,6 +547,8 @@ class AnnouncementModel:
                     classification_method = %s,
                     classification_confidence = %s,
                     classification_status = 'classified',
+                    claimed_by = NULL,
+                    claim_expires_at = NULL,
                     updated_at = CURRENT_TIMESTAMP
                 WHERE id = %s
                 """
@@ -192,6 +561,92 @@ class AnnouncementModel:
             logger.error(f"분류 결과 업데이트 오류 (ID: {announcement_id}): {e}")
             return False
     
+    @staticmethod
+    def bulk_update_classifications(classifications: List[Tuple[int, str, str, Optional[float]]],
+                                    page_size: int = 1000, claimed_by: str = None) -> set:
+        """
+        여러 공고의 지역 분류 결과를 하나의 트랜잭션으로 업데이트합니다.
+        
+        regions 테이블에 없는 지역 코드는 쓰지 않고 건너뛰며, 그래도 제약조건 위반이 나면
+        묶음을 반으로 나눠 다시 시도하므로 문제가 된 행만 빠지고 나머지는 저장됩니다.
+        
+        Args:
+            classifications: (공고 ID, 지역 코드, 분류 방법, 신뢰도) 튜플 리스트
+            page_size: UPDATE ... FROM (VALUES ...) 한 문장에 담을 행 수
+            claimed_by: 분류한 워커 ID (지정하면 다른 워커가 임대 중인 공고는 덮어쓰지 않음)
+            
+        Returns:
+            set: 실제로 업데이트된 공고 ID 집합 (실패 시 빈 집합)
+        """
+        if not classifications:
+            return set()
+        
+        try:
+            with DatabaseManager.get_db_cursor() as (cursor, connection):
+                cursor.execute(
+                    "SELECT code FROM regions WHERE code = ANY(%s)",
+                    (list({row[1] for row in classifications}),)
+                )
+                known_codes = {row['code'] for row in cursor.fetchall()}
+        
+        except Exception as e:
+            logger.error(f"지역 코드 조회 오류 ({len(classifications)}개): {e}")
+            return set()
+        
+        valid = []
+        for row in classifications:
+            if row[1] in known_codes:
+                valid.append((*row, claimed_by))
+            else:
+                logger.error(f"알 수 없는 지역 코드로 분류 결과를 저장하지 않음 (ID: {row[0]}, 코드: {row[1]})")
+        
+        updated_ids = AnnouncementModel._apply_classifications(valid, page_size)
+        logger.info(f"분류 결과 일괄 업데이트 완료 - {len(updated_ids)}개 / 요청: {len(classifications)}개")
+        return updated_ids
+    
+    @staticmethod
+    def _apply_classifications(values: List[tuple], page_size: int) -> set:
+        """분류 결과 묶음 저장 - 제약조건 위반이면 반씩 나눠 위반한 행만 제외"""
+        if not values:
+            return set()
+        
+        sql = """
+        UPDATE announcements AS a
+        SET region_code = v.region_code,
+            classification_method = v.method,
+            classification_confidence = v.confidence,
+            classification_status = 'classified',
+            claimed_by = NULL,
+            claim_expires_at = NULL,
+            updated_at = CURRENT_TIMESTAMP
+        FROM (VALUES %s) AS v(id, region_code, method, confidence, claimed_by)
+        WHERE a.id = v.id
+          AND (v.claimed_by IS NULL OR a.claimed_by IS NULL OR a.claimed_by = v.claimed_by)
+        RETURNING a.id
+        """
+        template = "(%s::integer, %s::varchar, %s::varchar, %s::numeric, %s::varchar)"
+        
+        try:
+            with DatabaseManager.get_db_transaction() as (cursor, connection):
+                rows = psycopg2.extras.execute_values(
+                    cursor, sql, values, template=template, page_size=page_size, fetch=True
+                )
+                return {row['id'] for row in rows}
+            
+        except (psycopg2.IntegrityError, psycopg2.DataError) as e:
+            if len(values) == 1:
+                logger.error(f"분류 결과 업데이트 오류 (ID: {values[0][0]}): {e}")
+                return set()
+            
+            middle = len(values) // 2
+            logger.warning(f"분류 결과 일괄 업데이트 제약조건 위반, 나눠서 재시도 ({len(values)}개): {e}")
+            return (AnnouncementModel._apply_classifications(values[:middle], page_size)
+                    | AnnouncementModel._apply_classifications(values[middle:], page_size))
+            
+        except Exception as e:
+            logger.error(f"분류 결과 일괄 업데이트 오류 ({len(values)}개): {e}")
+            return set()
+    
     @staticmethod
     def get_announcements_by_region(region_code: str = None, limit: int = 100) -> List[Dict]:
         """
@@ -204,77 +659,200 @@ class AnnouncementModel:
         Returns:
             List[Dict]: 공고 리스트
         """
+        return AnnouncementModel.get_announcements_by_regions(
+            [region_code] if region_code else None, limit
+        )
+    
+    @staticmethod
+    def encode_cursor(announcement: Dict) -> str:
+        """
+        공고 행의 (created_at, id)를 불투명한 페이지 커서 문자열로 변환합니다.
+        
+        Args:
+            announcement: created_at, id를 포함한 공고 행
+            
+        Returns:
+            str: URL-safe base64 커서
+        """
+        payload = json.dumps([announcement['created_at'].isoformat(), announcement['id']])
+        return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+    
+    @staticmethod
+    def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+        """
+        페이지 커서를 (created_at, id)로 복원합니다.
+        
+        Raises:
+            ValueError: 올바르지 않은 커서인 경우
+        """
         try:
-            with DatabaseManager.get_db_cursor() as (cursor, connection):
-                if region_code:
-                    sql = """
-                    SELECT a.*, r.name as region_name
-                    FROM announcements a
-                    LEFT JOIN regions r ON a.region_code = r.code
-                    WHERE a.region_code = %s AND a.is_active = true
-                    ORDER BY a.created_at DESC
-                    LIMIT %s
-                    """
-                    cursor.execute(sql, (region_code, limit))
-                else:
-                    sql = """
-                    SELECT a.*, r.name as region_name
-                    FROM announcements a
-                    LEFT JOIN regions r ON a.region_code = r.code
-                    WHERE a.is_active = true
-                    ORDER BY a.created_at DESC
-                    LIMIT %s
-                    """
-                    cursor.execute(sql, (limit,))
-                
-                return cursor.fetchall()
-                
-        except Exception as e:
-            logger.error(f"지역별 공고 조회 오류 (region_code: {region_code}): {e}")
-            return []
+            padded = cursor + '=' * (-len(cursor) % 4)
+            created_at, announcement_id = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+            return datetime.fromisoformat(created_at), int(announcement_id)
+        except Exception:
+            raise ValueError(f"올바르지 않은 페이지 커서입니다: {cursor}")
     
     @staticmethod
-    def get_announcements_by_regions(region_codes: List[str] = None, limit: int = 100) -> List[Dict]:
+    def get_announcements_by_regions(region_codes: List[str] = None, limit: int = 100,
+                                     cursor: str = None, status: str = None) -> List[Dict]:
         """
-        여러 지역의 공고를 조회합니다.
+        여러 지역의 공고를 (created_at, id) 역순 키셋 페이지로 조회합니다.
+        
+        결과는 프로세스 내 LRU/TTL 캐시에 (정렬된 지역 집합, limit, cursor, status,
+        데이터 버전) 키로 보관되며, 수집 완료나 수동 분류 시 invalidate_cache()로 비워집니다.
         
         Args:
             region_codes: 지역 코드 리스트 (None이면 전체)
             limit: 가져올 공고 수 제한
+            cursor: 이전 페이지 마지막 행의 커서 (None이면 첫 페이지)
+            status: 분류 상태 필터 (pending, classified, verified)
             
         Returns:
             List[Dict]: 공고 리스트
+            
+        Raises:
+            ValueError: 올바르지 않은 커서인 경우
+        """
+        cursor_position = AnnouncementModel.decode_cursor(cursor) if cursor else None
+        # 데이터 버전을 키에 포함해 다른 프로세스의 쓰기도 반영
+        cache_key = (tuple(sorted(set(region_codes or []))), limit, cursor_position, status,
+                     AnnouncementModel.get_data_version())
+        
+        try:
+            return announcement_cache.get_or_load(
+                cache_key,
+                lambda: AnnouncementModel._query_announcements_by_regions(
+                    cache_key[0], limit, cursor_position, status
+                )
+            )
+        except Exception as e:
+            logger.error(f"여러 지역 공고 조회 오류 (region_codes: {region_codes}): {e}")
+            return []
+    
+    @staticmethod
+    def _query_announcements_by_regions(region_codes: Tuple[str, ...], limit: int,
+                                        cursor_position: Optional[Tuple[datetime, int]],
+                                        status: Optional[str]) -> List[Dict]:
+        """get_announcements_by_regions의 실제 DB 조회 (오류는 호출자에게 전파)"""
+        conditions = ["a.is_active = true"]
+        params = []
+        
+        if region_codes:
+            conditions.append("a.region_code = ANY(%s)")
+            params.append(list(region_codes))
+        
+        if status:
+            conditions.append("a.classification_status = %s")
+            params.append(status)
+        
+        if cursor_position:
+            # 이전 페이지 마지막 행 이후부터 - 페이지 깊이와 관계없이 인덱스 범위 스캔
+            conditions.append("(a.created_at, a.id) < (%s, %s)")
+            params.extend(cursor_position)
+        
+        with DatabaseManager.get_db_cursor() as (db_cursor, connection):
+            sql = f"""
+            SELECT a.*, r.name as region_name
+            FROM announcements a
+            LEFT JOIN regions r ON a.region_code = r.code
+            WHERE {' AND '.join(conditions)}
+            ORDER BY a.created_at DESC, a.id DESC
+            LIMIT %s
+            """
+            db_cursor.execute(sql, params + [limit])
+            return db_cursor.fetchall()
+    
+    @staticmethod
+    def get_data_version() -> Optional[int]:
+        """
+        공고 데이터 버전을 반환합니다.
+        
+        announcements가 변경될 때마다 트리거가 올리는 값이며, DATA_VERSION_TTL초 동안
+        프로세스 내에 캐시됩니다. 조회에 실패하면 None을 반환합니다.
+        """
+        def load_version():
+            with DatabaseManager.get_db_cursor() as (cursor, connection):
+                cursor.execute("SELECT version FROM data_versions WHERE name = 'announcements'")
+                row = cursor.fetchone()
+                return row['version'] if row else 0
+        
+        try:
+            return data_version_cache.get_or_load('announcements', load_version)
+        except Exception as e:
+            logger.error(f"데이터 버전 조회 오류: {e}")
+            return None
+    
+    @staticmethod
+    def invalidate_cache() -> None:
+        """공고 조회 캐시와 데이터 버전 캐시를 비웁니다 (수집 완료, 분류 변경 시 호출)"""
+        data_version_cache.invalidate()
+        announcement_cache.invalidate()
+    
+    @staticmethod
+    def get_cache_stats() -> Dict:
+        """공고 조회 캐시 통계 (hit/miss/eviction 등)"""
+        return announcement_cache.get_stats()
+    
+    @staticmethod
+    def get_announcements_page(region_codes: List[str] = None, limit: int = 50,
+                               cursor: str = None, status: str = None) -> Dict:
+        """
+        공고 한 페이지와 다음 페이지 커서를 반환합니다.
+        
+        Args:
+            region_codes: 지역 코드 리스트 (None이면 전체)
+            limit: 페이지 크기
+            cursor: 이전 응답의 next_cursor (None이면 첫 페이지)
+            status: 분류 상태 필터
+            
+        Returns:
+            Dict: {'announcements': 공고 리스트, 'next_cursor': 다음 페이지 커서 또는 None}
+            
+        Raises:
+            ValueError: 올바르지 않은 커서인 경우
+        """
+        # 한 행을 더 조회해 다음 페이지 존재 여부 확인
+        rows = AnnouncementModel.get_announcements_by_regions(region_codes, limit + 1, cursor, status)
+        announcements = rows[:limit]
+        next_cursor = None
+        
+        if len(rows) > limit and announcements:
+            next_cursor = AnnouncementModel.encode_cursor(announcements[-1])
+        
+        return {
+            'announcements': announcements,
+            'next_cursor': next_cursor
+        }
+    
+    @staticmethod
+    def get_training_samples(min_ai_confidence: float = 0.8) -> List[Dict]:
+        """
+        로컬 분류기 학습용 공고를 가져옵니다.
+        
+        수동 분류 결과 전체와 신뢰도가 min_ai_confidence 이상인 AI 분류 결과를 사용합니다.
+        
+        Args:
+            min_ai_confidence: 포함할 AI 분류 결과의 최소 신뢰도
+            
+        Returns:
+            List[Dict]: 공고 ID/공고명/기관명/사업개요와 region_code 리스트 (실패 시 빈 리스트)
         """
         try:
             with DatabaseManager.get_db_cursor() as (cursor, connection):
-                if region_codes and len(region_codes) > 0:
-                    # 여러 지역 조회
-                    placeholders = ','.join(['%s'] * len(region_codes))
-                    sql = f"""
-                    SELECT a.*, r.name as region_name
-                    FROM announcements a
-                    LEFT JOIN regions r ON a.region_code = r.code
-                    WHERE a.region_code IN ({placeholders}) AND a.is_active = true
-                    ORDER BY a.created_at DESC
-                    LIMIT %s
-                    """
-                    cursor.execute(sql, region_codes + [limit])
-                else:
-                    # 전체 조회
-                    sql = """
-                    SELECT a.*, r.name as region_name
-                    FROM announcements a
-                    LEFT JOIN regions r ON a.region_code = r.code
-                    WHERE a.is_active = true
-                    ORDER BY a.created_at DESC
-                    LIMIT %s
-                    """
-                    cursor.execute(sql, (limit,))
-                
+                cursor.execute("""
+                SELECT pblancId AS "pblancId", pblancNm AS "pblancNm", jrsdInsttNm AS "jrsdInsttNm",
+                       excInsttNm AS "excInsttNm", bsnsSumryCn AS "bsnsSumryCn",
+                       region_code, classification_method
+                FROM announcements
+                WHERE region_code IS NOT NULL
+                  AND (classification_method = 'manual'
+                       OR (classification_method = 'ai' AND classification_confidence >= %s))
+                ORDER BY id
+                """, (min_ai_confidence,))
                 return cursor.fetchall()
                 
         except Exception as e:
-            logger.error(f"여러 지역 공고 조회 오류 (region_codes: {region_codes}): {e}")
+            logger.error(f"학습 데이터 조회 오류: {e}")
             return []
     
     @staticmethod
@@ -282,6 +860,9 @@ class AnnouncementModel:
         """
         분류 통계를 가져옵니다.
         
+        announcements 전체를 집계하지 않고 트리거로 유지되는
+        announcement_stats_counters를 읽으므로 비용이 지역 수에 비례합니다.
+        
         Returns:
             Dict: 분류 통계 정보
         """
@@ -290,20 +871,19 @@ class AnnouncementModel:
                 # 전체 통계
                 cursor.execute("""
                 SELECT 
-                    COUNT(*) as total,
-                    SUM(CASE WHEN region_code IS NOT NULL THEN 1 ELSE 0 END) as classified,
-                    SUM(CASE WHEN region_code IS NULL THEN 1 ELSE 0 END) as unclassified
-                FROM announcements 
-                WHERE is_active = true
+                    COALESCE(SUM(count), 0)::bigint as total,
+                    COALESCE(SUM(CASE WHEN region_code <> '' THEN count ELSE 0 END), 0)::bigint as classified,
+                    COALESCE(SUM(CASE WHEN region_code = '' THEN count ELSE 0 END), 0)::bigint as unclassified
+                FROM announcement_stats_counters
                 """)
                 
                 total_stats = cursor.fetchone()
                 
                 # 지역별 통계
                 cursor.execute("""
-                SELECT r.name, r.code, COUNT(a.id) as count
+                SELECT r.name, r.code, COALESCE(SUM(c.count), 0)::bigint as count
                 FROM regions r
-                LEFT JOIN announcements a ON r.code = a.region_code AND a.is_active = true
+                LEFT JOIN announcement_stats_counters c ON r.code = c.region_code
                 GROUP BY r.code, r.name
                 ORDER BY count DESC
                 """)
@@ -312,10 +892,12 @@ class AnnouncementModel:
                 
                 # 분류 방법별 통계
                 cursor.execute("""
-                SELECT classification_method, COUNT(*) as count
-                FROM announcements 
-                WHERE region_code IS NOT NULL AND is_active = true
+                SELECT NULLIF(classification_method, '') as classification_method,
+                       SUM(count)::bigint as count
+                FROM announcement_stats_counters
+                WHERE region_code <> ''
                 GROUP BY classification_method
+                HAVING SUM(count) > 0
                 """)
                 
                 method_stats = cursor.fetchall()
@@ -328,4 +910,72 @@ class AnnouncementModel:
                 
         except Exception as e:
             logger.error(f"분류 통계 조회 오류: {e}")
-            return {}
\ No newline at end of file
+            return {}
+    
+    @staticmethod
+    def reconcile_classification_stats() -> Dict:
+        """
+        분류 통계 카운터를 announcements 전체 집계로 다시 계산하고 차이를 보고합니다.
+        
+        차이가 있으면 카운터를 재계산 값으로 교체합니다. 재계산 중에는
+        announcements 쓰기를 잠시 막아 트리거 반영분과 겹치지 않도록 합니다.
+        
+        Returns:
+            Dict: {'checked_at', 'drift': [{'region_code', 'classification_method',
+                   'counter', 'actual'}], 'repaired': bool}
+        """
+        result = {
+            'checked_at': datetime.now(),
+            'drift': [],
+            'repaired': False
+        }
+        
+        try:
+            with DatabaseManager.get_db_transaction() as (cursor, connection):
+                cursor.execute("LOCK TABLE announcements IN SHARE MODE")
+                
+                cursor.execute("""
+                SELECT COALESCE(actual.region_code, counter.region_code) as region_code,
+                       COALESCE(actual.classification_method, counter.classification_method) as classification_method,
+                       COALESCE(counter.count, 0) as counter,
+                       COALESCE(actual.count, 0) as actual
+                FROM (
+                    SELECT COALESCE(region_code, '') as region_code,
+                           COALESCE(classification_method, '') as classification_method,
+                           COUNT(*) as count
+                    FROM announcements
+                    WHERE is_active = true
+                    GROUP BY 1, 2
+                ) actual
+                FULL OUTER JOIN announcement_stats_counters counter
+                  ON counter.region_code = actual.region_code
+                 AND counter.classification_method = actual.classification_method
+                WHERE COALESCE(counter.count, 0) <> COALESCE(actual.count, 0)
+                """)
+                
+                result['drift'] = cursor.fetchall()
+                
+                if result['drift']:
+                    cursor.execute("DELETE FROM announcement_stats_counters")
+                    cursor.execute("""
+                    INSERT INTO announcement_stats_counters (region_code, classification_method, count)
+                    SELECT COALESCE(region_code, ''), COALESCE(classification_method, ''), COUNT(*)
+                    FROM announcements
+                    WHERE is_active = true
+                    GROUP BY 1, 2
+                    """)
+                    result['repaired'] = True
+            
+            if result['drift']:
+                logger.warning(f"분류 통계 카운터 불일치 {len(result['drift'])}건 발견 - 재계산 완료")
+                for drift in result['drift']:
+                    logger.warning(f"  - {drift['region_code'] or '미분류'}/{drift['classification_method'] or '-'}: "
+                                 f"카운터 {drift['counter']}, 실제 {drift['actual']}")
+            else:
+                logger.info("분류 통계 카운터 일치 확인")
+            
+        except Exception as e:
+            logger.error(f"분류 통계 재계산 오류: {e}")
+            result['error'] = str(e)
+        
+        return result
@@ -0,0 +1,79 @@
+"""
+작업 체크포인트 모델
+"""
+
+from typing import Dict, Optional
+from config.database import DatabaseManager
+import logging
+
+logger = logging.getLogger(__name__)
+
+class ClassificationCheckpointModel:
+    """job_checkpoints 테이블 모델 (일괄 분류 재개 지점)"""
+    
+    @staticmethod
+    def get(name: str) -> Optional[Dict]:
+        """
+        체크포인트를 가져옵니다.
+        
+        Args:
+            name: 체크포인트 이름
+        
+        Returns:
+            Optional[Dict]: {'name', 'last_id', 'processed', 'started_at', 'updated_at', 'finished_at'}
+                - 없거나 조회 실패 시 None (처음부터 처리)
+        """
+        try:
+            with DatabaseManager.get_db_cursor() as (cursor, connection):
+                cursor.execute("""
+                SELECT name, last_id, processed, started_at, updated_at, finished_at
+                FROM job_checkpoints
+                WHERE name = %s
+                """, (name,))
+                return cursor.fetchone()
+        
+        except Exception as e:
+            logger.error(f"체크포인트 조회 오류 ({name}): {e}")
+            return None
+    
+    @staticmethod
+    def save(name: str, last_id: int, processed: int = 0,
+             started: bool = False, finished: bool = False) -> bool:
+        """
+        체크포인트를 저장합니다.
+        
+        Args:
+            name: 체크포인트 이름
+            last_id: 여기까지(포함) 처리가 끝난 공고 id
+            processed: 이번에 추가로 처리한 공고 수 (누적됨)
+            started: 새 실행 시작 여부 (누적 건수와 시작 시각 초기화)
+            finished: 백로그를 끝까지 처리했는지 여부
+        
+        Returns:
+            bool: 저장 성공 여부
+        """
+        try:
+            with DatabaseManager.get_db_cursor() as (cursor, connection):
+                cursor.execute("""
+                INSERT INTO job_checkpoints (name, last_id, processed)
+                VALUES (%(name)s, %(last_id)s, %(processed)s)
+                ON CONFLICT (name) DO UPDATE SET
+                    last_id = EXCLUDED.last_id,
+                    processed = CASE WHEN %(started)s THEN EXCLUDED.processed
+                                     ELSE job_checkpoints.processed + EXCLUDED.processed END,
+                    started_at = CASE WHEN %(started)s THEN CURRENT_TIMESTAMP
+                                      ELSE job_checkpoints.started_at END,
+                    updated_at = CURRENT_TIMESTAMP,
+                    finished_at = CASE WHEN %(finished)s THEN CURRENT_TIMESTAMP END
+                """, {
+                    'name': name,
+                    'last_id': last_id,
+                    'processed': processed,
+                    'started': started,
+                    'finished': finished
+                })
+                return True
+        
+        except Exception as e:
+            logger.error(f"체크포인트 저장 오류 ({name}): {e}")
+            return False
@@ -0,0 +1,62 @@
+"""
+증분 수집 기준점 모델
+"""
+
+from datetime import datetime
+from typing import Optional, Tuple
+from config.database import DatabaseManager
+import logging
+
+logger = logging.getLogger(__name__)
+
+class IngestionWatermarkModel:
+    """ingestion_watermarks 테이블 모델 (수집 대상별 (등록일시, 공고 ID) 기준점)"""
+    
+    @staticmethod
+    def get(source: str) -> Optional[Tuple[datetime, str]]:
+        """
+        수집 기준점을 가져옵니다.
+        
+        Args:
+            source: 수집 대상 이름 (예: 'bizinfo:경남')
+        
+        Returns:
+            Optional[Tuple[datetime, str]]: (등록일시, 공고 ID), 없으면 None
+        
+        Raises:
+            Exception: 조회 실패 시 (기준점 없이 수집하면 고정 개수만 가져오므로 호출자가 판단)
+        """
+        with DatabaseManager.get_db_cursor() as (cursor, connection):
+            cursor.execute("""
+            SELECT last_created_at, last_pblanc_id
+            FROM ingestion_watermarks
+            WHERE source = %s
+            """, (source,))
+            row = cursor.fetchone()
+            return (row['last_created_at'], row['last_pblanc_id']) if row else None
+    
+    @staticmethod
+    def save(source: str, created_at: datetime, pblanc_id: str) -> bool:
+        """
+        수집 기준점을 앞으로 옮깁니다 (기존 기준점보다 이전이면 무시).
+        
+        Returns:
+            bool: 저장 성공 여부
+        """
+        try:
+            with DatabaseManager.get_db_cursor() as (cursor, connection):
+                cursor.execute("""
+                INSERT INTO ingestion_watermarks (source, last_created_at, last_pblanc_id)
+                VALUES (%s, %s, %s)
+                ON CONFLICT (source) DO UPDATE SET
+                    last_created_at = EXCLUDED.last_created_at,
+                    last_pblanc_id = EXCLUDED.last_pblanc_id,
+                    updated_at = CURRENT_TIMESTAMP
+                WHERE (ingestion_watermarks.last_created_at, ingestion_watermarks.last_pblanc_id)
+                    < (EXCLUDED.last_created_at, EXCLUDED.last_pblanc_id)
+                """, (source, created_at, pblanc_id))
+                return True
+        
+        except Exception as e:
+            logger.error(f"수집 기준점 저장 오류 ({source}): {e}")
+            return False
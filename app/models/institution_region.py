@@ -0,0 +1,42 @@
+"""
+기관 → 지역 통계 모델
+"""
+
+from datetime import datetime
+from typing import List, Dict, Optional
+from config.database import DatabaseManager
+import logging
+
+logger = logging.getLogger(__name__)
+
+class InstitutionRegionModel:
+    """institution_region_stats 테이블 모델 (announcements 트리거가 갱신)"""
+    
+    @staticmethod
+    def get_stats(updated_since: Optional[datetime] = None) -> List[Dict]:
+        """
+        기관별 지역 support 수를 가져옵니다.
+        
+        Args:
+            updated_since: 이 시각 이후 갱신된 행만 조회 (None이면 전체)
+            
+        Returns:
+            List[Dict]: [{'institution', 'region_code', 'support', 'updated_at'}]
+            
+        Raises:
+            Exception: 조회 실패 시 (호출자가 기존 인덱스를 유지)
+        """
+        with DatabaseManager.get_db_cursor() as (cursor, connection):
+            if updated_since is None:
+                cursor.execute("""
+                SELECT institution, region_code, support, updated_at
+                FROM institution_region_stats
+                WHERE support > 0
+                """)
+            else:
+                cursor.execute("""
+                SELECT institution, region_code, support, updated_at
+                FROM institution_region_stats
+                WHERE updated_at > %s
+                """, (updated_since,))
+            return cursor.fetchall()
@@ -0,0 +1,31 @@
+"""
+지역 데이터 모델
+"""
+
+from typing import List, Dict
+from config.database import DatabaseManager
+import logging
+
+logger = logging.getLogger(__name__)
+
+class RegionModel:
+    """지역 데이터베이스 모델"""
+    
+    @staticmethod
+    def get_all_regions() -> List[Dict]:
+        """
+        regions 테이블의 전체 지역을 계층 정보와 함께 가져옵니다.
+        
+        Returns:
+            List[Dict]: [{'code', 'name', 'type', 'parent_code', 'aliases'}] (id 순)
+            
+        Raises:
+            Exception: 조회 실패 시 (호출자가 기본 카탈로그로 대체)
+        """
+        with DatabaseManager.get_db_cursor() as (cursor, connection):
+            cursor.execute("""
+            SELECT code, name, type, parent_code, COALESCE(aliases, '{}') as aliases
+            FROM regions
+            ORDER BY id
+            """)
+            return cursor.fetchall()
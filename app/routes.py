@@ -3,14 +3,19 @@ Flask 라우트 정의
 """
 
 import os
-from flask import render_template, request, jsonify, session, redirect, url_for, flash
+import json
+import hashlib
+from flask import Response, render_template, request, jsonify, session, redirect, url_for, flash
 from werkzeug.security import check_password_hash
 from datetime import datetime
 import logging
 
 from .models.announcement import AnnouncementModel
 from .services.data_collector import DataCollectionService
-from config.database import test_database_connection
+from .services.gyeongnam_region_service import gyeongnam_region_service
+from .services.collection_progress import progress_tracker
+from .services.institution_index import institution_region_index
+from config.database import DatabaseManager, test_database_connection
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
@@ -26,6 +31,43 @@ def login_required(f):
         return f(*args, **kwargs)
     return decorated_function
 
+def _json_default(value):
+    """진행상황 JSON 직렬화 (datetime 등)"""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+def make_data_etag(prefix, *parts):
+    """
+    데이터 버전 기반 강한 ETag 값 생성
+    
+    데이터 버전을 알 수 없으면 None을 반환하여 조건부 응답을 생략합니다.
+    """
+    data_version = AnnouncementModel.get_data_version()
+    if data_version is None:
+        return None
+    
+    digest = hashlib.sha1(repr(parts).encode('utf-8')).hexdigest()[:16]
+    return f"{prefix}-{data_version}-{digest}"
+
+def conditional_json(etag, build_payload):
+    """
+    If-None-Match가 ETag와 일치하면 build_payload를 호출하지 않고 304를 반환합니다.
+    
+    Args:
+        etag: make_data_etag로 만든 ETag 값 (None이면 항상 전체 응답)
+        build_payload: 응답 JSON dict를 만드는 함수 (DB 조회 포함)
+    """
+    if etag and request.if_none_match.contains(etag):
+        response = Response(status=304)
+    else:
+        response = jsonify(build_payload())
+    
+    if etag:
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = 'no-cache'
+    return response
+
 def register_routes(app):
     """라우트 등록"""
     
@@ -79,15 +121,27 @@ def register_routes(app):
                 if region_code:
                     region_codes = [region_code]
             
-            limit = int(request.args.get('limit', 50))
+            limit = min(max(int(request.args.get('limit', 50)), 1), 200)
+            cursor = request.args.get('cursor') or None
+            
+            def build_payload():
+                page = AnnouncementModel.get_announcements_page(region_codes, limit, cursor)
+                announcements = page['announcements']
+                return {
+                    'success': True,
+                    'data': announcements,
+                    'count': len(announcements),
+                    'next_cursor': page['next_cursor']
+                }
             
-            announcements = AnnouncementModel.get_announcements_by_regions(region_codes, limit)
+            etag = make_data_etag('announcements', sorted(set(region_codes)), limit, cursor)
+            return conditional_json(etag, build_payload)
             
+        except ValueError as e:
             return jsonify({
-                'success': True,
-                'data': announcements,
-                'count': len(announcements)
-            })
+                'success': False,
+                'error': str(e)
+            }), 400
             
         except Exception as e:
             logger.error(f"공고 조회 API 오류: {e}")
@@ -118,23 +172,29 @@ def register_routes(app):
     def admin_announcements():
         """관리자 - 공고 목록"""
         try:
-            page = int(request.args.get('page', 1))
-            region_filter = request.args.get('region', None)
-            status_filter = request.args.get('status', None)
+            cursor = request.args.get('cursor') or None
+            region_filter = request.args.get('region') or None
+            status_filter = request.args.get('status') or None
             
-            # TODO: 페이징 처리 및 필터링 구현
-            announcements = AnnouncementModel.get_announcements_by_region(region_filter, 50)
+            page = AnnouncementModel.get_announcements_page(
+                [region_filter] if region_filter else None,
+                50,
+                cursor,
+                status_filter
+            )
             
             return render_template('admin/announcements.html', 
-                                 announcements=announcements,
-                                 current_page=page,
+                                 announcements=page['announcements'],
+                                 next_cursor=page['next_cursor'],
+                                 is_first_page=cursor is None,
+                                 regions=gyeongnam_region_service.get_all_regions(),
                                  region_filter=region_filter,
                                  status_filter=status_filter)
             
         except Exception as e:
             logger.error(f"관리자 공고 목록 오류: {e}")
             flash(f'공고 목록 조회 오류: {e}', 'error')
-            return render_template('admin/announcements.html', announcements=[])
+            return render_template('admin/announcements.html', announcements=[], is_first_page=True)
 
     @app.route('/admin/classify', methods=['POST'])
     @login_required
@@ -156,6 +216,7 @@ def register_routes(app):
             )
             
             if success:
+                AnnouncementModel.invalidate_cache()
                 return jsonify({
                     'success': True,
                     'message': '분류가 업데이트되었습니다.'
@@ -186,13 +247,15 @@ def register_routes(app):
             # 고유한 작업 ID 생성
             job_id = str(uuid.uuid4())
             
+            # 스레드 시작 전에 작업을 등록해 진행상황 스트림이 바로 구독할 수 있도록 함
+            progress_tracker.start_collection(job_id)
+            
             # 별도 스레드에서 데이터 수집 실행
             def run_collection():
                 try:
                     data_service = DataCollectionService()
                     data_service.collect_and_process_data(search_cnt, job_id)
                 except Exception as e:
-                    from .services.collection_progress import progress_tracker
                     progress_tracker.fail_collection(job_id, str(e))
             
             thread = threading.Thread(target=run_collection)
@@ -217,7 +280,6 @@ def register_routes(app):
     def admin_collect_progress(job_id):
         """데이터 수집 진행상황 조회"""
         try:
-            from .services.collection_progress import progress_tracker
             progress = progress_tracker.get_progress(job_id)
             
             if not progress:
@@ -238,6 +300,64 @@ def register_routes(app):
                 'error': str(e)
             }), 500
 
+    @app.route('/admin/collect/stream/<job_id>')
+    @login_required
+    def admin_collect_stream(job_id):
+        """데이터 수집 진행상황 스트림 (Server-Sent Events)"""
+        if progress_tracker.get_progress(job_id) is None:
+            return jsonify({
+                'success': False,
+                'error': '해당 작업을 찾을 수 없습니다.'
+            }), 404
+        
+        def generate():
+            version = 0
+            while True:
+                version, progress = progress_tracker.wait_for_update(
+                    job_id, version, timeout=15
+                )
+                
+                if version < 0:
+                    # 작업이 정리됨
+                    yield "event: end\ndata: {}\n\n"
+                    return
+                
+                if progress is None:
+                    # 프록시가 연결을 끊지 않도록 주기적으로 주석 전송
+                    yield ": keep-alive\n\n"
+                    continue
+                
+                data = json.dumps(progress, default=_json_default, ensure_ascii=False)
+                yield f"id: {version}\nevent: progress\ndata: {data}\n\n"
+                
+                if progress['status'] in ('completed', 'failed'):
+                    yield "event: end\ndata: {}\n\n"
+                    return
+        
+        return Response(generate(), mimetype='text/event-stream', headers={
+            'Cache-Control': 'no-cache',
+            'X-Accel-Buffering': 'no'
+        })
+
+    @app.route('/admin/institutions/conflicts')
+    @login_required
+    def admin_institution_conflicts():
+        """여러 지역으로 분류된 기관 목록 (기관 인덱스에서 제외된 기관)"""
+        try:
+            limit = min(max(request.args.get('limit', 50, type=int), 1), 500)
+            return jsonify({
+                'success': True,
+                'stats': institution_region_index.get_stats(),
+                'conflicts': institution_region_index.get_conflicts(limit)
+            })
+            
+        except Exception as e:
+            logger.error(f"기관 충돌 목록 조회 오류: {e}")
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 500
+    
     # ===== 헬스체크 및 API =====
     
     @app.route('/health')
@@ -250,6 +370,9 @@ def register_routes(app):
             return jsonify({
                 'status': 'healthy' if db_status else 'unhealthy',
                 'database': 'connected' if db_status else 'disconnected',
+                'database_pool': DatabaseManager.get_pool_stats(),
+                'announcement_cache': AnnouncementModel.get_cache_stats(),
+                'institution_index': institution_region_index.get_stats(),
                 'timestamp': datetime.now().isoformat()
             })
             
@@ -264,11 +387,13 @@ def register_routes(app):
     def api_stats():
         """통계 API"""
         try:
-            stats = AnnouncementModel.get_classification_stats()
-            return jsonify({
-                'success': True,
-                'data': stats
-            })
+            def build_payload():
+                return {
+                    'success': True,
+                    'data': AnnouncementModel.get_classification_stats()
+                }
+            
+            return conditional_json(make_data_etag('stats'), build_payload)
             
         except Exception as e:
             logger.error(f"통계 조회 API 오류: {e}")
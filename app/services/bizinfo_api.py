@@ -3,32 +3,127 @@
 """
 
 import requests
+import re
 import json
 import time
+import codecs
+import hashlib
+import threading
 from datetime import datetime
-from typing import List, Dict, Optional
-from urllib.parse import urlencode
+from typing import Callable, Iterable, Iterator, List, Dict, Optional, Tuple
+from urllib.parse import urlencode, urlparse
+from requests.adapters import HTTPAdapter
 import logging
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 변경 감지 대상 원본 필드 (조회수 inqireCo, 전체 건수 totCnt는 내용과 무관하게 바뀌므로 제외)
+CONTENT_FIELDS = (
+    'pblancId', 'pblancNm', 'jrsdInsttNm', 'excInsttNm', 'bsnsSumryCn', 'trgetNm',
+    'pblancUrl', 'rceptEngnHmpgUrl', 'flpthNm', 'printFlpthNm', 'printFileNm', 'fileNm',
+    'reqstBeginEndDe', 'reqstMthPapersCn', 'refrncNm', 'pldirSportRealmLclasCodeNm',
+    'pldirSportRealmMlsfcCodeNm', 'hashtags', 'creatPnttm'
+)
+
+# 지역 분류에 쓰이는 필드 - 이 필드가 바뀐 경우에만 다시 분류
+CLASSIFICATION_FIELDS = ('pblancNm', 'jrsdInsttNm', 'excInsttNm', 'bsnsSumryCn', 'hashtags', 'refrncNm')
+
+# 공고 ID 리스트 -> 저장된 {pblancId: content_hash} 조회 함수 (AnnouncementModel.get_content_hashes)
+StoredHashes = Optional[Callable[[List[str]], Dict[str, Optional[str]]]]
+
+def fields_hash(data: Dict, fields: Tuple[str, ...]) -> str:
+    """지정한 필드 값들의 SHA-256 (필드 순서 고정, 없는 값은 빈 문자열)"""
+    payload = json.dumps([data.get(field) or '' for field in fields], ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+def iter_json_array(chunks: Iterable[bytes], key: str = 'jsonArray') -> Iterator[Dict]:
+    """
+    바이트 조각 스트림에서 최상위 객체의 key 배열 항목을 하나씩 디코딩해 내보냅니다.
+    
+    응답 전체를 메모리에 올리지 않고, 버퍼에는 아직 디코딩하지 못한 항목 하나 분량만 남깁니다.
+    
+    Raises:
+        json.JSONDecodeError: 배열을 찾지 못했거나 배열이 끝나기 전에 스트림이 끝난 경우
+    """
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder('utf-8')()
+    array_start = re.compile(r'"%s"\s*:\s*\[' % re.escape(key))
+    buffer = ''
+    in_array = False
+    
+    for chunk in chunks:
+        buffer += text_decoder.decode(chunk)
+        
+        if not in_array:
+            match = array_start.search(buffer)
+            if not match:
+                # 키가 조각 경계에 걸칠 수 있으므로 끝부분만 남김
+                buffer = buffer[-256:]
+                continue
+            buffer = buffer[match.end():]
+            in_array = True
+        
+        pos = 0
+        while True:
+            while pos < len(buffer) and buffer[pos] in ' \t\r\n,':
+                pos += 1
+            if pos >= len(buffer):
+                break
+            if buffer[pos] == ']':
+                return
+            
+            try:
+                item, pos_end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                # 항목이 아직 다 도착하지 않음 - 다음 조각을 읽은 뒤 다시 시도
+                break
+            
+            yield item
+            pos = pos_end
+        
+        buffer = buffer[pos:]
+    
+    if not in_array:
+        raise json.JSONDecodeError(f"응답에서 {key}를 찾을 수 없습니다", buffer, 0)
+    raise json.JSONDecodeError(f"{key} 배열이 끝나기 전에 응답이 끝났습니다", buffer, 0)
+
+def watermark_key(announcement: Dict) -> Tuple[datetime, str]:
+    """수집 기준점 비교 키 (등록일시, 공고 ID) - API는 최신 등록순으로 응답"""
+    return announcement['creatPnttm'], announcement['pblancId']
+
 class BizinfoAPI:
     """기업마당 API 클라이언트"""
     
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, max_per_host: int = 4):
         self.api_key = api_key
         self.base_url = "https://www.bizinfo.go.kr/uss/rss/bizinfoApi.do"
+        
+        # 여러 스레드가 공유하는 세션 - 호스트당 동시 요청 수만큼 연결을 유지해 재사용
+        self.max_per_host = max_per_host
         self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=max_per_host))
+        self._host_slots = {}
+        self._host_slots_lock = threading.Lock()
+    
+    def _host_slot(self, url: str) -> threading.BoundedSemaphore:
+        """호스트별 동시 요청 수 제한 세마포어"""
+        host = urlparse(url).netloc
+        with self._host_slots_lock:
+            if host not in self._host_slots:
+                self._host_slots[host] = threading.BoundedSemaphore(self.max_per_host)
+            return self._host_slots[host]
         
-    def fetch_announcements(self, search_cnt: int = 50, hashtags: str = None) -> List[Dict]:
+    def fetch_announcements(self, search_cnt: int = 50, hashtags: str = None,
+                            stored_hashes: StoredHashes = None) -> List[Dict]:
         """
         기업마당 API에서 지원사업 공고 데이터를 가져옵니다.
         
         Args:
             search_cnt: 조회할 데이터 수 (기본 50개)
             hashtags: 해시태그 필터링 (예: "경남", "경상남도")
+            stored_hashes: 저장된 공고의 내용 해시 조회 함수 (_process_announcements 참고)
             
         Returns:
             List[Dict]: 공고 데이터 리스트
@@ -50,7 +145,8 @@ class BizinfoAPI:
                 logger.info(f"기업마당 API 호출 시작 - 요청 개수: {search_cnt}")
             
             # API 호출
-            response = self.session.get(self.base_url, params=params, timeout=30)
+            with self._host_slot(self.base_url):
+                response = self.session.get(self.base_url, params=params, timeout=30)
             response.raise_for_status()
             
             # JSON 파싱
@@ -63,13 +159,7 @@ class BizinfoAPI:
             announcements = data['jsonArray']
             logger.info(f"API 응답 성공 - 받은 데이터: {len(announcements)}개")
             
-            # 데이터 정제
-            processed_announcements = []
-            for announcement in announcements:
-                processed = self._process_announcement(announcement)
-                if processed:
-                    processed_announcements.append(processed)
-            
+            processed_announcements = self._process_announcements(announcements, stored_hashes)
             logger.info(f"데이터 처리 완료 - 처리된 데이터: {len(processed_announcements)}개")
             return processed_announcements
             
@@ -83,12 +173,254 @@ class BizinfoAPI:
             logger.error(f"예상치 못한 오류: {e}")
             return []
     
-    def _process_announcement(self, raw_data: Dict) -> Optional[Dict]:
+    def iter_announcements(self, search_cnt: int, hashtags: str = None,
+                           read_size: int = 64 * 1024, stored_hashes: StoredHashes = None,
+                           batch_size: int = 100) -> Iterator[Dict]:
+        """
+        응답 본문을 스트림으로 읽으며 공고를 하나씩 정제해서 내보냅니다 (대량 백필용).
+        
+        fetch_announcements와 달리 원본 응답과 정제 결과 전체를 메모리에 두지 않으므로
+        search_cnt가 수천 개여도 메모리 사용량은 읽기 단위와 공고 한 건 정도로 유지됩니다.
+        스트림 응답은 다 읽을 때까지 연결을 잡고 있으므로 호스트 슬롯도 응답을 닫을 때까지 유지합니다.
+        호출자는 슬롯을 오래 잡지 않도록 묶음 단위로 빨리 소비해야 합니다.
+        중간에 연결이나 파싱 오류가 나면 로그를 남기고 예외를 다시 던지므로
+        호출자는 끊긴 스트림을 끝까지 받은 것으로 오인하지 않습니다.
+        
+        Args:
+            search_cnt: 조회할 데이터 수
+            hashtags: 해시태그 필터링
+            read_size: 소켓에서 한 번에 읽을 바이트 수
+            stored_hashes: 저장된 공고의 내용 해시 조회 함수 (_process_announcements 참고)
+            batch_size: 저장된 해시를 한 번에 조회/정제할 공고 수
+        
+        Yields:
+            Dict: 정제된 공고 데이터
+        """
+        params = {
+            'crtfcKey': self.api_key,
+            'dataType': 'json',
+            'searchCnt': str(search_cnt)
+        }
+        if hashtags:
+            params['hashtags'] = hashtags
+        
+        logger.info(f"기업마당 API 스트리밍 호출 시작 - 요청 개수: {search_cnt}, 해시태그 필터: '{hashtags}'")
+        received = 0
+        batch = []
+        
+        try:
+            with self._host_slot(self.base_url), \
+                    self.session.get(self.base_url, params=params, timeout=30, stream=True) as response:
+                response.raise_for_status()
+                
+                for raw_data in iter_json_array(response.iter_content(chunk_size=read_size)):
+                    received += 1
+                    batch.append(raw_data)
+                    if len(batch) >= batch_size:
+                        yield from self._process_announcements(batch, stored_hashes)
+                        batch = []
+                
+                yield from self._process_announcements(batch, stored_hashes)
+            
+            logger.info(f"기업마당 API 스트리밍 완료 - 받은 데이터: {received}개")
+        
+        except requests.RequestException as e:
+            logger.error(f"API 스트리밍 오류 ({received}개 수신 후): {e}")
+            raise
+        except json.JSONDecodeError as e:
+            logger.error(f"JSON 스트리밍 파싱 오류 ({received}개 수신 후): {e}")
+            raise
+    
+    def _fetch_page(self, page_index: int, page_unit: int, hashtags: str = None,
+                    stored_hashes: StoredHashes = None) -> Optional[Tuple[List[Dict], int]]:
+        """
+        목록 한 페이지를 가져옵니다.
+        
+        Returns:
+            Optional[Tuple[List[Dict], int]]: (정제된 공고 리스트, 원본 건수), 실패 시 None
+        """
+        params = {
+            'crtfcKey': self.api_key,
+            'dataType': 'json',
+            'pageUnit': str(page_unit),
+            'pageIndex': str(page_index)
+        }
+        if hashtags:
+            params['hashtags'] = hashtags
+        
+        try:
+            with self._host_slot(self.base_url):
+                response = self.session.get(self.base_url, params=params, timeout=30)
+            response.raise_for_status()
+            data = response.json()
+        
+        except requests.RequestException as e:
+            logger.error(f"API 호출 오류 (페이지 {page_index}): {e}")
+            return None
+        except json.JSONDecodeError as e:
+            logger.error(f"JSON 파싱 오류 (페이지 {page_index}): {e}")
+            return None
+        
+        # 마지막 페이지 이후에는 jsonArray 없이 응답하는 경우가 있음
+        announcements = data.get('jsonArray') or []
+        return self._process_announcements(announcements, stored_hashes), len(announcements)
+    
+    def fetch_since(self, watermark: Optional[Tuple[datetime, str]], hashtags: str = None,
+                    page_unit: int = 100, max_pages: int = 20, max_items: int = None,
+                    known_ids: Callable[[List[str]], set] = None,
+                    on_page: Callable[[List[Dict]], None] = None,
+                    stored_hashes: StoredHashes = None, catchup_max_pages: int = None) -> Dict:
+        """
+        최신 공고부터 페이지 단위로 가져오다가 수집 기준점(watermark)을 넘으면 멈춥니다.
+        
+        기준점이 없는 첫 실행에서는 max_items개까지 가져오거나, known_ids로 확인했을 때
+        한 페이지가 모두 이미 저장된 공고이면 멈춥니다.
+        
+        기준점이 있는데 max_pages 안에 기준점에 닿지 못하면 catchup_max_pages까지 계속 읽습니다.
+        여기서 멈추면 기준점을 옮길 수 없는데, 다음 실행도 같은 최신 페이지부터 읽으므로
+        밀린 공고가 많을수록 영영 기준점에 닿지 못하게 되기 때문입니다.
+        
+        Args:
+            watermark: 지난 실행까지 저장한 가장 최신 (등록일시, 공고 ID), 없으면 None
+            hashtags: 해시태그 필터링
+            page_unit: 페이지당 공고 수
+            max_pages: 한 번에 가져올 최대 페이지 수
+            max_items: 기준점이 없을 때 가져올 최대 공고 수
+            known_ids: 공고 ID 중 이미 저장된 것을 돌려주는 함수
+            on_page: 페이지를 받을 때마다 기준점 이후 공고로 호출할 함수 (다음 페이지 수집과 겹쳐 처리할 때).
+                있으면 공고를 모아 두지 않으므로 밀린 페이지가 많아도 메모리는 한 페이지 분량으로 유지됩니다
+            stored_hashes: 저장된 공고의 내용 해시 조회 함수 (_process_announcements 참고)
+            catchup_max_pages: 기준점이 있을 때 기준점에 닿을 때까지 읽을 최대 페이지 수 (안전 상한)
+        
+        Returns:
+            Dict: {
+                'announcements': 기준점 이후 공고 리스트 (on_page가 있으면 빈 리스트),
+                'keys': 기준점 이후 공고의 (등록일시, 공고 ID) 리스트 (등록일시가 없으면 None),
+                'count': 기준점 이후 공고 수,
+                'pages': 호출한 페이지 수,
+                'stop_reason': 'watermark' | 'known' | 'end' | 'max_items' | 'max_pages' | 'error',
+                'complete': 기준점까지 빠짐없이 가져왔는지 여부 (기준점을 옮겨도 되는지)
+            }
+        """
+        logger.info(f"기업마당 API 증분 수집 시작 - 기준점: {watermark}, 해시태그: '{hashtags}'")
+        
+        announcements = []
+        keys = []
+        pages = 0
+        stop_reason = 'max_pages'
+        
+        page_limit = max_pages
+        if watermark is not None and catchup_max_pages:
+            page_limit = max(max_pages, catchup_max_pages)
+        
+        for page_index in range(1, page_limit + 1):
+            if page_index == max_pages + 1:
+                logger.warning(f"{max_pages}페이지 안에 기준점 {watermark}에 닿지 못해 "
+                              f"최대 {page_limit}페이지까지 계속 수집합니다 (해시태그: '{hashtags}')")
+            
+            page = self._fetch_page(page_index, page_unit, hashtags, stored_hashes)
+            if page is None:
+                stop_reason = 'error'
+                break
+            
+            items, raw_count = page
+            pages += 1
+            
+            # 등록일시가 없는 공고는 비교할 수 없으므로 일단 받아서 중복 제거 단계에 맡김
+            fresh = [
+                item for item in items
+                if watermark is None or item['creatPnttm'] is None or watermark_key(item) > watermark
+            ]
+            keys.extend(watermark_key(item) for item in fresh)
+            if on_page:
+                if fresh:
+                    on_page(fresh)
+            else:
+                announcements.extend(fresh)
+            
+            if len(fresh) < len(items):
+                stop_reason = 'watermark'
+                break
+            if watermark is None and known_ids and fresh:
+                known = known_ids([item['pblancId'] for item in fresh])
+                if len(known) == len(fresh):
+                    stop_reason = 'known'
+                    break
+            if raw_count < page_unit:
+                stop_reason = 'end'
+                break
+            if watermark is None and max_items and len(keys) >= max_items:
+                stop_reason = 'max_items'
+                break
+        
+        # 기준점이 있을 때 중간에 끊기면 그 사이 공고가 빠지므로 기준점을 옮기지 않음
+        complete = stop_reason in ('watermark', 'known', 'end') or (
+            watermark is None and stop_reason == 'max_items'
+        )
+        
+        logger.info(f"기업마당 API 증분 수집 완료 - {len(keys)}개, {pages}페이지 "
+                   f"(종료: {stop_reason})")
+        return {
+            'announcements': announcements,
+            'keys': keys,
+            'count': len(keys),
+            'pages': pages,
+            'stop_reason': stop_reason,
+            'complete': complete
+        }
+    
+    def _process_announcements(self, raw_announcements: List[Dict],
+                               stored_hashes: StoredHashes = None) -> List[Dict]:
+        """
+        원본 공고 리스트 정제 (처리할 수 없는 공고는 제외)
+        
+        stored_hashes가 있으면 원본 필드로 내용 해시를 먼저 계산해 저장된 해시와 비교하고,
+        같은 공고는 정제(HTML 정리 등)하지 않고 'unchanged': True가 붙은 요약
+        {'pblancId', 'creatPnttm', 'content_hash'}만 돌려줍니다 (등록일시는 수집 기준점 비교용).
+        
+        Args:
+            raw_announcements: 원본 공고 리스트
+            stored_hashes: 공고 ID 리스트를 받아 저장된 {pblancId: content_hash}를 돌려주는 함수
+        """
+        if not raw_announcements:
+            return []
+        
+        stored = {}
+        if stored_hashes:
+            stored = stored_hashes([
+                (raw.get('pblancId') or '').strip() for raw in raw_announcements if raw.get('pblancId')
+            ])
+        
+        processed_announcements = []
+        for announcement in raw_announcements:
+            pblanc_id = (announcement.get('pblancId') or '').strip()
+            content_hash = fields_hash(announcement, CONTENT_FIELDS)
+            
+            if pblanc_id and stored.get(pblanc_id) == content_hash:
+                processed_announcements.append({
+                    'pblancId': pblanc_id,
+                    'creatPnttm': self._parse_datetime(announcement.get('creatPnttm')),
+                    'content_hash': content_hash,
+                    'unchanged': True
+                })
+                continue
+            
+            processed = self._process_announcement(announcement, content_hash)
+            if processed:
+                processed_announcements.append(processed)
+        
+        if stored:
+            unchanged = sum(1 for announcement in processed_announcements if announcement.get('unchanged'))
+            logger.debug(f"내용이 같은 공고 {unchanged}개는 정제 생략 / 전체: {len(raw_announcements)}개")
+        return processed_announcements
+    
+    def _process_announcement(self, raw_data: Dict, content_hash: str = None) -> Optional[Dict]:
         """
         원본 API 데이터를 처리하여 정제된 형태로 변환
         
         Args:
             raw_data: 원본 API 응답 데이터
+            content_hash: 이미 계산한 원본 내용 해시 (없으면 계산)
             
         Returns:
             Dict: 정제된 공고 데이터
@@ -128,6 +460,10 @@ class BizinfoAPI:
                 'fetch_datetime': datetime.now()
             }
             
+            # 변경 감지 - 원본 기준 내용 해시와 정제된 분류 필드 해시
+            processed_data['content_hash'] = content_hash or fields_hash(raw_data, CONTENT_FIELDS)
+            processed_data['classification_hash'] = fields_hash(processed_data, CLASSIFICATION_FIELDS)
+            
             return processed_data
             
         except Exception as e:
@@ -204,22 +540,55 @@ class BizinfoDataProcessor:
         
         Args:
             announcements: 새로 가져온 공고 데이터
-            existing_ids: 이미 DB에 있는 공고 ID 집합
+            existing_ids: 수집한 ID 중 이미 DB에 있는 공고 ID 집합
             
         Returns:
             List[Dict]: 새로운 공고 데이터만
         """
         new_announcements = []
+        seen_ids = set()
         
         for announcement in announcements:
             pblancId = announcement.get('pblancId')
-            if pblancId and pblancId not in existing_ids:
+            if pblancId and pblancId not in existing_ids and pblancId not in seen_ids:
                 new_announcements.append(announcement)
-                existing_ids.add(pblancId)  # 캐시 업데이트
+                seen_ids.add(pblancId)  # 같은 응답 내 중복 제거
         
         logger.info(f"중복 제거 완료 - 새로운 공고: {len(new_announcements)}개")
         return new_announcements
     
+    def filter_changed_announcements(self, announcements: List[Dict],
+                                     existing_hashes: Dict[str, Optional[str]]) -> List[Dict]:
+        """
+        새 공고와 내용이 바뀐 기존 공고만 필터링
+        
+        Args:
+            announcements: 새로 가져온 공고 데이터
+            existing_hashes: 수집한 ID 중 이미 DB에 있는 공고의 {pblancId: content_hash}
+        
+        Returns:
+            List[Dict]: 새 공고 + content_hash가 달라진 공고
+        """
+        changed_announcements = []
+        seen_ids = set()
+        
+        for announcement in announcements:
+            pblancId = announcement.get('pblancId')
+            if not pblancId or pblancId in seen_ids:
+                continue
+            seen_ids.add(pblancId)  # 같은 응답 내 중복 제거
+            
+            if announcement.get('unchanged'):
+                continue
+            
+            if pblancId not in existing_hashes or existing_hashes[pblancId] != announcement.get('content_hash'):
+                changed_announcements.append(announcement)
+        
+        new_count = sum(1 for ann in changed_announcements if ann['pblancId'] not in existing_hashes)
+        logger.info(f"변경 감지 완료 - 새로운 공고: {new_count}개, "
+                   f"변경된 공고: {len(changed_announcements) - new_count}개")
+        return changed_announcements
+    
     def validate_announcement_data(self, announcement: Dict) -> bool:
         """
         공고 데이터 유효성 검사
@@ -5,7 +5,7 @@
 import time
 import threading
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 
 
 class CollectionProgressTracker:
@@ -14,10 +14,29 @@ class CollectionProgressTracker:
     def __init__(self):
         self._progress_data = {}
         self._lock = threading.Lock()
+        # 작업별 변경 알림 (같은 잠금을 공유해 해당 작업 대기자만 깨움)
+        self._conditions = {}
+        self._versions = {}
     
-    def start_collection(self, job_id: str, total_steps: int = 4) -> None:
-        """데이터 수집 시작"""
+    def _notify(self, job_id: str) -> None:
+        """작업 변경 버전 증가 및 대기 중인 구독자 깨우기 (잠금 보유 상태에서 호출)"""
+        self._versions[job_id] = self._versions.get(job_id, 0) + 1
+        condition = self._conditions.get(job_id)
+        if condition:
+            condition.notify_all()
+    
+    def start_collection(self, job_id: str, total_steps: int = 4,
+                         stages: Dict[str, str] = None) -> None:
+        """
+        데이터 수집 시작
+        
+        Args:
+            job_id: 작업 ID
+            total_steps: 순차 단계 수 (update_step 진행률 계산용)
+            stages: 동시에 실행되는 파이프라인 단계 {이름: 표시 이름} (update_stage로 건수 보고)
+        """
         with self._lock:
+            self._conditions.setdefault(job_id, threading.Condition(self._lock))
             self._progress_data[job_id] = {
                 'status': 'running',
                 'current_step': 0,
@@ -26,9 +45,21 @@ class CollectionProgressTracker:
                 'start_time': datetime.now(),
                 'current_message': '데이터 수집 시작...',
                 'steps': [],
+                'stages': {
+                    name: {
+                        'label': label,
+                        'status': 'pending',
+                        'count': 0,
+                        'started_at': None,
+                        'finished_at': None,
+                        'rows_per_second': 0.0
+                    }
+                    for name, label in (stages or {}).items()
+                },
                 'result': None,
                 'error': None
             }
+            self._notify(job_id)
     
     def update_step(self, job_id: str, step: int, message: str, details: Dict[str, Any] = None) -> None:
         """진행단계 업데이트"""
@@ -49,6 +80,67 @@ class CollectionProgressTracker:
             }
             
             progress['steps'].append(step_data)
+            self._notify(job_id)
+    
+    def update_stage(self, job_id: str, stage: str, count: int = 0, message: str = None) -> None:
+        """
+        파이프라인 단계의 처리 건수를 count만큼 늘리고 처리량(건/초)을 갱신합니다.
+        
+        처음 호출되면 단계를 실행 중으로 표시하고 그때부터 처리량을 계산합니다.
+        """
+        with self._lock:
+            progress = self._progress_data.get(job_id)
+            if not progress or stage not in progress['stages']:
+                return
+            
+            stage_data = progress['stages'][stage]
+            now = datetime.now()
+            if stage_data['started_at'] is None:
+                stage_data['started_at'] = now
+                stage_data['status'] = 'running'
+            
+            stage_data['count'] += count
+            elapsed = (now - stage_data['started_at']).total_seconds()
+            if elapsed > 0:
+                stage_data['rows_per_second'] = round(stage_data['count'] / elapsed, 2)
+            
+            if message:
+                progress['current_message'] = message
+            progress['progress_percent'] = self._stage_percent(progress['stages'])
+            self._notify(job_id)
+    
+    def finish_stage(self, job_id: str, stage: str) -> None:
+        """파이프라인 단계 완료 (앞 단계가 끝나고 남은 작업을 모두 처리한 경우)"""
+        with self._lock:
+            progress = self._progress_data.get(job_id)
+            if not progress or stage not in progress['stages']:
+                return
+            
+            stage_data = progress['stages'][stage]
+            now = datetime.now()
+            stage_data['started_at'] = stage_data['started_at'] or now
+            stage_data['finished_at'] = now
+            stage_data['status'] = 'completed'
+            
+            elapsed = (now - stage_data['started_at']).total_seconds()
+            if elapsed > 0:
+                stage_data['rows_per_second'] = round(stage_data['count'] / elapsed, 2)
+            
+            progress['progress_percent'] = self._stage_percent(progress['stages'])
+            self._notify(job_id)
+    
+    @staticmethod
+    def _stage_percent(stages: Dict[str, Dict[str, Any]]) -> int:
+        """단계별 상태로 전체 진행률 추정 (완료 1, 실행 중 0.5)"""
+        if not stages:
+            return 0
+        
+        done = sum(
+            1.0 if stage['status'] == 'completed' else 0.5 if stage['status'] == 'running' else 0.0
+            for stage in stages.values()
+        )
+        # 완료 표시는 complete_collection에서만 하도록 99%에서 멈춤
+        return min(99, int(done / len(stages) * 100))
     
     def complete_collection(self, job_id: str, result: Dict[str, Any]) -> None:
         """데이터 수집 완료"""
@@ -63,6 +155,7 @@ class CollectionProgressTracker:
             progress['current_message'] = '데이터 수집 완료!'
             progress['result'] = result
             progress['end_time'] = datetime.now()
+            self._notify(job_id)
     
     def fail_collection(self, job_id: str, error_message: str) -> None:
         """데이터 수집 실패"""
@@ -75,12 +168,51 @@ class CollectionProgressTracker:
             progress['current_message'] = f'수집 실패: {error_message}'
             progress['error'] = error_message
             progress['end_time'] = datetime.now()
+            self._notify(job_id)
     
     def get_progress(self, job_id: str) -> Optional[Dict[str, Any]]:
         """진행상황 조회"""
         with self._lock:
             return self._progress_data.get(job_id, None)
     
+    def wait_for_update(self, job_id: str, last_version: int = 0,
+                        timeout: float = 15.0) -> Tuple[int, Optional[Dict[str, Any]]]:
+        """
+        작업 진행상황이 last_version 이후로 바뀔 때까지 대기합니다.
+        
+        Args:
+            job_id: 작업 ID
+            last_version: 구독자가 마지막으로 받은 버전 (처음에는 0)
+            timeout: 최대 대기 시간(초)
+            
+        Returns:
+            Tuple[int, Optional[Dict]]: (현재 버전, 진행상황 스냅샷)
+                - 시간 내 변경이 없으면 (last_version, None)
+                - 작업이 없거나 정리되었으면 (-1, None)
+        """
+        with self._lock:
+            condition = self._conditions.get(job_id)
+            if condition is None:
+                return -1, None
+            
+            condition.wait_for(
+                lambda: (job_id not in self._progress_data
+                         or self._versions.get(job_id, 0) > last_version),
+                timeout=timeout
+            )
+            
+            if job_id not in self._progress_data:
+                return -1, None
+            
+            version = self._versions.get(job_id, 0)
+            if version <= last_version:
+                return last_version, None
+            
+            progress = dict(self._progress_data[job_id])
+            progress['steps'] = list(progress['steps'])
+            progress['stages'] = {name: dict(stage) for name, stage in progress['stages'].items()}
+            return version, progress
+    
     def cleanup_old_jobs(self, hours: int = 1) -> None:
         """오래된 작업 정리"""
         cutoff_time = time.time() - (hours * 3600)
@@ -95,6 +227,10 @@ class CollectionProgressTracker:
             
             for job_id in jobs_to_remove:
                 del self._progress_data[job_id]
+                self._versions.pop(job_id, None)
+                condition = self._conditions.pop(job_id, None)
+                if condition:
+                    condition.notify_all()
 
 
 # 전역 진행상황 추적기 인스턴스
@@ -3,16 +3,41 @@
 """
 
 import os
+import time
+import uuid
+import queue
+import socket
 import logging
+import threading
+from collections import OrderedDict
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, as_completed, wait
 from datetime import datetime
-from typing import List, Dict, Tuple
+from typing import Callable, List, Dict, Tuple
 from dotenv import load_dotenv
 
-from .bizinfo_api import BizinfoAPI, BizinfoDataProcessor
+from .bizinfo_api import BizinfoAPI, BizinfoDataProcessor, watermark_key
 from .gyeongnam_classifier import GyeongnamRegionClassifier
 from .gemini_classifier import GeminiClassifier
+from .local_classifier import get_local_classifier
 from .collection_progress import progress_tracker
 from ..models.announcement import AnnouncementModel
+from ..models.checkpoint import ClassificationCheckpointModel
+from ..models.ingestion_watermark import IngestionWatermarkModel
+
+# 미분류 공고 일괄 분류 체크포인트 이름
+BACKLOG_CHECKPOINT = 'classification_backlog'
+
+# 수집 파이프라인 단계 {이름: 표시 이름} (진행상황 표시 순서)
+PIPELINE_STAGES = {
+    'fetch': '공고 수집',
+    'detect': '변경 감지/검증',
+    'store': '저장',
+    'classify': '지역 분류'
+}
+
+# 파이프라인 단계 사이 큐의 종료 표시
+_PIPELINE_DONE = object()
 
 # 환경변수 로드
 load_dotenv()
@@ -36,10 +61,36 @@ class DataCollectionService:
             raise ValueError("BIZINFO_API_KEY가 설정되지 않았습니다.")
         
         # 서비스 초기화
-        self.bizinfo_api = BizinfoAPI(self.bizinfo_api_key)
+        self.bizinfo_api = BizinfoAPI(
+            self.bizinfo_api_key, max_per_host=int(os.getenv('BIZINFO_MAX_CONCURRENCY', '4'))
+        )
         self.data_processor = BizinfoDataProcessor()
+        
+        # 증분 수집 - 지난 수집 기준점까지만 페이지 단위로 가져옴 (false면 search_cnt개 고정 수집)
+        self.incremental_ingestion = os.getenv('INCREMENTAL_INGESTION', 'true').lower() == 'true'
+        self.page_unit = int(os.getenv('BIZINFO_PAGE_UNIT', '100'))
+        self.max_pages = int(os.getenv('BIZINFO_MAX_PAGES', '20'))
+        # 기준점까지 밀린 공고가 max_pages보다 많을 때 따라잡기 위해 더 읽을 수 있는 최대 페이지 수
+        self.catchup_max_pages = int(os.getenv('BIZINFO_CATCHUP_MAX_PAGES', '200'))
+        
+        # 수집 파이프라인 - 단계 사이로 넘기는 묶음 크기와 큐에 쌓아 둘 수 있는 묶음 수 (가득 차면 앞 단계가 대기)
+        self.pipeline_chunk_size = int(os.getenv('PIPELINE_CHUNK_SIZE', '100'))
+        self.pipeline_queue_size = int(os.getenv('PIPELINE_QUEUE_SIZE', '4'))
+        
+        # 동시에 조회할 해시태그 (경남 태그 없이 시군 이름만 달린 공고도 수집)
+        # 비어 있으면 해시태그 필터 없이 한 번만 수집 (None)
+        self.hashtags = [
+            tag.strip() for tag in os.getenv('BIZINFO_HASHTAGS', '경남,경상남도').split(',') if tag.strip()
+        ] or [None]
         self.keyword_classifier = GyeongnamRegionClassifier()
         
+        # 여러 인스턴스가 같은 공고를 중복 분류하지 않도록 공고를 임대(claim)해서 분류
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.lease_seconds = int(os.getenv('CLASSIFICATION_LEASE_SECONDS', '900'))
+        
+        # 키워드와 Gemini 사이의 로컬 분류기 (모델 파일이 있을 때만 사용)
+        self.local_classifier = get_local_classifier()
+        
         # Gemini API가 설정된 경우에만 초기화
         self.ai_classifier = None
         if self.gemini_api_key:
@@ -55,6 +106,9 @@ class DataCollectionService:
         """
         데이터 수집부터 분류까지 전체 프로세스 실행
         
+        수집 → 변경 감지/검증 → 저장 → 분류 단계를 파이프라인으로 겹쳐 실행합니다
+        (_run_pipeline 참고). 진행상황은 단계별 처리 건수와 처리량으로 보고합니다.
+        
         Args:
             search_cnt: 수집할 데이터 수
             job_id: 진행상황 추적을 위한 작업 ID
@@ -66,80 +120,52 @@ class DataCollectionService:
         
         # 진행상황 추적 시작
         if job_id:
-            progress_tracker.start_collection(job_id, total_steps=4)
+            progress_tracker.start_collection(job_id, total_steps=len(PIPELINE_STAGES), stages=PIPELINE_STAGES)
         
         stats = {
             'start_time': datetime.now(),
             'total_fetched': 0,
             'new_announcements': 0,
             'keyword_classified': 0,
+            'institution_classified': 0,
+            'local_classified': 0,
             'ai_classified': 0,
             'classification_failed': 0,
+            'claimed_elsewhere': 0,
+            'changed_announcements': 0,
+            'valid_announcements': 0,
             'db_inserted': 0,
+            'db_updated': 0,
+            'db_failed': 0,
+            'inserted_ids': [],
+            'reclassify_ids': [],
+            'pages_fetched': 0,
+            'hashtag_yield': {},
+            'stages': {},
             'errors': []
         }
         
         try:
-            # 1단계: 기업마당 API에서 데이터 수집
-            logger.info("1단계: 기업마당 API 데이터 수집 중...")
-            if job_id:
-                progress_tracker.update_step(job_id, 1, f"기업마당 API에서 {search_cnt}개 데이터 수집 중...")
+            fetches, settled_ids = self._run_pipeline(search_cnt, stats, job_id)
             
-            # 경상남도 지역 필터링으로 데이터 수집
-            announcements = self.bizinfo_api.fetch_announcements(search_cnt, hashtags="경남")
-            stats['total_fetched'] = len(announcements)
+            # 저장이 확인된 범위까지 해시태그별 수집 기준점 이동
+            for fetch in fetches:
+                self._advance_watermark(fetch, settled_ids)
             
-            if not announcements:
+            if not stats['total_fetched']:
                 logger.warning("수집된 데이터가 없습니다.")
-                if job_id:
-                    progress_tracker.complete_collection(job_id, stats)
-                return stats
-            
-            # 2단계: 중복 데이터 필터링
-            logger.info("2단계: 중복 데이터 필터링 중...")
-            if job_id:
-                progress_tracker.update_step(job_id, 2, f"수집된 {len(announcements)}개 데이터에서 중복 제거 중...", 
-                                           {'total_fetched': len(announcements)})
-            
-            existing_ids = AnnouncementModel.get_existing_ids()
-            new_announcements = self.data_processor.filter_new_announcements(
-                announcements, existing_ids
-            )
-            stats['new_announcements'] = len(new_announcements)
-            
-            if not new_announcements:
-                logger.info("새로운 공고가 없습니다.")
-                if job_id:
-                    progress_tracker.complete_collection(job_id, stats)
-                return stats
-            
-            # 3단계: 데이터베이스에 삽입 (분류 전)
-            logger.info("3단계: 새로운 공고 데이터베이스 삽입 중...")
-            if job_id:
-                progress_tracker.update_step(job_id, 3, f"{len(new_announcements)}개 신규 공고를 데이터베이스에 저장 중...",
-                                           {'new_announcements': len(new_announcements)})
-            
-            valid_announcements = [
-                ann for ann in new_announcements 
-                if self.data_processor.validate_announcement_data(ann)
-            ]
-            
-            inserted_count = AnnouncementModel.bulk_insert_announcements(valid_announcements)
-            stats['db_inserted'] = inserted_count
-            
-            if inserted_count == 0:
+            elif not stats['valid_announcements']:
+                logger.info("새로운 공고나 변경된 공고가 없습니다.")
+            elif stats['db_failed'] >= stats['valid_announcements']:
                 logger.error("데이터베이스 삽입 실패")
                 if job_id:
                     progress_tracker.fail_collection(job_id, "데이터베이스 삽입 실패")
                 return stats
-            
-            # 4단계: 지역 분류 수행
-            logger.info("4단계: 지역 분류 수행 중...")
-            if job_id:
-                progress_tracker.update_step(job_id, 4, f"{inserted_count}개 공고에 대한 지역 분류 진행 중...",
-                                           {'db_inserted': inserted_count})
-            
-            self._classify_announcements(stats)
+            else:
+                # 이전 실행에서 분류하지 못하고 남은 공고 (이번 실행에서 처리한 공고 제외)
+                self._classify_announcements(
+                    stats, skip_ids=set(stats['inserted_ids']) | set(stats['reclassify_ids'])
+                )
             
             # 완료
             stats['end_time'] = datetime.now()
@@ -159,20 +185,434 @@ class DataCollectionService:
             if job_id:
                 progress_tracker.fail_collection(job_id, str(e))
             return stats
+        
+        finally:
+            # 수집이 끝나면 공고 조회 캐시 무효화
+            AnnouncementModel.invalidate_cache()
+    
+    def _run_pipeline(self, search_cnt: int, stats: Dict, job_id: str = None) -> Tuple[List[Dict], set]:
+        """
+        수집 → 변경 감지/검증 → 저장 → 분류 단계를 크기가 제한된 큐로 잇고 단계마다 스레드를 띄워
+        묶음 단위로 겹쳐 실행합니다.
+        
+        해시태그별 수집이 페이지를 받는 대로 pipeline_chunk_size개씩 다음 단계로 넘기므로
+        다음 페이지를 받는 동안 앞 묶음이 저장되고 분류됩니다. 큐가 가득 차면 앞 단계가 기다려
+        (backpressure) 분류가 밀려도 메모리에 쌓이는 묶음 수는 pipeline_queue_size로 제한됩니다.
+        한 단계에서 예외가 나면 나머지 단계는 남은 묶음을 비우기만 하고 멈춘 뒤 예외를 다시 발생시킵니다.
+        
+        Returns:
+            Tuple[List[Dict], set]: (해시태그별 수집 결과, 처리가 확인된 공고 ID)
+                - 처리 확인: 삽입/갱신/변경 없음이 DB에서 확인되었거나, 유효하지 않아 일부러 건너뛴 공고
+        """
+        detect_queue = queue.Queue(maxsize=self.pipeline_queue_size)
+        store_queue = queue.Queue(maxsize=self.pipeline_queue_size)
+        classify_queue = queue.Queue(maxsize=self.pipeline_queue_size)
+        abort = threading.Event()
+        
+        seen_ids = set()
+        seen_lock = threading.Lock()
+        settled_ids = set()
+        
+        def on_page(announcements: List[Dict]):
+            """해시태그 수집 스레드에서 페이지마다 호출 - 처음 본 공고만 묶어서 다음 단계로 넘김"""
+            with seen_lock:
+                fresh = [ann for ann in announcements if ann['pblancId'] not in seen_ids]
+                seen_ids.update(ann['pblancId'] for ann in fresh)
+                stats['total_fetched'] += len(fresh)
+            
+            if job_id and fresh:
+                progress_tracker.update_stage(job_id, 'fetch', len(fresh),
+                                              f"기업마당 API에서 공고 수집 중... (누적 {len(seen_ids)}개)")
+            
+            for start in range(0, len(fresh), self.pipeline_chunk_size):
+                if abort.is_set():
+                    return
+                detect_queue.put(fresh[start:start + self.pipeline_chunk_size])
+        
+        def detect(chunk: List[Dict]) -> List[Dict]:
+            """내용 해시가 같은 기존 공고를 건너뛰고 유효한 신규/변경 공고만 남김"""
+            # 수집 단계에서 저장된 해시와 같다고 확인된 공고는 정제되지 않은 요약이므로 바로 확정
+            settled_ids.update([ann['pblancId'] for ann in chunk if ann.get('unchanged')])
+            chunk = [ann for ann in chunk if not ann.get('unchanged')]
+            if not chunk:
+                return []
+            
+            existing_hashes = AnnouncementModel.get_content_hashes([ann['pblancId'] for ann in chunk])
+            changed_announcements = self.data_processor.filter_changed_announcements(chunk, existing_hashes)
+            new_count = sum(1 for ann in changed_announcements if ann['pblancId'] not in existing_hashes)
+            stats['new_announcements'] += new_count
+            stats['changed_announcements'] += len(changed_announcements) - new_count
+            
+            valid_announcements = [
+                ann for ann in changed_announcements
+                if self.data_processor.validate_announcement_data(ann)
+            ]
+            stats['valid_announcements'] += len(valid_announcements)
+            
+            # 내용 해시가 같아 건너뛴 공고와 검증에 실패한 공고는 다시 가져와도 결과가 같음
+            valid_ids = {ann['pblancId'] for ann in valid_announcements}
+            settled_ids.update([ann['pblancId'] for ann in chunk if ann['pblancId'] not in valid_ids])
+            return valid_announcements
+        
+        def store(chunk: List[Dict]) -> List[Dict]:
+            """저장 후 새로 삽입되었거나 분류가 초기화된 공고만 id를 붙여 분류 단계로 넘김"""
+            upsert_result = AnnouncementModel.upsert_announcements(chunk, chunk_size=self.pipeline_chunk_size)
+            stats['db_inserted'] += len(upsert_result['inserted'])
+            stats['db_updated'] += len(upsert_result['updated'])
+            stats['inserted_ids'].extend(row['id'] for row in upsert_result['inserted'])
+            stats['reclassify_ids'].extend(row['id'] for row in upsert_result['updated'] if row['pending'])
+            
+            for failure in upsert_result['failed']:
+                stats['errors'].append(f"공고 저장 실패 ({failure['pblancId']}): {failure['error']}")
+            stats['db_failed'] += len(upsert_result['failed'])
+            
+            settled_ids.update(
+                [row['pblancId'] for row in upsert_result['inserted'] + upsert_result['updated']]
+                + upsert_result['unchanged']
+            )
+            
+            # 분류에 필요한 필드는 이미 메모리에 있으므로 DB에서 다시 읽지 않음
+            targets = {row['pblancId']: row['id'] for row in upsert_result['inserted']}
+            targets.update(
+                (row['pblancId'], row['id']) for row in upsert_result['updated'] if row['pending']
+            )
+            return [{**ann, 'id': targets[ann['pblancId']]} for ann in chunk if ann['pblancId'] in targets]
+        
+        def classify(chunk: List[Dict]) -> None:
+            for key, value in self._classify_claimed_chunk(chunk).items():
+                stats[key] += value
+        
+        stages = [
+            threading.Thread(target=self._pipeline_stage, name=f"pipeline-{name}",
+                             args=(name, inbox, outbox, handle, abort, stats, job_id))
+            for name, inbox, outbox, handle in (
+                ('detect', detect_queue, store_queue, detect),
+                ('store', store_queue, classify_queue, store),
+                ('classify', classify_queue, None, classify)
+            )
+        ]
+        for stage in stages:
+            stage.start()
+        
+        fetch_started = time.monotonic()
+        try:
+            fetches = self._fetch_all_hashtags(search_cnt, stats, on_page)
+        except Exception:
+            abort.set()
+            raise
+        finally:
+            # 뒤 단계가 큐를 비우고 끝나도록 종료 표시를 넘김
+            detect_queue.put(_PIPELINE_DONE)
+            self._record_stage(stats, 'fetch', stats['total_fetched'], time.monotonic() - fetch_started)
+            if job_id:
+                progress_tracker.finish_stage(job_id, 'fetch')
+            for stage in stages:
+                stage.join()
+        
+        if abort.is_set():
+            raise RuntimeError("파이프라인 단계 오류로 수집을 중단했습니다")
+        
+        return fetches, settled_ids
+    
+    def _pipeline_stage(self, name: str, inbox: queue.Queue, outbox: queue.Queue, handle,
+                        abort: threading.Event, stats: Dict, job_id: str = None):
+        """
+        파이프라인 단계 스레드 - 종료 표시가 올 때까지 묶음을 handle로 처리하고 결과를 다음 큐로 넘깁니다.
+        
+        오류가 나면 abort를 설정하고, 앞 단계가 가득 찬 큐에서 멈추지 않도록 남은 묶음은 비우기만 합니다.
+        """
+        processed = 0
+        busy_seconds = 0.0
+        try:
+            while True:
+                chunk = inbox.get()
+                if chunk is _PIPELINE_DONE:
+                    break
+                if abort.is_set():
+                    continue
+                
+                started = time.monotonic()
+                try:
+                    result = handle(chunk)
+                except Exception as e:
+                    logger.error(f"파이프라인 {PIPELINE_STAGES[name]} 단계 오류: {e}")
+                    stats['errors'].append(f"{PIPELINE_STAGES[name]} 단계 실패: {e}")
+                    abort.set()
+                    continue
+                busy_seconds += time.monotonic() - started
+                processed += len(chunk)
+                
+                if job_id:
+                    progress_tracker.update_stage(job_id, name, len(chunk),
+                                                  f"{PIPELINE_STAGES[name]} 중... ({processed}개 처리)")
+                if result and outbox is not None:
+                    outbox.put(result)
+        finally:
+            if outbox is not None:
+                outbox.put(_PIPELINE_DONE)
+            self._record_stage(stats, name, processed, busy_seconds)
+            if job_id:
+                progress_tracker.finish_stage(job_id, name)
+    
+    @staticmethod
+    def _record_stage(stats: Dict, name: str, count: int, seconds: float):
+        """단계별 처리 건수와 처리량 기록 (seconds: 단계가 실제로 일한 시간)"""
+        stats['stages'][name] = {
+            'count': count,
+            'seconds': round(seconds, 3),
+            'rows_per_second': round(count / seconds, 2) if seconds > 0 else 0.0
+        }
+    
+    def backfill_announcements(self, search_cnt: int, hashtags: str = "경남",
+                               chunk_size: int = 500) -> Dict:
+        """
+        대량 수집 - 응답을 스트림으로 읽으며 chunk_size개씩 변경 감지/검증/저장합니다.
+        
+        수집한 공고 전체를 리스트로 만들지 않으므로 search_cnt가 수천 개여도
+        메모리에는 한 묶음과 이미 본 공고 ID만 남습니다. 분류는 일괄 분류 모드로 따로 수행합니다.
+        증분 수집 기준점보다 오래된 공고의 수정 사항도 이 모드로 다시 읽어 반영합니다.
+        
+        Args:
+            search_cnt: 수집할 데이터 수
+            hashtags: 해시태그 필터링
+            chunk_size: 한 번에 중복 확인/삽입할 공고 수
+        
+        Returns:
+            Dict: 처리 결과 통계 (complete가 False면 스트림이 끝까지 오지 않은 것)
+        """
+        logger.info(f"=== 대량 수집 시작 ({search_cnt}개, {chunk_size}개씩) ===")
+        
+        stats = {
+            'start_time': datetime.now(),
+            'total_fetched': 0,
+            'new_announcements': 0,
+            'changed_announcements': 0,
+            'db_inserted': 0,
+            'db_updated': 0,
+            'chunks': 0,
+            'complete': False,
+            'errors': []
+        }
+        
+        seen_ids = set()
+        stream = self.bizinfo_api.iter_announcements(
+            search_cnt, hashtags=hashtags, stored_hashes=AnnouncementModel.get_content_hashes
+        )
+        
+        try:
+            while True:
+                chunk = list(islice(stream, chunk_size))
+                if not chunk:
+                    stats['complete'] = True
+                    break
+                
+                stats['total_fetched'] += len(chunk)
+                stats['chunks'] += 1
+                
+                # 앞 묶음에서 이미 본 공고와 저장된 내용과 같은 공고(정제하지 않은 요약)는 건너뜀
+                chunk = [ann for ann in chunk if ann['pblancId'] not in seen_ids]
+                seen_ids.update(ann['pblancId'] for ann in chunk)
+                chunk = [ann for ann in chunk if not ann.get('unchanged')]
+                
+                existing_hashes = AnnouncementModel.get_content_hashes([ann['pblancId'] for ann in chunk])
+                changed_announcements = self.data_processor.filter_changed_announcements(
+                    chunk, existing_hashes
+                )
+                new_count = sum(1 for ann in changed_announcements if ann['pblancId'] not in existing_hashes)
+                stats['new_announcements'] += new_count
+                stats['changed_announcements'] += len(changed_announcements) - new_count
+                
+                valid_announcements = [
+                    ann for ann in changed_announcements
+                    if self.data_processor.validate_announcement_data(ann)
+                ]
+                upsert_result = AnnouncementModel.upsert_announcements(
+                    valid_announcements, chunk_size=chunk_size
+                )
+                stats['db_inserted'] += len(upsert_result['inserted'])
+                stats['db_updated'] += len(upsert_result['updated'])
+                
+                for failure in upsert_result['failed']:
+                    stats['errors'].append(f"공고 저장 실패 ({failure['pblancId']}): {failure['error']}")
+                
+                logger.info(f"대량 수집 진행: {stats['total_fetched']}개 수집, "
+                           f"{stats['db_inserted']}개 삽입, {stats['db_updated']}개 변경")
+        
+        except Exception as e:
+            # 스트림이 중간에 끊긴 경우도 여기로 오므로 complete는 False로 남음
+            logger.error(f"대량 수집 오류 ({stats['total_fetched']}개 수집 후 중단): {e}")
+            stats['errors'].append(str(e))
+        
+        finally:
+            stream.close()
+            AnnouncementModel.invalidate_cache()
+        
+        stats['end_time'] = datetime.now()
+        stats['total_duration'] = (stats['end_time'] - stats['start_time']).total_seconds()
+        status = "완료" if stats['complete'] else "중단"
+        logger.info(f"=== 대량 수집 {status} - 수집 {stats['total_fetched']}개, 신규 {stats['new_announcements']}개, "
+                   f"변경 {stats['changed_announcements']}개, 삽입 {stats['db_inserted']}개, "
+                   f"갱신 {stats['db_updated']}개 ({stats['total_duration']:.2f}초) ===")
+        return stats
+    
+    def _fetch_all_hashtags(self, search_cnt: int, stats: Dict,
+                            on_page: Callable[[List[Dict]], None] = None) -> List[Dict]:
+        """
+        해시태그별 수집을 동시에 실행합니다. 공고는 페이지를 받을 때마다 on_page로 넘기므로
+        병합(공고 ID 기준 중복 제거)은 on_page 쪽에서 합니다.
+        
+        동시 요청 수는 BizinfoAPI의 호스트별 제한을 따르며, 해시태그별 수집/고유 공고 수를
+        stats['hashtag_yield']에 기록합니다 (exclusive: 다른 해시태그에서는 나오지 않은 공고 수).
+        
+        Returns:
+            List[Dict]: 해시태그별 수집 결과
+        """
+        fetches = []
+        
+        with ThreadPoolExecutor(max_workers=len(self.hashtags), thread_name_prefix='bizinfo') as executor:
+            futures = {
+                executor.submit(self._fetch_announcements, search_cnt, tag, on_page): tag
+                for tag in self.hashtags
+            }
+            
+            for future in as_completed(futures):
+                tag = futures[future]
+                try:
+                    fetch = future.result()
+                except Exception as e:
+                    logger.error(f"해시태그 '{tag}' 수집 오류: {e}")
+                    stats['errors'].append(f"해시태그 '{tag}' 수집 실패: {e}")
+                    continue
+                
+                fetches.append(fetch)
+                stats['pages_fetched'] += fetch['pages']
+                logger.info(f"해시태그 '{tag}' 수집 완료: {fetch['count']}개 ({fetch['pages']}페이지)")
+                
+        tag_counts = {}  # 공고 ID -> 해당 공고를 돌려준 해시태그 수
+        fetched_ids = {}
+        for fetch in fetches:
+            fetched_ids[fetch['hashtag']] = {pblanc_id for _, pblanc_id in fetch['keys']}
+            for pblanc_id in fetched_ids[fetch['hashtag']]:
+                tag_counts[pblanc_id] = tag_counts.get(pblanc_id, 0) + 1
+        
+        for fetch in fetches:
+            ids = fetched_ids[fetch['hashtag']]
+            stats['hashtag_yield'][fetch['hashtag'] or '*'] = {
+                'fetched': len(ids),
+                'exclusive': sum(1 for pblanc_id in ids if tag_counts[pblanc_id] == 1),
+                'pages': fetch['pages']
+            }
+        
+        return fetches
+    
+    def _fetch_announcements(self, search_cnt: int, hashtags: str,
+                             on_page: Callable[[List[Dict]], None] = None) -> Dict:
+        """
+        기업마당 공고 수집 (증분 수집이면 기준점 이후 공고만 페이지 단위로 가져옴)
+        
+        on_page가 있으면 받은 공고를 페이지마다 (고정 개수 수집이면 한 번에) 넘깁니다.
+        
+        Returns:
+            Dict: BizinfoAPI.fetch_since 결과에 'hashtag', 'source'(기준점 이름), 'watermark'를 더한 것
+        """
+        source = f"bizinfo:{hashtags or '*'}"
+        
+        if self.incremental_ingestion:
+            try:
+                watermark = IngestionWatermarkModel.get(source)
+            except Exception as e:
+                logger.warning(f"수집 기준점 조회 실패, 고정 개수 수집으로 대체: {e}")
+            else:
+                fetch = self.bizinfo_api.fetch_since(
+                    watermark, hashtags=hashtags, page_unit=self.page_unit,
+                    max_pages=self.max_pages, max_items=search_cnt,
+                    catchup_max_pages=self.catchup_max_pages,
+                    known_ids=AnnouncementModel.get_existing_ids, on_page=on_page,
+                    stored_hashes=AnnouncementModel.get_content_hashes
+                )
+                if not fetch['complete']:
+                    logger.warning(f"기준점 {watermark}까지 모두 가져오지 못했습니다 "
+                                  f"({fetch['stop_reason']}, {fetch['pages']}페이지) - 기준점 유지")
+                return {**fetch, 'hashtag': hashtags, 'source': source, 'watermark': watermark}
+        
+        announcements = self.bizinfo_api.fetch_announcements(
+            search_cnt, hashtags=hashtags, stored_hashes=AnnouncementModel.get_content_hashes
+        )
+        if on_page and announcements:
+            on_page(announcements)
+        return {'announcements': announcements, 'keys': [watermark_key(ann) for ann in announcements],
+                'count': len(announcements), 'pages': 1, 'stop_reason': 'window', 'complete': False,
+                'hashtag': hashtags, 'source': source, 'watermark': None}
     
-    def _classify_announcements(self, stats: Dict):
-        """미분류 공고들에 대해 지역 분류 수행"""
+    def _advance_watermark(self, fetch: Dict, settled_ids: set):
+        """
+        저장이 확인된 범위까지 수집 기준점을 옮깁니다.
         
-        # 미분류 공고 조회
-        unclassified = AnnouncementModel.get_unclassified_announcements(limit=100)
+        오래된 공고부터 보면서 처리가 확인되지 않은 첫 공고 직전에서 멈추므로,
+        저장에 실패했거나 오류로 결과를 알 수 없는 공고는 다음 수집에서 다시 가져옵니다.
+        """
+        if not fetch['complete']:
+            return
+        
+        new_mark = None
+        for key in sorted(key for key in fetch['keys'] if key[0]):
+            if key[1] not in settled_ids:
+                break
+            new_mark = key
+        
+        if new_mark and (fetch['watermark'] is None or new_mark > fetch['watermark']):
+            if IngestionWatermarkModel.save(fetch['source'], *new_mark):
+                logger.info(f"수집 기준점 갱신: {fetch['source']} -> {new_mark}")
+    
+    def _classify_announcements(self, stats: Dict, skip_ids: set = None):
+        """
+        미분류 공고들에 대해 지역 분류 수행
+        
+        Args:
+            stats: 분류 건수를 더할 통계
+            skip_ids: 임대하더라도 분류하지 않고 바로 반환할 공고 ID (이번 실행에서 이미 분류한 공고)
+        """
+        
+        # 다른 워커가 임대하지 않은 미분류 공고 임대
+        unclassified = AnnouncementModel.claim_unclassified(
+            self.worker_id, limit=100, lease_seconds=self.lease_seconds
+        )
+        
+        if skip_ids:
+            skipped = [a['id'] for a in unclassified if a['id'] in skip_ids]
+            if skipped:
+                AnnouncementModel.release_claims(self.worker_id, skipped)
+                unclassified = [a for a in unclassified if a['id'] not in skip_ids]
         
         if not unclassified:
             logger.info("분류할 공고가 없습니다.")
             return
         
-        logger.info(f"미분류 공고 {len(unclassified)}개에 대해 분류 시작")
+        logger.info(f"미분류 공고 {len(unclassified)}개 임대, 분류 시작 (워커: {self.worker_id})")
+        try:
+            for key, value in self._classify_chunk(unclassified).items():
+                stats[key] = stats.get(key, 0) + value
+        except Exception:
+            # 분류를 끝내지 못한 공고는 임대 만료를 기다리지 않고 바로 반환
+            AnnouncementModel.release_claims(self.worker_id, [a['id'] for a in unclassified])
+            raise
+    
+    def _classify_chunk(self, unclassified: List[Dict]) -> Dict:
+        """
+        공고 묶음을 키워드/기관 → 로컬 → AI 순서로 분류하고 저장합니다.
         
-        keyword_classified = []
+        Returns:
+            Dict: 단계별 분류 건수와 실패 건수
+        """
+        counts = {
+            'keyword_classified': 0,
+            'institution_classified': 0,
+            'local_classified': 0,
+            'ai_classified': 0,
+            'classification_failed': 0
+        }
+        
+        keyword_results = []
         ai_targets = []
         
         # 키워드 기반 분류
@@ -180,38 +620,226 @@ class DataCollectionService:
             result = self.keyword_classifier.classify_announcement(announcement)
             
             if result.region_code and result.confidence >= 0.6:
-                # 키워드 분류 성공
-                success = AnnouncementModel.update_classification(
-                    announcement['id'], 
-                    result.region_code, 
-                    'keyword', 
-                    result.confidence
-                )
-                
-                if success:
-                    keyword_classified.append(announcement['id'])
-                    logger.debug(f"키워드 분류 성공: {announcement['pblancNm']} -> {result.region_code}")
-                else:
-                    logger.error(f"키워드 분류 결과 저장 실패: {announcement['id']}")
+                # 키워드 분류 성공 - 결과는 모아서 한 번에 저장
+                keyword_results.append((announcement, result))
             else:
                 # AI 분류 대상
                 ai_targets.append(announcement)
         
-        stats['keyword_classified'] = len(keyword_classified)
-        logger.info(f"키워드 기반 분류 완료: {len(keyword_classified)}개")
+        # 기관 인덱스로 분류된 결과는 'institution', 나머지는 'keyword'로 저장
+        updated_ids = AnnouncementModel.bulk_update_classifications([
+            (announcement['id'], result.region_code, result.method, result.confidence)
+            for announcement, result in keyword_results
+        ], claimed_by=self.worker_id)
+        
+        for announcement, result in keyword_results:
+            if announcement['id'] in updated_ids:
+                if result.method == 'institution':
+                    counts['institution_classified'] += 1
+                else:
+                    counts['keyword_classified'] += 1
+                logger.debug(f"{result.method} 분류 성공: {announcement['pblancNm']} -> {result.region_code}")
+            else:
+                logger.error(f"키워드 분류 결과 저장 실패: {announcement['id']}")
+        
+        logger.info(f"키워드 기반 분류 완료: {counts['keyword_classified']}개, "
+                   f"기관 인덱스 분류: {counts['institution_classified']}개")
+        
+        # 로컬 분류기 - 보정된 신뢰도가 임계값 이상인 공고는 Gemini로 보내지 않음
+        if ai_targets and self.local_classifier:
+            counts['local_classified'], ai_targets = self._perform_local_classification(ai_targets)
+            logger.info(f"로컬 분류 완료: {counts['local_classified']}개, Gemini 대상: {len(ai_targets)}개")
         
         # AI 기반 분류 (Gemini API)
         if ai_targets and self.ai_classifier:
             logger.info(f"AI 분류 시작: {len(ai_targets)}개")
-            ai_classified_count = self._perform_ai_classification(ai_targets)
-            stats['ai_classified'] = ai_classified_count
+            counts['ai_classified'] = self._perform_ai_classification(ai_targets)
         elif ai_targets:
             logger.warning(f"AI 분류기가 없어 {len(ai_targets)}개 공고를 분류하지 못했습니다.")
-            stats['classification_failed'] = len(ai_targets)
         
         # 분류 실패 건수 계산
-        total_classified = stats['keyword_classified'] + stats.get('ai_classified', 0)
-        stats['classification_failed'] = len(unclassified) - total_classified
+        counts['classification_failed'] = len(unclassified) - sum(
+            counts[key] for key in ('keyword_classified', 'institution_classified',
+                                    'local_classified', 'ai_classified')
+        )
+        return counts
+    
+    def _classify_claimed_chunk(self, chunk: List[Dict]) -> Dict:
+        """일괄 분류 묶음 중 임대에 성공한 공고만 분류 (다른 워커가 처리 중인 공고는 건너뜀)"""
+        claimed_ids = AnnouncementModel.claim_announcements(
+            self.worker_id, [a['id'] for a in chunk], lease_seconds=self.lease_seconds
+        )
+        claimed = [a for a in chunk if a['id'] in claimed_ids]
+        
+        counts = {'claimed_elsewhere': len(chunk) - len(claimed)}
+        if not claimed:
+            return counts
+        
+        try:
+            counts.update(self._classify_chunk(claimed))
+        except Exception:
+            AnnouncementModel.release_claims(self.worker_id, list(claimed_ids))
+            raise
+        return counts
+    
+    def drain_classification_backlog(self, chunk_size: int = 500, workers: int = 4,
+                                     resume: bool = True, job_id: str = None) -> Dict:
+        """
+        미분류 공고 전체를 서버 측 커서로 chunk_size개씩 읽어 워커 풀에서 분류합니다.
+        
+        id 순으로 처리하며, 앞에서부터 연속으로 끝난 묶음까지를 체크포인트로 저장하므로
+        중단되면 다음 실행이 그 뒤부터 이어서 처리합니다 (분류에 실패한 공고를 같은 실행에서
+        반복해서 AI로 보내지 않음).
+        
+        Args:
+            chunk_size: 한 번에 읽고 분류할 공고 수
+            workers: 동시에 분류할 묶음 수 (AI 호출/DB 저장이 겹쳐 실행됨)
+            resume: 마지막 체크포인트부터 이어서 처리할지 여부
+            job_id: 진행상황 추적을 위한 작업 ID
+        
+        Returns:
+            Dict: 처리 건수, 단계별 분류 건수, 처리량(건/초)
+        """
+        checkpoint = ClassificationCheckpointModel.get(BACKLOG_CHECKPOINT) if resume else None
+        after_id = checkpoint['last_id'] if checkpoint and not checkpoint['finished_at'] else 0
+        total = AnnouncementModel.count_unclassified(after_id=after_id)
+        
+        stats = {
+            'start_time': datetime.now(),
+            'resumed_from_id': after_id,
+            'backlog': total,
+            'processed': 0,
+            'chunks': 0,
+            'keyword_classified': 0,
+            'institution_classified': 0,
+            'local_classified': 0,
+            'ai_classified': 0,
+            'classification_failed': 0,
+            'claimed_elsewhere': 0,
+            'errors': []
+        }
+        
+        logger.info(f"=== 미분류 공고 일괄 분류 시작 - {total}개 (id > {after_id}, "
+                   f"{chunk_size}개씩, 워커 {workers}개) ===")
+        ClassificationCheckpointModel.save(BACKLOG_CHECKPOINT, after_id, started=not after_id)
+        if job_id:
+            progress_tracker.start_collection(job_id, total_steps=max(1, -(-total // chunk_size)))
+        
+        pending = OrderedDict()  # 묶음 순서 -> (Future, 마지막 id, 공고 수)
+        started_at = time.monotonic()
+        
+        def commit_finished():
+            """앞에서부터 연속으로 끝난 묶음을 집계하고 체크포인트 저장 (제출 스레드에서만 호출)"""
+            nonlocal after_id
+            while pending and next(iter(pending.values()))[0].done():
+                _, (future, last_id, size) = pending.popitem(last=False)
+                try:
+                    counts = future.result()
+                except Exception as e:
+                    logger.error(f"묶음 분류 오류 (id <= {last_id}): {e}")
+                    stats['errors'].append(str(e))
+                    counts = {'classification_failed': size}
+                
+                for key, value in counts.items():
+                    stats[key] += value
+                stats['processed'] += size
+                stats['chunks'] += 1
+                after_id = last_id
+                
+                elapsed = time.monotonic() - started_at
+                ClassificationCheckpointModel.save(BACKLOG_CHECKPOINT, last_id, processed=size)
+                logger.info(f"일괄 분류 진행: {stats['processed']}/{total}개 "
+                           f"({stats['processed'] / elapsed:.1f}건/초, 체크포인트 id {last_id})")
+                if job_id:
+                    progress_tracker.update_step(
+                        job_id, stats['chunks'], f"일괄 분류 중... ({stats['processed']}/{total})",
+                        {'rows_per_second': round(stats['processed'] / elapsed, 2)}
+                    )
+        
+        try:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='backlog') as executor:
+                for sequence, chunk in enumerate(AnnouncementModel.iter_unclassified_chunks(chunk_size, after_id)):
+                    pending[sequence] = (executor.submit(self._classify_claimed_chunk, chunk), chunk[-1]['id'], len(chunk))
+                    
+                    # 읽기가 분류를 너무 앞서가지 않도록 대기 중인 묶음 수 제한
+                    while len(pending) >= workers * 2:
+                        wait([entry[0] for entry in pending.values()], return_when=FIRST_COMPLETED)
+                        commit_finished()
+                    commit_finished()
+                
+                wait([entry[0] for entry in pending.values()])
+                commit_finished()
+            
+            ClassificationCheckpointModel.save(BACKLOG_CHECKPOINT, after_id, finished=True)
+        
+        except Exception as e:
+            logger.error(f"일괄 분류 오류 (체크포인트 id {after_id}에서 재개 가능): {e}")
+            stats['errors'].append(str(e))
+            if job_id:
+                progress_tracker.fail_collection(job_id, str(e))
+            return self._finish_backlog_stats(stats, started_at)
+        
+        finally:
+            AnnouncementModel.invalidate_cache()
+        
+        stats = self._finish_backlog_stats(stats, started_at)
+        if job_id:
+            progress_tracker.complete_collection(job_id, stats)
+        return stats
+    
+    def _finish_backlog_stats(self, stats: Dict, started_at: float) -> Dict:
+        """일괄 분류 처리량 계산 및 로깅"""
+        elapsed = time.monotonic() - started_at
+        stats['end_time'] = datetime.now()
+        stats['total_duration'] = elapsed
+        stats['rows_per_second'] = round(stats['processed'] / elapsed, 2) if elapsed else 0.0
+        
+        logger.info("=" * 50)
+        logger.info("미분류 공고 일괄 분류 통계:")
+        logger.info(f"  • 처리: {stats['processed']}/{stats['backlog']}개 ({stats['chunks']}묶음)")
+        logger.info(f"  • 키워드 분류: {stats['keyword_classified']}개")
+        logger.info(f"  • 기관 인덱스 분류: {stats['institution_classified']}개")
+        logger.info(f"  • 로컬 분류: {stats['local_classified']}개")
+        logger.info(f"  • AI 분류: {stats['ai_classified']}개")
+        logger.info(f"  • 분류 실패: {stats['classification_failed']}개")
+        logger.info(f"  • 다른 워커가 처리 중: {stats['claimed_elsewhere']}개")
+        logger.info(f"  • 처리 시간: {elapsed:.2f}초 ({stats['rows_per_second']}건/초)")
+        logger.info("=" * 50)
+        return stats
+    
+    def _perform_local_classification(self, announcements: List[Dict]) -> Tuple[int, List[Dict]]:
+        """
+        로컬 분류 수행
+        
+        Returns:
+            Tuple[int, List[Dict]]: (저장된 분류 수, Gemini로 넘길 공고 리스트)
+        """
+        try:
+            predictions = self.local_classifier.predict_batch(announcements)
+        except Exception as e:
+            logger.error(f"로컬 분류 수행 오류: {e}")
+            return 0, announcements
+        
+        accepted = []
+        remaining = []
+        for announcement, (region_code, confidence) in zip(announcements, predictions):
+            if self.local_classifier.accepts(confidence):
+                accepted.append((announcement, region_code, confidence))
+            else:
+                remaining.append(announcement)
+        
+        updated_ids = AnnouncementModel.bulk_update_classifications([
+            (announcement['id'], region_code, 'local', round(confidence, 2))
+            for announcement, region_code, confidence in accepted
+        ], claimed_by=self.worker_id)
+        
+        # 저장에 실패한 공고는 Gemini 단계에서 다시 시도
+        for announcement, region_code, confidence in accepted:
+            if announcement['id'] not in updated_ids:
+                logger.error(f"로컬 분류 결과 저장 실패: {announcement['id']}")
+                remaining.append(announcement)
+        
+        return len(updated_ids), remaining
     
     def _perform_ai_classification(self, announcements: List[Dict]) -> int:
         """AI 기반 분류 수행"""
@@ -220,29 +848,32 @@ class DataCollectionService:
             # 배치 단위로 AI 분류 수행
             ai_results = self.ai_classifier.classify_batch(announcements)
             
-            classified_count = 0
+            accepted = []
             for announcement, result in zip(announcements, ai_results):
-                if result.region_code and result.confidence >= 0.5:
-                    success = AnnouncementModel.update_classification(
-                        announcement['id'],
-                        result.region_code,
-                        'ai',
-                        result.confidence
-                    )
-                    
-                    if success:
-                        classified_count += 1
-                        logger.debug(f"AI 분류 성공: {announcement['pblancNm']} -> {result.region_code}")
-                    else:
-                        logger.error(f"AI 분류 결과 저장 실패: {announcement['id']}")
+                if self.ai_classifier.accepts(result):
+                    accepted.append((announcement, result))
                 else:
                     logger.warning(f"AI 분류 실패: {announcement['pblancNm']} (confidence: {result.confidence})")
             
+            updated_ids = AnnouncementModel.bulk_update_classifications([
+                (announcement['id'], result.region_code, 'ai', result.confidence)
+                for announcement, result in accepted
+            ], claimed_by=self.worker_id)
+            
+            classified_count = 0
+            for announcement, result in accepted:
+                if announcement['id'] in updated_ids:
+                    classified_count += 1
+                    logger.debug(f"AI 분류 성공: {announcement['pblancNm']} -> {result.region_code}")
+                else:
+                    logger.error(f"AI 분류 결과 저장 실패: {announcement['id']}")
+            
             # AI 사용량 통계 로깅
             usage_stats = self.ai_classifier.get_usage_stats()
             logger.info(f"AI API 사용량 - 요청: {usage_stats['total_requests']}, "
                        f"성공률: {usage_stats['success_rate']}%, "
-                       f"토큰: {usage_stats['total_tokens_used']}")
+                       f"토큰: {usage_stats['total_tokens_used']}, "
+                       f"캐시 적중: {usage_stats['cache_hits']}개 ({usage_stats['cache_hit_rate']}%)")
             
             return classified_count
             
@@ -254,13 +885,22 @@ class DataCollectionService:
         """최종 통계 로깅"""
         logger.info("=" * 50)
         logger.info("데이터 수집 및 분류 완료 통계:")
-        logger.info(f"  • 총 수집: {stats['total_fetched']}개")
-        logger.info(f"  • 신규 공고: {stats['new_announcements']}개")
-        logger.info(f"  • DB 삽입: {stats['db_inserted']}개")
+        logger.info(f"  • 총 수집: {stats['total_fetched']}개 ({stats['pages_fetched']}페이지)")
+        for tag, tag_yield in stats['hashtag_yield'].items():
+            logger.info(f"    - #{tag}: {tag_yield['fetched']}개 (이 해시태그에서만 {tag_yield['exclusive']}개)")
+        logger.info(f"  • 신규 공고: {stats['new_announcements']}개 (변경된 기존 공고: {stats['changed_announcements']}개)")
+        logger.info(f"  • DB 삽입: {stats['db_inserted']}개 (갱신: {stats['db_updated']}개, "
+                   f"재분류 대상: {len(stats.get('reclassify_ids', []))}개)")
         logger.info(f"  • 키워드 분류: {stats['keyword_classified']}개")
+        logger.info(f"  • 기관 인덱스 분류: {stats.get('institution_classified', 0)}개")
+        logger.info(f"  • 로컬 분류: {stats.get('local_classified', 0)}개")
         logger.info(f"  • AI 분류: {stats.get('ai_classified', 0)}개")
         logger.info(f"  • 분류 실패: {stats['classification_failed']}개")
         logger.info(f"  • 처리 시간: {stats.get('total_duration', 0):.2f}초")
+        for name, label in PIPELINE_STAGES.items():
+            if name in stats.get('stages', {}):
+                stage = stats['stages'][name]
+                logger.info(f"    - {label}: {stage['count']}개, {stage['seconds']:.2f}초 ({stage['rows_per_second']}건/초)")
         
         if stats.get('errors'):
             logger.warning(f"  • 오류 발생: {len(stats['errors'])}건")
@@ -291,7 +931,50 @@ def run_data_collection():
         logger.error(f"데이터 수집 실행 오류: {e}")
         return {'error': str(e)}
 
+def run_backlog_drain(chunk_size: int = None, workers: int = None, resume: bool = True):
+    """미분류 공고 일괄 분류 실행 함수"""
+    try:
+        service = DataCollectionService()
+        return service.drain_classification_backlog(
+            chunk_size=chunk_size or int(os.getenv('BACKLOG_CHUNK_SIZE', '500')),
+            workers=workers or int(os.getenv('BACKLOG_WORKERS', '4')),
+            resume=resume
+        )
+    
+    except Exception as e:
+        logger.error(f"일괄 분류 실행 오류: {e}")
+        return {'error': str(e)}
+
+def run_backfill(search_cnt: int, chunk_size: int = None):
+    """대량 수집 실행 함수 (분류는 run_backlog_drain으로 수행)"""
+    try:
+        service = DataCollectionService()
+        return service.backfill_announcements(
+            search_cnt, chunk_size=chunk_size or int(os.getenv('BACKLOG_CHUNK_SIZE', '500'))
+        )
+    
+    except Exception as e:
+        logger.error(f"대량 수집 실행 오류: {e}")
+        return {'error': str(e)}
+
 if __name__ == "__main__":
-    # 직접 실행시 데이터 수집 수행
-    result = run_data_collection()
-    print("\\n데이터 수집 결과:", result)
\ No newline at end of file
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="데이터 수집 및 분류")
+    parser.add_argument('--backfill', type=int, metavar='N', help="공고 N개를 스트리밍으로 대량 수집")
+    parser.add_argument('--drain-backlog', action='store_true', help="미분류 공고 전체 일괄 분류")
+    parser.add_argument('--chunk-size', type=int, default=None)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--restart', action='store_true', help="체크포인트를 무시하고 처음부터 분류")
+    args = parser.parse_args()
+    
+    if args.backfill:
+        result = run_backfill(args.backfill, args.chunk_size)
+        print("\n대량 수집 결과:", result)
+    elif args.drain_backlog:
+        result = run_backlog_drain(args.chunk_size, args.workers, resume=not args.restart)
+        print("\n일괄 분류 결과:", result)
+    else:
+        # 직접 실행시 데이터 수집 수행
+        result = run_data_collection()
+        print("\n데이터 수집 결과:", result)
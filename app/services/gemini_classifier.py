@@ -3,8 +3,14 @@ Gemini API를 활용한 AI 기반 지역 분류 모듈
 """
 
 import os
+import re
 import json
 import time
+import random
+import hashlib
+import unicodedata
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
 import logging
@@ -17,8 +23,50 @@ except ImportError:
     print("pip install google-generativeai 로 설치해주세요.")
     genai = None
 
+try:
+    from google.api_core.exceptions import ResourceExhausted
+except ImportError:
+    ResourceExhausted = None
+
+from app.utils.rate_limiter import RateLimiter
+from app.models.ai_classification_cache import AIClassificationCacheModel
+
 logger = logging.getLogger(__name__)
 
+DEFAULT_MODEL_NAME = "gemini-2.5-flash-lite"
+
+# 프롬프트(분류 기준/응답 형식)를 바꾸면 올려서 이전 캐시 결과를 무효화
+PROMPT_VERSION = 1
+
+# 캐시 키에 포함되는 필드와 프롬프트에 들어가는 최대 길이 (_create_batch_prompt와 동일)
+CACHE_KEY_FIELDS = [('pblancNm', None), ('jrsdInsttNm', None), ('excInsttNm', None),
+                    ('bsnsSumryCn', 200), ('refrncNm', None)]
+
+# 이 신뢰도 미만의 결과는 채택하지 않음 (캐시에도 저장하지 않아 다음 분류 때 다시 질의)
+MIN_ACCEPT_CONFIDENCE = 0.5
+
+# 예전 응답/캐시에 남아 있을 수 있는 시군 코드 -> regions 테이블 코드
+LEGACY_REGION_CODES = {
+    'CHANGWON': 'GYEONGNAM_01',
+    'JINJU': 'GYEONGNAM_02',
+    'TONGYEONG': 'GYEONGNAM_03',
+    'SACHEON': 'GYEONGNAM_04',
+    'GIMHAE': 'GYEONGNAM_05',
+    'MIRYANG': 'GYEONGNAM_06',
+    'GEOJE': 'GYEONGNAM_07',
+    'YANGSAN': 'GYEONGNAM_08',
+    'UIRYEONG': 'GYEONGNAM_09',
+    'HAMAN': 'GYEONGNAM_10',
+    'CHANGNYEONG': 'GYEONGNAM_11',
+    'GOSEONG': 'GYEONGNAM_12',
+    'NAMHAE': 'GYEONGNAM_13',
+    'HADONG': 'GYEONGNAM_14',
+    'SANCHEONG': 'GYEONGNAM_15',
+    'HAMYANG': 'GYEONGNAM_16',
+    'GEOCHANG': 'GYEONGNAM_17',
+    'HAPCHEON': 'GYEONGNAM_18',
+}
+
 @dataclass
 class AIClassificationResult:
     """AI 분류 결과 데이터 클래스"""
@@ -28,43 +76,73 @@ class AIClassificationResult:
     reason: str = ''
     api_usage: Dict = None
 
+def _is_rate_limit_error(error: Exception) -> bool:
+    """429 / 할당량 초과 오류 여부"""
+    if ResourceExhausted is not None and isinstance(error, ResourceExhausted):
+        return True
+    message = str(error).lower()
+    return '429' in message or 'resource exhausted' in message or 'quota' in message
+
 class GeminiClassifier:
     """Gemini API 기반 지역 분류기"""
     
-    def __init__(self, api_key: str, model_name: str = "gemini-2.5-flash-lite"):
+    def __init__(self, api_key: str, model_name: Optional[str] = None):
         if not genai:
             raise ImportError("google-generativeai 패키지가 필요합니다.")
             
         self.api_key = api_key
-        self.model_name = model_name
-        self.batch_size = 4
+        self.model_name = model_name or os.getenv('GEMINI_MODEL', DEFAULT_MODEL_NAME)
+        
+        # 배치 크기: 공고별 예상 토큰 수로 프롬프트가 목표 크기에 가깝도록 동적으로 결정
+        self.target_prompt_tokens = int(os.getenv('GEMINI_TARGET_PROMPT_TOKENS', '6000'))
+        self.max_batch_size = int(os.getenv('GEMINI_MAX_BATCH_SIZE', '25'))
+        self.output_tokens_per_item = 100  # 응답 JSON 한 항목의 예상 토큰 수
+        self._batch_size_cap = self.max_batch_size  # 응답이 잘리면 줄이고 성공하면 천천히 복구
+        self._token_ratio = 1.0  # 실제/추정 프롬프트 토큰 비율 (응답 메타데이터로 보정)
+        
+        # 결과가 누락/무효인 공고만 더 작은 배치로 다시 보내는 횟수
+        self.item_retry_attempts = int(os.getenv('GEMINI_ITEM_RETRY_ATTEMPTS', '2'))
+        
+        # 동시 실행 및 호출 한도 (Gemini 요금제 할당량에 맞게 조정)
+        self.max_concurrency = int(os.getenv('GEMINI_MAX_CONCURRENCY', '4'))
+        self.max_retries = int(os.getenv('GEMINI_MAX_RETRIES', '3'))
+        self.backoff_base = float(os.getenv('GEMINI_BACKOFF_BASE', '2'))
+        self.rate_limiter = RateLimiter(
+            requests_per_minute=float(os.getenv('GEMINI_RPM', '15')),
+            tokens_per_minute=float(os.getenv('GEMINI_TPM', '250000')),
+            max_in_flight=self.max_concurrency
+        )
+        self._stats_lock = threading.Lock()
+        
+        # 콘텐츠 해시 기반 분류 결과 캐시 (재공고된 동일 사업의 재호출 방지)
+        self.use_cache = os.getenv('AI_CLASSIFICATION_CACHE', 'true').lower() == 'true'
+        self.cache_max_age_days = int(os.getenv('AI_CLASSIFICATION_CACHE_TTL_DAYS', '180'))
         
         # API 설정
         genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel(model_name)
         
-        # 지역 코드 매핑 (AI가 이해할 수 있도록 설명 추가)
+        # 지역 코드 매핑 (AI가 이해할 수 있도록 설명 추가, 코드는 regions 테이블과 동일해야 저장 가능)
         self.region_mapping = {
             'ALL': '전국 (모든 지역 대상)',
             'GYEONGNAM': '경상남도 (광역자치단체)',
-            'CHANGWON': '창원시 (경남 시)',
-            'GIMHAE': '김해시 (경남 시)',
-            'JINJU': '진주시 (경남 시)',
-            'YANGSAN': '양산시 (경남 시)',
-            'GEOJE': '거제시 (경남 시)',
-            'TONGYEONG': '통영시 (경남 시)',
-            'SACHEON': '사천시 (경남 시)',
-            'MIRYANG': '밀양시 (경남 시)',
-            'HAMAN': '함안군 (경남 군)',
-            'CHANGNYEONG': '창녕군 (경남 군)',
-            'GOSEONG': '고성군 (경남 군)',
-            'NAMHAE': '남해군 (경남 군)',
-            'HADONG': '하동군 (경남 군)',
-            'SANCHEONG': '산청군 (경남 군)',
-            'HAMYANG': '함양군 (경남 군)',
-            'GEOCHANG': '거창군 (경남 군)',
-            'HAPCHEON': '합천군 (경남 군)',
-            'UIRYEONG': '의령군 (경남 군)',
+            'GYEONGNAM_01': '창원시 (경남 시)',
+            'GYEONGNAM_02': '진주시 (경남 시)',
+            'GYEONGNAM_03': '통영시 (경남 시)',
+            'GYEONGNAM_04': '사천시 (경남 시)',
+            'GYEONGNAM_05': '김해시 (경남 시)',
+            'GYEONGNAM_06': '밀양시 (경남 시)',
+            'GYEONGNAM_07': '거제시 (경남 시)',
+            'GYEONGNAM_08': '양산시 (경남 시)',
+            'GYEONGNAM_09': '의령군 (경남 군)',
+            'GYEONGNAM_10': '함안군 (경남 군)',
+            'GYEONGNAM_11': '창녕군 (경남 군)',
+            'GYEONGNAM_12': '고성군 (경남 군)',
+            'GYEONGNAM_13': '남해군 (경남 군)',
+            'GYEONGNAM_14': '하동군 (경남 군)',
+            'GYEONGNAM_15': '산청군 (경남 군)',
+            'GYEONGNAM_16': '함양군 (경남 군)',
+            'GYEONGNAM_17': '거창군 (경남 군)',
+            'GYEONGNAM_18': '합천군 (경남 군)',
             # 기타 주요 광역시도
             'SEOUL': '서울특별시',
             'BUSAN': '부산광역시',
@@ -84,14 +162,69 @@ class GeminiClassifier:
             'JEJU': '제주특별자치도'
         }
         
+        # JSON 스키마 응답 (지역 코드를 enum으로 제한해 파싱/검증 실패를 줄임)
+        generation_config = None
+        if os.getenv('GEMINI_STRUCTURED_OUTPUT', 'true').lower() == 'true':
+            generation_config = {
+                'response_mime_type': 'application/json',
+                'response_schema': self._response_schema()
+            }
+        self.model = genai.GenerativeModel(self.model_name, generation_config=generation_config)
+        
         # API 사용량 추적
         self.api_usage_stats = {
             'total_requests': 0,
             'successful_requests': 0,
             'failed_requests': 0,
-            'total_tokens_used': 0
+            'total_tokens_used': 0,
+            'cache_hits': 0,
+            'cache_misses': 0,
+            'deduplicated': 0,
+            'prompt_tokens': 0,
+            'output_tokens': 0,
+            'retry_requests': 0,
+            'retried_items': 0
+        }
+    
+    def _response_schema(self) -> Dict:
+        """배치 응답 JSON 스키마"""
+        return {
+            'type': 'object',
+            'properties': {
+                'results': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'object',
+                        'properties': {
+                            'announcement_id': {'type': 'integer'},
+                            'region_code': {'type': 'string', 'enum': list(self.region_mapping)},
+                            'confidence': {'type': 'number'},
+                            'reason': {'type': 'string'}
+                        },
+                        'required': ['announcement_id', 'region_code', 'confidence', 'reason']
+                    }
+                }
+            },
+            'required': ['results']
         }
     
+    @staticmethod
+    def content_hash(announcement: Dict) -> str:
+        """
+        프롬프트에 들어가는 필드를 정규화(NFKC, 공백 정리, 소문자)한 SHA-256 해시
+        
+        pblancId처럼 분류에 쓰이지 않는 값은 제외하므로 재공고된 같은 사업은 같은 해시가 됩니다.
+        """
+        parts = [f'v{PROMPT_VERSION}']
+        for field, max_length in CACHE_KEY_FIELDS:
+            value = announcement.get(field) or ''
+            if max_length:
+                value = value[:max_length]
+            value = unicodedata.normalize('NFKC', value)
+            parts.append(re.sub(r'\s+', ' ', value).strip().lower())
+        
+        return hashlib.sha256('\x1f'.join(parts).encode('utf-8')).hexdigest()
+    
     def classify_batch(self, announcements: List[Dict]) -> List[AIClassificationResult]:
         """
         여러 공고를 배치로 분류합니다.
@@ -102,80 +235,285 @@ class GeminiClassifier:
         Returns:
             List[AIClassificationResult]: 분류 결과 리스트
         """
-        results = []
+        if not announcements:
+            return []
+        
+        hashes = [self.content_hash(announcement) for announcement in announcements]
+        cached = self._load_cached_results(hashes)
+        
+        # 캐시에 없는 공고만 내용별로 한 번씩 분류 (같은 호출 안의 중복도 제거)
+        results = [cached.get(content_hash) for content_hash in hashes]
+        pending = {}
+        for index, content_hash in enumerate(hashes):
+            if results[index] is None:
+                pending.setdefault(content_hash, []).append(index)
+        
+        with self._stats_lock:
+            self.api_usage_stats['cache_hits'] += len(announcements) - sum(len(indexes) for indexes in pending.values())
+            self.api_usage_stats['cache_misses'] += len(pending)
+            self.api_usage_stats['deduplicated'] += sum(len(indexes) - 1 for indexes in pending.values())
+        
+        if pending:
+            fresh_results = self._classify_uncached([announcements[indexes[0]] for indexes in pending.values()])
+            for indexes, result in zip(pending.values(), fresh_results):
+                for index in indexes:
+                    results[index] = result
+            
+            self._store_results(list(pending), fresh_results)
+        
+        return results
+    
+    def _load_cached_results(self, hashes: List[str]) -> Dict[str, AIClassificationResult]:
+        """캐시된 분류 결과를 AIClassificationResult로 변환 (현재 지역 코드에 없거나 채택되지 않는 결과는 무시)"""
+        if not self.use_cache:
+            return {}
+        
+        cached = AIClassificationCacheModel.get_cached(list(set(hashes)), self.model_name, self.cache_max_age_days)
+        
+        return {
+            content_hash: AIClassificationResult(
+                region_code=LEGACY_REGION_CODES.get(entry['region_code'], entry['region_code']),
+                confidence=entry['confidence'],
+                reason=entry['reason'],
+                api_usage={'cache_hit': True, 'model': self.model_name}
+            )
+            for content_hash, entry in cached.items()
+            if LEGACY_REGION_CODES.get(entry['region_code'], entry['region_code']) in self.region_mapping
+            and (entry['confidence'] or 0) >= MIN_ACCEPT_CONFIDENCE
+        }
+    
+    def _store_results(self, hashes: List[str], results: List[AIClassificationResult]):
+        """채택할 수 있는 분류 결과만 캐시에 저장 (API/파싱 실패, 낮은 신뢰도 결과는 제외)"""
+        if not self.use_cache:
+            return
+        
+        AIClassificationCacheModel.store([
+            {
+                'content_hash': content_hash,
+                'region_code': result.region_code,
+                'confidence': result.confidence,
+                'reason': result.reason
+            }
+            for content_hash, result in zip(hashes, results)
+            if self.accepts(result)
+        ], self.model_name)
+    
+    @staticmethod
+    def accepts(result: AIClassificationResult) -> bool:
+        """분류 결과로 저장할 만큼 확실한지"""
+        return bool(result.region_code) and result.confidence >= MIN_ACCEPT_CONFIDENCE
+    
+    def _classify_uncached(self, announcements: List[Dict]) -> List[AIClassificationResult]:
+        """캐시를 거치지 않고 Gemini API로 분류합니다."""
+        batches = self._plan_batches(announcements)
+        
+        # 배치를 동시에 실행하되 호출 속도는 rate_limiter가 할당량에 맞춰 조절
+        workers = min(self.max_concurrency, len(batches))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='gemini') as executor:
+            batch_results = list(executor.map(self._classify_single_batch, batches, range(1, len(batches) + 1)))
+        
+        # executor.map은 입력 순서대로 결과를 돌려주므로 공고 순서가 유지됨
+        return [result for results in batch_results for result in results]
+    
+    def _plan_batches(self, announcements: List[Dict]) -> List[List[Dict]]:
+        """
+        프롬프트 예상 토큰 수가 target_prompt_tokens를 넘지 않도록 공고를 순서대로 묶습니다.
+        
+        지역 목록/지시문 같은 고정 부분은 배치마다 한 번만 들어가므로
+        배치가 클수록 공고당 비용이 줄어듭니다. 공고 하나가 목표를 넘어도 단독 배치로 보냅니다.
+        """
+        overhead = self._estimate_prompt_tokens(self._create_batch_prompt([]))
+        with self._stats_lock:
+            size_cap = max(1, min(self._batch_size_cap, self.max_batch_size))
+        
+        batches = []
+        current, current_tokens = [], overhead
+        for announcement in announcements:
+            tokens = (self._estimate_prompt_tokens(self._format_announcement(len(current) + 1, announcement)) +
+                      self.output_tokens_per_item)
+            if current and (len(current) >= size_cap or current_tokens + tokens > self.target_prompt_tokens):
+                batches.append(current)
+                current, current_tokens = [], overhead
+            current.append(announcement)
+            current_tokens += tokens
         
-        # 배치 크기로 나누어 처리
-        for i in range(0, len(announcements), self.batch_size):
-            batch = announcements[i:i + self.batch_size]
+        if current:
+            batches.append(current)
+        
+        return batches
+    
+    def _classify_single_batch(self, batch: List[Dict], batch_number: int) -> List[AIClassificationResult]:
+        """
+        배치 하나를 분류합니다.
+        
+        결과가 누락되었거나 지역 코드가 무효한 공고만 모아 절반 크기의 배치로
+        item_retry_attempts회까지 다시 보냅니다. 재시도 비용은 실패한 공고 수에만 비례합니다.
+        """
+        results = self._request_batch(batch, batch_number)
+        failed = [index for index, result in enumerate(results) if result.region_code is None]
+        
+        # 다음 호출의 배치 크기 조정 (누락이 있으면 줄이고, 온전하면 천천히 복구)
+        with self._stats_lock:
+            if not failed:
+                self._batch_size_cap = min(self.max_batch_size, self._batch_size_cap + 1)
+            elif len(batch) > 1:
+                self._batch_size_cap = max(1, min(self._batch_size_cap, len(batch) // 2))
+        
+        chunk_size = len(batch)
+        for attempt in range(1, self.item_retry_attempts + 1):
+            if not failed:
+                break
+            
+            chunk_size = max(1, min(chunk_size, len(failed)) // 2)
+            logger.warning(f"분류 실패 공고 재시도 (batch {batch_number}, {attempt}/{self.item_retry_attempts}) - "
+                           f"{len(failed)}건을 {chunk_size}건씩")
+            
+            still_failed = []
+            for start in range(0, len(failed), chunk_size):
+                indexes = failed[start:start + chunk_size]
+                retry_results = self._request_batch([batch[index] for index in indexes],
+                                                    f"{batch_number}-r{attempt}")
+                with self._stats_lock:
+                    self.api_usage_stats['retry_requests'] += 1
+                    self.api_usage_stats['retried_items'] += len(indexes)
+                
+                for index, result in zip(indexes, retry_results):
+                    if result.region_code is None:
+                        still_failed.append(index)
+                    else:
+                        results[index] = result
             
+            failed = still_failed
+        
+        return results
+    
+    def _request_batch(self, batch: List[Dict], batch_number) -> List[AIClassificationResult]:
+        """배치 한 번 호출 (429 응답은 지수 백오프로 재시도, 실패한 공고는 region_code=None)"""
+        attempt = 0
+        
+        while True:
             try:
-                batch_results = self._process_batch(batch)
-                results.extend(batch_results)
+                return self._process_batch(batch)
                 
-                # API 호출 간 잠시 대기 (Rate limiting 방지)
-                if i + self.batch_size < len(announcements):
-                    time.sleep(1)
-                    
             except Exception as e:
-                logger.error(f"배치 처리 오류 (batch {i//self.batch_size + 1}): {e}")
+                if _is_rate_limit_error(e) and attempt < self.max_retries:
+                    delay = self.backoff_base * (2 ** attempt) + random.uniform(0, 1)
+                    attempt += 1
+                    logger.warning(f"Gemini 호출 한도 초과 (batch {batch_number}), "
+                                   f"{delay:.1f}초 후 재시도 ({attempt}/{self.max_retries})")
+                    self.rate_limiter.backoff(delay)
+                    continue
+                
+                logger.error(f"배치 처리 오류 (batch {batch_number}): {e}")
                 
                 # 실패한 배치는 기본값으로 처리
-                for announcement in batch:
-                    results.append(AIClassificationResult(
-                        region_code=None,
-                        confidence=0.0,
-                        reason=f"AI 분류 실패: {str(e)}",
-                        api_usage={'error': str(e)}
-                    ))
+                return [AIClassificationResult(
+                    region_code=None,
+                    confidence=0.0,
+                    reason=f"AI 분류 실패: {str(e)}",
+                    api_usage={'error': str(e)}
+                ) for _ in batch]
+    
+    @staticmethod
+    def _estimate_tokens(text: str) -> int:
+        """한글 위주 텍스트의 토큰 수 보수적 추정 (약 2자당 1토큰)"""
+        return max(1, len(text) // 2)
+    
+    def _estimate_prompt_tokens(self, text: str) -> int:
+        """실제 사용량으로 보정한 프롬프트 토큰 수 추정"""
+        return max(1, int(self._estimate_tokens(text) * self._token_ratio))
+    
+    def _record_usage(self, response, prompt: str) -> Dict:
+        """
+        응답의 usage_metadata로 실제 토큰 사용량을 기록합니다.
         
-        return results
+        메타데이터가 없으면 추정값을 사용합니다.
+        """
+        usage = getattr(response, 'usage_metadata', None)
+        prompt_tokens = getattr(usage, 'prompt_token_count', None) or 0
+        output_tokens = getattr(usage, 'candidates_token_count', None) or 0
+        total_tokens = getattr(usage, 'total_token_count', None) or (prompt_tokens + output_tokens)
+        
+        with self._stats_lock:
+            if prompt_tokens:
+                # 추정치를 실제 값 쪽으로 천천히 보정 (지수 이동 평균)
+                observed_ratio = prompt_tokens / self._estimate_tokens(prompt)
+                self._token_ratio = 0.8 * self._token_ratio + 0.2 * observed_ratio
+            else:
+                total_tokens = self._estimate_prompt_tokens(prompt) + self._estimate_tokens(response.text)
+            
+            self.api_usage_stats['prompt_tokens'] += prompt_tokens
+            self.api_usage_stats['output_tokens'] += output_tokens
+            self.api_usage_stats['total_tokens_used'] += total_tokens
+        
+        return {
+            'prompt_tokens': prompt_tokens,
+            'output_tokens': output_tokens,
+            'total_tokens': total_tokens
+        }
     
     def _process_batch(self, batch: List[Dict]) -> List[AIClassificationResult]:
         """배치 데이터를 처리합니다."""
         
         # 프롬프트 생성
         prompt = self._create_batch_prompt(batch)
+        reserved_tokens = self._estimate_prompt_tokens(prompt) + self.output_tokens_per_item * len(batch)
         
         # API 호출
-        start_time = time.time()
-        response = self.model.generate_content(prompt)
-        end_time = time.time()
+        with self.rate_limiter.acquire(reserved_tokens):
+            start_time = time.time()
+            try:
+                response = self.model.generate_content(prompt)
+            except Exception:
+                with self._stats_lock:
+                    self.api_usage_stats['total_requests'] += 1
+                    self.api_usage_stats['failed_requests'] += 1
+                raise
+            end_time = time.time()
         
         # 사용량 통계 업데이트
-        self.api_usage_stats['total_requests'] += 1
+        with self._stats_lock:
+            self.api_usage_stats['total_requests'] += 1
         
         if response and response.text:
-            self.api_usage_stats['successful_requests'] += 1
+            with self._stats_lock:
+                self.api_usage_stats['successful_requests'] += 1
             
-            # 토큰 수 추정 (정확한 값은 API 응답에 따라 다를 수 있음)
-            estimated_tokens = len(prompt.split()) + len(response.text.split())
-            self.api_usage_stats['total_tokens_used'] += estimated_tokens
+            token_usage = self._record_usage(response, prompt)
+            self.rate_limiter.record_usage(reserved_tokens, token_usage['total_tokens'])
             
             # 응답 파싱
             return self._parse_batch_response(response.text, batch, {
                 'request_time': end_time - start_time,
-                'estimated_tokens': estimated_tokens
+                'batch_size': len(batch),
+                **token_usage
             })
         else:
-            self.api_usage_stats['failed_requests'] += 1
+            with self._stats_lock:
+                self.api_usage_stats['failed_requests'] += 1
             raise Exception("API 응답이 비어있습니다.")
     
+    @staticmethod
+    def _format_announcement(index: int, announcement: Dict) -> str:
+        """프롬프트에 들어가는 공고 한 건"""
+        return f"""
+=== 공고 {index} ===
+공고명: {announcement.get('pblancNm') or ''}
+소관기관: {announcement.get('jrsdInsttNm') or ''}
+수행기관: {announcement.get('excInsttNm') or ''}
+사업개요: {(announcement.get('bsnsSumryCn') or '')[:200]}...
+문의처: {announcement.get('refrncNm') or ''}
+
+"""
+    
     def _create_batch_prompt(self, batch: List[Dict]) -> str:
         """배치 처리용 프롬프트를 생성합니다."""
         
         region_list = "\n".join([f"- {code}: {desc}" for code, desc in self.region_mapping.items()])
         
-        announcements_text = ""
-        for i, announcement in enumerate(batch, 1):
-            announcements_text += f"""
-=== 공고 {i} ===
-공고명: {announcement.get('pblancNm', '')}
-소관기관: {announcement.get('jrsdInsttNm', '')}
-수행기관: {announcement.get('excInsttNm', '')}
-사업개요: {announcement.get('bsnsSumryCn', '')[:200]}...
-문의처: {announcement.get('refrncNm', '')}
-
-"""
+        announcements_text = "".join(
+            self._format_announcement(i, announcement) for i, announcement in enumerate(batch, 1)
+        )
         
         prompt = f"""
 당신은 한국의 정부지원사업 데이터를 지역별로 분류하는 전문가입니다.
@@ -202,7 +540,7 @@ class GeminiClassifier:
       "announcement_id": 1,
       "region_code": "GYEONGNAM",
       "confidence": 0.85,
-      "reason": "공고명에 [경남] 패턴 확인, 사천시는 경남소속"
+      "reason": "공고명에 [경남] 패턴 확인, 경남 전역 대상"
     }},
     {{
       "announcement_id": 2,
@@ -215,20 +553,35 @@ class GeminiClassifier:
 
 중요: 
 - 반드시 JSON 형식으로만 응답
-- 17개 광역시도 코드만 사용 (기초지자체 코드 금지)
-- 고령군, 봉화군 등 기초지자체는 GYEONGBUK으로 분류
-- 창원시, 진주시 등 경남 시군은 GYEONGNAM으로 분류
+- 【가능한 지역 코드】 목록에 있는 코드만 사용
+- 경남 시군 사업은 해당 시군 코드로 분류 (예: 창원시 GYEONGNAM_01, 진주시 GYEONGNAM_02)
+- 경남 전역이나 여러 시군 대상 사업은 GYEONGNAM으로 분류
+- 경남 외 기초지자체는 소속 광역시도 코드로 분류 (예: 고령군, 봉화군은 GYEONGBUK)
 - 확신이 없는 경우 confidence를 낮게 설정
 """
         
         return prompt
     
-    def _parse_batch_response(self, response_text: str, batch: List[Dict], usage_info: Dict) -> List[AIClassificationResult]:
-        """API 응답을 파싱하여 결과를 반환합니다."""
+    def _parse_batch_response(self, response_text: str, batch: List[Dict],
+                              usage_info: Dict) -> List[AIClassificationResult]:
+        """
+        API 응답을 파싱하여 결과를 반환합니다.
+        
+        결과는 announcement_id(배치 내 1부터의 번호)로 공고와 짝지으며,
+        누락되었거나 지역 코드/신뢰도가 무효한 공고는 region_code=None으로 채웁니다.
+        """
+        
+        def failure(reason: str, **extra) -> AIClassificationResult:
+            return AIClassificationResult(
+                region_code=None,
+                confidence=0.0,
+                reason=reason,
+                api_usage={**usage_info, **extra}
+            )
         
         try:
             # JSON 응답 파싱
-            # 응답에서 JSON 부분만 추출
+            # 응답에서 JSON 부분만 추출 (스키마 응답이 아닐 때를 대비)
             json_start = response_text.find('{')
             json_end = response_text.rfind('}') + 1
             
@@ -241,55 +594,55 @@ class GeminiClassifier:
             if 'results' not in response_data:
                 raise ValueError("응답에 results 키가 없습니다.")
             
-            results = []
-            for i, result_data in enumerate(response_data['results']):
-                if i >= len(batch):
-                    break
-                
-                region_code = result_data.get('region_code')
-                confidence = float(result_data.get('confidence', 0.0))
-                reason = result_data.get('reason', '')
-                
-                # 지역 코드 유효성 검사
-                if region_code not in self.region_mapping:
-                    logger.warning(f"유효하지 않은 지역 코드: {region_code}")
-                    region_code = None
-                    confidence = 0.0
-                    reason = f"유효하지 않은 지역 코드: {region_code}"
-                
-                results.append(AIClassificationResult(
-                    region_code=region_code,
-                    confidence=confidence,
-                    reason=reason,
-                    api_usage={
-                        **usage_info,
-                        'model': self.model_name,
-                        'timestamp': datetime.now().isoformat()
-                    }
-                ))
-            
-            # 결과 수가 배치 크기와 다를 경우 부족한 부분을 기본값으로 채움
-            while len(results) < len(batch):
-                results.append(AIClassificationResult(
-                    region_code=None,
-                    confidence=0.0,
-                    reason="AI 응답 파싱 오류 - 결과 누락",
-                    api_usage=usage_info
-                ))
-            
-            return results
-            
         except Exception as e:
             logger.error(f"응답 파싱 오류: {e}")
             logger.error(f"응답 텍스트: {response_text[:500]}...")
             
             # 파싱 실패시 기본값 반환
-            return [AIClassificationResult(
-                region_code=None,
-                confidence=0.0,
-                reason=f"AI 응답 파싱 실패: {str(e)}",
-                api_usage={**usage_info, 'parse_error': str(e)}
-            ) for _ in batch]
+            return [failure(f"AI 응답 파싱 실패: {str(e)}", parse_error=str(e)) for _ in batch]
+        
+        results = [None] * len(batch)
+        for position, result_data in enumerate(response_data['results'], 1):
+            if not isinstance(result_data, dict):
+                continue
+            
+            # announcement_id가 없거나 범위를 벗어나면 응답 순서로 대응
+            try:
+                index = int(result_data.get('announcement_id', position)) - 1
+            except (TypeError, ValueError):
+                index = position - 1
+            if not 0 <= index < len(batch) or results[index] is not None:
+                continue
+            
+            region_code = result_data.get('region_code')
+            region_code = LEGACY_REGION_CODES.get(region_code, region_code)
+            reason = result_data.get('reason', '')
+            
+            # 지역 코드/신뢰도 유효성 검사
+            if region_code not in self.region_mapping:
+                logger.warning(f"유효하지 않은 지역 코드: {region_code}")
+                results[index] = failure(f"유효하지 않은 지역 코드: {region_code}")
+                continue
+            
+            try:
+                confidence = float(result_data.get('confidence', 0.0))
+            except (TypeError, ValueError):
+                results[index] = failure(f"유효하지 않은 신뢰도: {result_data.get('confidence')}")
+                continue
+            
+            results[index] = AIClassificationResult(
+                region_code=region_code,
+                confidence=confidence,
+                reason=reason,
+                api_usage={
+                    **usage_info,
+                    'model': self.model_name,
+                    'timestamp': datetime.now().isoformat()
+                }
+            )
+        
+        # 응답에 없는 공고는 기본값으로 채움
+        return [result or failure("AI 응답 파싱 오류 - 결과 누락") for result in results]
     
     def get_usage_stats(self) -> Dict:
         """API 사용량 통계를 반환합니다."""
@@ -298,9 +651,16 @@ class GeminiClassifier:
             success_rate = (self.api_usage_stats['successful_requests'] / 
                           self.api_usage_stats['total_requests']) * 100
         
+        # 분류 요청된 공고 중 캐시로 처리된 비율
+        lookups = (self.api_usage_stats['cache_hits'] + self.api_usage_stats['cache_misses'] +
+                   self.api_usage_stats['deduplicated'])
+        cache_hit_rate = self.api_usage_stats['cache_hits'] / lookups * 100 if lookups else 0
+        
         return {
             **self.api_usage_stats,
+            'rate_limiter': self.rate_limiter.get_stats(),
             'success_rate': round(success_rate, 2),
+            'cache_hit_rate': round(cache_hit_rate, 2),
             'average_tokens_per_request': (
                 self.api_usage_stats['total_tokens_used'] // 
                 max(self.api_usage_stats['successful_requests'], 1)
@@ -309,12 +669,20 @@ class GeminiClassifier:
     
     def reset_usage_stats(self):
         """사용량 통계를 초기화합니다."""
-        self.api_usage_stats = {
-            'total_requests': 0,
-            'successful_requests': 0,
-            'failed_requests': 0,
-            'total_tokens_used': 0
-        }
+        with self._stats_lock:
+            self.api_usage_stats = {
+                'total_requests': 0,
+                'successful_requests': 0,
+                'failed_requests': 0,
+                'total_tokens_used': 0,
+                'cache_hits': 0,
+                'cache_misses': 0,
+                'deduplicated': 0,
+                'prompt_tokens': 0,
+                'output_tokens': 0,
+                'retry_requests': 0,
+                'retried_items': 0
+            }
 
 def test_gemini_classifier():
     """Gemini 분류기 테스트 함수"""
@@ -4,7 +4,7 @@
 """
 
 from .gyeongnam_region_service import gyeongnam_region_service
-from .gemini_classifier import GeminiClassifier
+from .institution_index import institution_region_index
 import logging
 
 logger = logging.getLogger(__name__)
@@ -14,22 +14,32 @@ class GyeongnamRegionClassifier:
     
     def __init__(self):
         self.region_service = gyeongnam_region_service
-        
-        # Gemini API 키가 있는 경우에만 AI 분류기 초기화
-        import os
-        gemini_api_key = os.getenv('GEMINI_API_KEY')
-        if gemini_api_key:
-            try:
-                self.ai_classifier = GeminiClassifier(gemini_api_key)
-            except Exception as e:
-                logger.warning(f"Gemini AI 분류기 초기화 실패: {e}")
-                self.ai_classifier = None
-        else:
-            self.ai_classifier = None
+        self.institution_index = institution_region_index
     
     def classify_announcement(self, announcement_data):
-        """공고 데이터 지역 분류"""
+        """
+        공고 데이터 지역 분류 (기관 인덱스 → 키워드)
+        
+        AI 분류는 여기서 하지 않습니다. 신뢰도가 낮은 결과는 수집기가 모아서
+        로컬 분류기와 Gemini 배치 분류로 넘깁니다.
+        """
         try:
+            # 0차: 분류 이력 기반 기관 → 지역 조회
+            try:
+                institution_match = self.institution_index.lookup(announcement_data)
+            except Exception as e:
+                logger.warning(f"기관-지역 인덱스 조회 실패: {e}")
+                institution_match = None
+            
+            # 전국(ALL)으로 정해진 기관(중앙부처 등)은 공고에 지역이 명시되어 있으면 키워드 결과를 따름
+            if institution_match and institution_match[0] != 'ALL':
+                region_code, confidence, _ = institution_match
+                return ClassificationResult(
+                    region_code=region_code,
+                    confidence=confidence,
+                    method='institution'
+                )
+            
             # 1차: 키워드 기반 분류
             result = self.region_service.classify_announcement(announcement_data)
             
@@ -41,20 +51,14 @@ class GyeongnamRegionClassifier:
                     method='keyword'
                 )
             
-            # 2차: AI 분류 (신뢰도가 낮은 경우)
-            if self.ai_classifier:
-                try:
-                    ai_result = self.ai_classifier.classify_region(announcement_data)
-                    if ai_result and ai_result.confidence >= 0.6:
-                        # AI 결과를 경남 21개 지역 시스템에 매핑
-                        mapped_code = self._map_ai_result_to_gyeongnam(ai_result.region_code)
-                        return ClassificationResult(
-                            region_code=mapped_code,
-                            confidence=ai_result.confidence,
-                            method='ai'
-                        )
-                except Exception as e:
-                    logger.warning(f"AI 분류 실패: {e}")
+            # 키워드로 지역을 찾지 못했으면 기관 인덱스의 전국 판정 사용
+            if institution_match:
+                region_code, confidence, _ = institution_match
+                return ClassificationResult(
+                    region_code=region_code,
+                    confidence=confidence,
+                    method='institution'
+                )
             
             # 기본값: 전국
             return ClassificationResult(
@@ -70,27 +74,6 @@ class GyeongnamRegionClassifier:
                 confidence=0.0,
                 method='error'
             )
-    
-    def _map_ai_result_to_gyeongnam(self, ai_region_code):
-        """AI 분류 결과를 경남 시스템에 매핑"""
-        # 경남 관련 코드 매핑
-        gyeongnam_mapping = {
-            'GYEONGNAM': 'GYEONGNAM',
-            'GYEONGNAM_01': 'GYEONGNAM_01',  # 창원
-            'GYEONGNAM_02': 'GYEONGNAM_02',  # 진주
-            # ... 기타 경남 지역 매핑
-        }
-        
-        # AI가 경남 지역으로 분류했으면 해당 코드 반환
-        if ai_region_code in gyeongnam_mapping:
-            return gyeongnam_mapping[ai_region_code]
-        
-        # AI가 경남 이외 지역으로 분류했으면 OTHER 반환
-        if ai_region_code and ai_region_code != 'ALL':
-            return 'OTHER'
-        
-        # 그 외는 전국
-        return 'ALL'
 
 class ClassificationResult:
     """분류 결과 클래스"""
@@ -1,29 +1,47 @@
 """
 경상남도 특화 지역 분류 서비스
-21개 지역으로 단순화된 시스템
+
+지역 카탈로그는 regions 테이블(전국 광역시도/시군구 계층)에서 읽어오며,
+SERVED_PROVINCES에 포함된 광역시도는 시군구까지, 나머지는 OTHER로 분류합니다.
+데이터베이스를 사용할 수 없으면 내장된 경남 21개 지역으로 동작합니다.
 """
 
 import os
-import psycopg2
-import psycopg2.extras
+import time
+import threading
+import logging
+from typing import Dict, List
 from dotenv import load_dotenv
 
+from app.models.region import RegionModel
+from .region_catalog import RegionCatalog, KeywordMatch, CLASSIFICATION_FIELDS
+
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# 카탈로그 DB 조회 실패 시 재시도 간격(초)
+CATALOG_RETRY_SECONDS = 300
+
+def _parse_served_provinces(value: str):
+    """SERVED_PROVINCES 환경변수 파싱 ('ALL'이면 전체 → None)"""
+    codes = {code.strip().upper() for code in (value or '').split(',') if code.strip()}
+    if not codes or 'ALL' in codes:
+        return None
+    return codes
+
 class GyeongnamRegionMapper:
     """경남 특화 지역 매핑 클래스"""
     
     def __init__(self):
-        self.db_config = {
-            'host': os.getenv('SUPABASE_HOST'),
-            'user': os.getenv('SUPABASE_USER', 'postgres'),
-            'password': os.getenv('SUPABASE_PASSWORD'),
-            'database': os.getenv('SUPABASE_DB', 'postgres'),
-            'port': int(os.getenv('SUPABASE_PORT', '5432'))
-        }
+        self.served_provinces = _parse_served_provinces(os.getenv('SERVED_PROVINCES', 'GYEONGNAM'))
+        self._catalog = None
+        self._catalog_from_db = False
+        self._catalog_retry_at = 0.0
+        self._catalog_lock = threading.Lock()
         
-        # 21개 지역 데이터
-        self.regions = {
+        # 내장 21개 지역 데이터 (DB 카탈로그를 읽지 못할 때 사용)
+        self.default_regions = {
             'ALL': {'name': '전국', 'type': 'national', 'parent': None},
             'GYEONGNAM': {'name': '경상남도', 'type': 'provincial', 'parent': None},
             'OTHER': {'name': '경남 이외 지역', 'type': 'other', 'parent': None},
@@ -47,7 +65,7 @@ class GyeongnamRegionMapper:
             'GYEONGNAM_18': {'name': '합천군', 'type': 'municipal', 'parent': 'GYEONGNAM'}
         }
         
-        # 경남 지역 키워드 매핑
+        # 내장 카탈로그의 지역 별칭 (경남 지역 키워드 매핑)
         self.keyword_mappings = {
             # 시 지역
             '창원': 'GYEONGNAM_01',
@@ -85,6 +103,69 @@ class GyeongnamRegionMapper:
             '경기', '강원', '충북', '충남', '전북', '전남', '경북', '제주',
             '수도권', '영남권', '호남권', '충청권'
         ]
+        
+    def get_catalog_source(self) -> List[Dict]:
+        """카탈로그 원본 지역 목록 (DB 우선, 실패 시 내장 데이터)"""
+        try:
+            regions = RegionModel.get_all_regions()
+            if regions:
+                return [dict(region) for region in regions]
+        except Exception as e:
+            logger.warning(f"지역 카탈로그 DB 조회 실패, 내장 데이터 사용: {e}")
+        return self._default_catalog_source()
+    
+    def _default_catalog_source(self) -> List[Dict]:
+        """내장 21개 지역 + 키워드 사전을 카탈로그 형식으로 변환"""
+        aliases = {code: [] for code in self.default_regions}
+        for keyword, region_code in self.keyword_mappings.items():
+            aliases[region_code].append(keyword)
+        aliases['OTHER'].extend(self.other_region_keywords)
+        
+        return [
+            {
+                'code': code,
+                'name': info['name'],
+                'type': info['type'],
+                'parent_code': info['parent'],
+                'aliases': aliases[code]
+            }
+            for code, info in self.default_regions.items()
+        ]
+    
+    @property
+    def catalog(self) -> RegionCatalog:
+        """지역 카탈로그 (최초 사용 시 로드, DB 실패 시 내장 데이터로 대체 후 주기적 재시도)"""
+        if self._catalog is not None and (self._catalog_from_db or time.monotonic() < self._catalog_retry_at):
+            return self._catalog
+        
+        with self._catalog_lock:
+            if self._catalog is None or (not self._catalog_from_db and time.monotonic() >= self._catalog_retry_at):
+                self.reload_catalog()
+        return self._catalog
+    
+    def reload_catalog(self) -> RegionCatalog:
+        """regions 테이블에서 카탈로그를 다시 읽어 매칭기를 재컴파일"""
+        try:
+            regions = RegionModel.get_all_regions()
+            from_db = bool(regions)
+        except Exception as e:
+            logger.warning(f"지역 카탈로그 DB 조회 실패, 내장 데이터 사용: {e}")
+            regions, from_db = None, False
+        
+        if not from_db:
+            regions = self._default_catalog_source()
+            self._catalog_retry_at = time.monotonic() + CATALOG_RETRY_SECONDS
+        
+        self._catalog = RegionCatalog([dict(region) for region in regions], self.served_provinces)
+        self._catalog_from_db = from_db
+        logger.info(f"지역 카탈로그 로드 완료 - 지역 {len(self._catalog.regions)}개, "
+                   f"표기 {self._catalog.surface_form_count}개 ({'DB' if from_db else '내장'})")
+        return self._catalog
+    
+    @property
+    def regions(self) -> Dict[str, Dict]:
+        """현재 카탈로그의 지역 정보 {code: {'name', 'type', 'parent', 'aliases'}}"""
+        return self.catalog.regions
     
     def get_region_info(self, region_code):
         """지역 정보 조회"""
@@ -97,51 +178,44 @@ class GyeongnamRegionMapper:
     def get_gyeongnam_cities(self):
         """경남 18개 시군 반환"""
         return {code: info for code, info in self.regions.items() 
-                if info['type'] == 'municipal'}
+                if info['type'] == 'municipal' and info['parent'] == 'GYEONGNAM'}
+    
+    def find_keyword_matches(self, text, field='text') -> List[KeywordMatch]:
+        """텍스트를 한 번 훑어 모든 지역명 매칭을 위치와 함께 반환"""
+        return self.catalog.find_matches({field: text})
+    
+    def find_announcement_matches(self, announcement_data) -> List[KeywordMatch]:
+        """공고의 공고명/기관명/사업개요 필드별 지역명 매칭 반환"""
+        return self.catalog.find_matches({
+            field: announcement_data.get(field) for field in CLASSIFICATION_FIELDS
+        })
+    
+    def select_best_match(self, matches: List[KeywordMatch]):
+        """매칭 중 우선순위가 가장 높은 결과 선택 (없으면 None)"""
+        return RegionCatalog.select_best_match(matches)
     
     def classify_by_keywords(self, text):
         """키워드 기반 지역 분류"""
-        if not text:
-            return None, 0.0
-        
-        text = text.lower()
-        
-        # 경남 세부 지역 먼저 확인
-        for keyword, region_code in self.keyword_mappings.items():
-            if keyword in text:
-                confidence = 0.9 if len(keyword) >= 2 else 0.7
-                return region_code, confidence
+        best_match = self.select_best_match(self.find_keyword_matches(text))
         
-        # 경남 이외 지역 키워드 확인
-        for keyword in self.other_region_keywords:
-            if keyword in text:
-                return 'OTHER', 0.8
+        if best_match:
+            return best_match.region_code, best_match.confidence
         
         return None, 0.0
     
     def classify_announcement(self, announcement_data):
         """공고 데이터 기반 지역 분류"""
-        # 분류할 텍스트 수집
-        search_text = ""
-        
-        if announcement_data.get('pblancNm'):
-            search_text += announcement_data['pblancNm'] + " "
-        if announcement_data.get('jrsdInsttNm'):
-            search_text += announcement_data['jrsdInsttNm'] + " "
-        if announcement_data.get('excInsttNm'):
-            search_text += announcement_data['excInsttNm'] + " "
-        if announcement_data.get('bsnsSumryCn'):
-            search_text += announcement_data['bsnsSumryCn'] + " "
-        
-        # 키워드 기반 분류
-        region_code, confidence = self.classify_by_keywords(search_text)
+        # 필드별 지역명 매칭 (오토마톤으로 필드당 한 번씩만 스캔)
+        matches = self.find_announcement_matches(announcement_data)
+        best_match = self.select_best_match(matches)
         
-        if region_code:
+        if best_match:
             return {
-                'region_code': region_code,
-                'region_name': self.regions[region_code]['name'],
-                'confidence': confidence,
-                'method': 'keyword'
+                'region_code': best_match.region_code,
+                'region_name': self.regions[best_match.region_code]['name'],
+                'confidence': best_match.confidence,
+                'method': 'keyword',
+                'matches': matches
             }
         
         # 분류 실패 시 전국으로 분류
@@ -149,7 +223,8 @@ class GyeongnamRegionMapper:
             'region_code': 'ALL',
             'region_name': '전국',
             'confidence': 0.1,
-            'method': 'default'
+            'method': 'default',
+            'matches': []
         }
 
 # 글로벌 인스턴스
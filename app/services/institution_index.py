@@ -0,0 +1,160 @@
+"""
+기관 → 지역 조회 인덱스
+
+분류 이력에서 쌓인 institution_region_stats를 메모리 딕셔너리로 들고 있다가
+공고의 수행기관/소관기관명으로 지역을 O(1)에 찾습니다.
+근거(support)가 충분하고 한 지역으로 거의 일치하는 기관만 사용하며,
+여러 지역으로 나뉘는 기관(예: 중앙부처의 지역 사업)은 충돌로 표시하고 사용하지 않습니다.
+"""
+
+import os
+import re
+import time
+import threading
+import logging
+from datetime import timedelta
+from typing import Dict, List, Optional, Tuple
+
+from app.models.institution_region import InstitutionRegionModel
+
+logger = logging.getLogger(__name__)
+
+# 기관 필드 조회 순서 (수행기관이 더 구체적인 경우가 많음)
+INSTITUTION_FIELDS = ['excInsttNm', 'jrsdInsttNm']
+
+# 증분 갱신 시 커밋 지연으로 놓치는 행이 없도록 겹쳐 읽는 구간
+REFRESH_OVERLAP = timedelta(minutes=5)
+
+class InstitutionRegionIndex:
+    """분류 이력 기반 기관 → 지역 인덱스"""
+    
+    def __init__(self, min_support: int = None, min_purity: float = None, refresh_interval: float = None):
+        self.min_support = min_support or int(os.getenv('INSTITUTION_MIN_SUPPORT', '3'))
+        self.min_purity = min_purity or float(os.getenv('INSTITUTION_MIN_PURITY', '0.9'))
+        self.refresh_interval = refresh_interval or float(os.getenv('INSTITUTION_INDEX_REFRESH_SECONDS', '60'))
+        
+        self._counts = {}      # 기관 -> {지역 코드: support}
+        self._decisions = {}   # 기관 -> (지역 코드, 신뢰도, support)
+        self._conflicts = {}   # 기관 -> {지역 코드: support}
+        self._watermark = None
+        self._next_refresh = 0.0
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+    
+    @staticmethod
+    def normalize(name: Optional[str]) -> Optional[str]:
+        """기관명 정규화 (migrations/007의 institution_region_normalize와 동일)"""
+        if not name:
+            return None
+        return re.sub(r'\s+', '', name).lower() or None
+    
+    def _decide(self, institution: str):
+        """한 기관의 support 분포로 사용 여부/신뢰도 결정"""
+        counts = self._counts.get(institution)
+        self._decisions.pop(institution, None)
+        self._conflicts.pop(institution, None)
+        
+        if not counts:
+            return
+        
+        total = sum(counts.values())
+        region_code, support = max(counts.items(), key=lambda item: item[1])
+        
+        if len(counts) > 1 and support / total < self.min_purity:
+            self._conflicts[institution] = dict(counts)
+        elif total >= self.min_support:
+            # 라플라스 보정한 일치율 (근거가 적을수록 낮게)
+            confidence = min(0.95, (support + 1) / (total + 2))
+            self._decisions[institution] = (region_code, round(confidence, 2), total)
+    
+    def refresh(self, full: bool = False) -> int:
+        """
+        마지막 갱신 이후 바뀐 통계만 읽어 인덱스를 갱신합니다.
+        
+        Returns:
+            int: 다시 계산한 기관 수 (실패 시 0, 기존 인덱스 유지)
+        """
+        with self._refresh_lock:
+            since = None if full or self._watermark is None else self._watermark - REFRESH_OVERLAP
+            
+            try:
+                rows = InstitutionRegionModel.get_stats(updated_since=since)
+            except Exception as e:
+                logger.error(f"기관-지역 인덱스 갱신 오류: {e}")
+                self._next_refresh = time.monotonic() + self.refresh_interval
+                return 0
+            
+            with self._lock:
+                if since is None:
+                    self._counts, self._decisions, self._conflicts = {}, {}, {}
+                
+                touched = set()
+                for row in rows:
+                    counts = self._counts.setdefault(row['institution'], {})
+                    if row['support'] > 0:
+                        counts[row['region_code']] = row['support']
+                    else:
+                        counts.pop(row['region_code'], None)
+                    touched.add(row['institution'])
+                    if self._watermark is None or row['updated_at'] > self._watermark:
+                        self._watermark = row['updated_at']
+                
+                for institution in touched:
+                    if not self._counts[institution]:
+                        del self._counts[institution]
+                    self._decide(institution)
+            
+            self._next_refresh = time.monotonic() + self.refresh_interval
+            if touched:
+                logger.info(f"기관-지역 인덱스 갱신 - {len(touched)}개 기관 "
+                           f"(사용 {len(self._decisions)}개, 충돌 {len(self._conflicts)}개)")
+            return len(touched)
+    
+    def _maybe_refresh(self):
+        """갱신 주기가 지났으면 갱신 (다른 스레드가 갱신 중이면 기존 인덱스로 바로 조회)"""
+        if time.monotonic() >= self._next_refresh and not self._refresh_lock.locked():
+            self.refresh()
+    
+    def lookup(self, announcement_data: Dict) -> Optional[Tuple[str, float, str]]:
+        """
+        공고의 기관명으로 지역을 찾습니다.
+        
+        수행기관을 먼저 보고, 수행기관으로 정해지지 않을 때만 소관기관을 봅니다
+        (소관기관은 중앙부처처럼 일반적인 경우가 많아 신뢰도가 높아도 수행기관보다 우선하지 않음).
+        
+        Returns:
+            Optional[Tuple[str, float, str]]: (지역 코드, 신뢰도, 기관명) 또는 None
+        """
+        self._maybe_refresh()
+        
+        for field in INSTITUTION_FIELDS:
+            institution = self.normalize(announcement_data.get(field))
+            decision = self._decisions.get(institution) if institution else None
+            if decision:
+                return decision[0], decision[1], announcement_data.get(field)
+        
+        return None
+    
+    def get_conflicts(self, limit: int = 50) -> List[Dict]:
+        """여러 지역으로 나뉘는 기관 목록 (support 합계 내림차순)"""
+        with self._lock:
+            conflicts = [
+                {'institution': institution, 'regions': counts, 'total': sum(counts.values())}
+                for institution, counts in self._conflicts.items()
+            ]
+        conflicts.sort(key=lambda item: -item['total'])
+        return conflicts[:limit]
+    
+    def get_stats(self) -> Dict:
+        with self._lock:
+            return {
+                'institutions': len(self._counts),
+                'usable': len(self._decisions),
+                'conflicts': len(self._conflicts),
+                'min_support': self.min_support,
+                'min_purity': self.min_purity,
+                'last_updated_at': self._watermark.isoformat() if self._watermark else None
+            }
+
+# 글로벌 인스턴스
+institution_region_index = InstitutionRegionIndex()
@@ -0,0 +1,468 @@
+"""
+로컬 지역 분류기 (문자 n-gram TF-IDF + 다항 로지스틱 회귀)
+
+키워드 분류로 확정하지 못한 공고를 Gemini로 보내기 전에 프로세스 안에서 분류합니다.
+수동 분류/고신뢰 AI 분류 결과로 학습하고, 보정 데이터로 온도 스케일링(temperature scaling)을
+보정한 뒤 목표 정밀도를 만족하는 신뢰도 임계값 이상인 결과만 채택합니다.
+
+사용법:
+    python -m app.services.local_classifier train       # 학습 후 모델 파일 저장
+    python -m app.services.local_classifier evaluate    # 저장된 모델을 평가 분할로 평가
+"""
+
+import os
+import json
+import math
+import hashlib
+import re
+import threading
+import unicodedata
+import logging
+from collections import Counter
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL_PATH = os.getenv('LOCAL_CLASSIFIER_PATH', 'models/local_region_classifier.npz')
+
+# (필드, 최대 길이, 특징 접두어) - 같은 n-gram이라도 필드별로 다른 특징으로 취급
+FEATURE_FIELDS = [
+    ('pblancNm', None, 't'),
+    ('jrsdInsttNm', None, 'j'),
+    ('excInsttNm', None, 'e'),
+    ('bsnsSumryCn', 300, 's')
+]
+
+def split_samples(samples: List[Dict], calibration_ratio: float, test_ratio: float,
+                  seed: int) -> Tuple[List[Dict], List[Dict], List[Dict]]:
+    """
+    공고 ID 해시로 학습/보정/평가 데이터를 나눕니다.
+    
+    공고마다 소속이 고정되므로 학습 뒤 데이터가 늘거나 줄어도 같은 seed/비율이면
+    학습이나 보정에 쓴 공고가 평가 데이터로 넘어오지 않습니다 (evaluate 명령이 이 성질에 의존).
+    
+    Returns:
+        Tuple[List[Dict], List[Dict], List[Dict]]: (학습 데이터, 보정 데이터, 평가 데이터)
+    """
+    training, calibration, test = [], [], []
+    for sample in samples:
+        digest = hashlib.md5(f"{seed}:{sample['pblancId']}".encode('utf-8')).digest()
+        bucket = int.from_bytes(digest[:4], 'big') / 2 ** 32
+        if bucket < test_ratio:
+            test.append(sample)
+        elif bucket < test_ratio + calibration_ratio:
+            calibration.append(sample)
+        else:
+            training.append(sample)
+    return training, calibration, test
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("로컬 분류기에는 numpy 패키지가 필요합니다. pip install numpy 로 설치해주세요.")
+
+def _normalize(text: str) -> str:
+    text = unicodedata.normalize('NFKC', text or '')
+    return re.sub(r'\s+', ' ', text).strip().lower()
+
+class CharNgramVectorizer:
+    """필드별 문자 n-gram TF-IDF 벡터화 (희소 행렬은 CSR 배열 세 개로 표현)"""
+    
+    def __init__(self, ngram_range: Tuple[int, int] = (1, 3), min_df: int = 2, max_features: int = 50000):
+        self.ngram_range = ngram_range
+        self.min_df = min_df
+        self.max_features = max_features
+        self.vocabulary = {}
+        self.idf = None
+    
+    def _features(self, announcement: Dict) -> Counter:
+        counts = Counter()
+        low, high = self.ngram_range
+        for field, max_length, prefix in FEATURE_FIELDS:
+            text = announcement.get(field) or ''
+            if max_length:
+                text = text[:max_length]
+            text = _normalize(text)
+            if not text:
+                continue
+            padded = f' {text} '
+            for n in range(low, high + 1):
+                for i in range(len(padded) - n + 1):
+                    gram = padded[i:i + n]
+                    if gram.strip():
+                        counts[f'{prefix}:{gram}'] += 1
+        return counts
+    
+    def fit(self, announcements: List[Dict]) -> 'CharNgramVectorizer':
+        _require_numpy()
+        document_frequency = Counter()
+        for announcement in announcements:
+            document_frequency.update(self._features(announcement).keys())
+        
+        kept = [(feature, df) for feature, df in document_frequency.items() if df >= self.min_df]
+        kept.sort(key=lambda item: (-item[1], item[0]))
+        kept = kept[:self.max_features]
+        
+        self.vocabulary = {feature: index for index, (feature, _) in enumerate(kept)}
+        df = np.array([df for _, df in kept], dtype=np.float64)
+        self.idf = (np.log((1 + len(announcements)) / (1 + df)) + 1).astype(np.float32)
+        return self
+    
+    def transform(self, announcements: List[Dict]):
+        """
+        Returns:
+            (indptr, indices, data): 행마다 L2 정규화된 sublinear TF-IDF CSR 배열
+        """
+        _require_numpy()
+        indptr = [0]
+        indices = []
+        data = []
+        
+        for announcement in announcements:
+            row = [(self.vocabulary[feature], 1 + math.log(count))
+                   for feature, count in self._features(announcement).items()
+                   if feature in self.vocabulary]
+            indices.extend(index for index, _ in row)
+            data.extend(value for _, value in row)
+            indptr.append(len(indices))
+        
+        indptr = np.array(indptr, dtype=np.int64)
+        indices = np.array(indices, dtype=np.int64)
+        data = np.array(data, dtype=np.float32)
+        if len(indices):
+            data *= self.idf[indices]
+            row_ids = np.repeat(np.arange(len(announcements)), np.diff(indptr))
+            norms = np.sqrt(np.bincount(row_ids, weights=data * data, minlength=len(announcements)))
+            data /= np.maximum(norms, 1e-12)[row_ids].astype(np.float32)
+        
+        return indptr, indices, data
+
+def _sparse_dot(csr, weights):
+    """CSR 행렬 × 밀집 행렬 (클래스별 bincount로 벡터화)"""
+    indptr, indices, data = csr
+    rows = len(indptr) - 1
+    row_ids = np.repeat(np.arange(rows), np.diff(indptr))
+    contributions = weights[indices] * data[:, None]
+    return np.stack([
+        np.bincount(row_ids, weights=contributions[:, c], minlength=rows)
+        for c in range(weights.shape[1])
+    ], axis=1)
+
+def _sparse_transpose_dot(csr, gradient, feature_count):
+    """CSR 행렬의 전치 × 밀집 행렬"""
+    indptr, indices, data = csr
+    row_ids = np.repeat(np.arange(len(indptr) - 1), np.diff(indptr))
+    return np.stack([
+        np.bincount(indices, weights=data * gradient[row_ids, c], minlength=feature_count)
+        for c in range(gradient.shape[1])
+    ], axis=1)
+
+def _softmax(logits):
+    shifted = logits - logits.max(axis=1, keepdims=True)
+    exp = np.exp(shifted)
+    return exp / exp.sum(axis=1, keepdims=True)
+
+class LocalRegionClassifier:
+    """보정된 신뢰도를 내는 로컬 지역 분류기"""
+    
+    def __init__(self, vectorizer: CharNgramVectorizer, weights, bias, classes: List[str],
+                 temperature: float = 1.0, threshold: float = 1.01, metadata: Optional[Dict] = None):
+        self.vectorizer = vectorizer
+        self.weights = weights
+        self.bias = bias
+        self.classes = list(classes)
+        self.temperature = temperature
+        self.threshold = threshold
+        self.metadata = metadata or {}
+    
+    # ----- 예측 -----
+    
+    def _logits(self, announcements: List[Dict]):
+        return _sparse_dot(self.vectorizer.transform(announcements), self.weights) + self.bias
+    
+    def predict_proba(self, announcements: List[Dict]):
+        """보정된 클래스 확률 (공고 수 × 클래스 수)"""
+        return _softmax(self._logits(announcements) / self.temperature)
+    
+    def predict_batch(self, announcements: List[Dict]) -> List[Tuple[str, float]]:
+        """
+        여러 공고를 한 번에 분류합니다.
+        
+        Returns:
+            List[Tuple[str, float]]: (지역 코드, 보정된 신뢰도) 리스트 (입력 순서)
+        """
+        if not announcements:
+            return []
+        
+        probabilities = self.predict_proba(announcements)
+        best = probabilities.argmax(axis=1)
+        return [(self.classes[index], float(probabilities[row, index])) for row, index in enumerate(best)]
+    
+    def accepts(self, confidence: float) -> bool:
+        """Gemini로 넘기지 않고 채택할 만큼 확실한지"""
+        return confidence >= self.threshold
+    
+    # ----- 학습 -----
+    
+    @classmethod
+    def train(cls, samples: List[Dict], calibration_ratio: float = 0.2, test_ratio: float = 0.1,
+              target_precision: float = 0.95,
+              epochs: int = 200, learning_rate: float = 0.1, l2: float = 1e-4,
+              seed: int = 42, **vectorizer_options) -> Tuple['LocalRegionClassifier', Dict]:
+        """
+        분류 결과가 있는 공고로 모델을 학습합니다.
+        
+        Args:
+            samples: 공고 필드(pblancId 포함)와 region_code를 가진 딕셔너리 리스트
+            calibration_ratio: 온도/임계값 보정에 쓸 데이터 비율
+            test_ratio: 학습과 보정 어디에도 쓰지 않고 평가에만 쓸 데이터 비율
+            seed: 데이터 분할 seed (split_samples 참고)
+            target_precision: 채택 임계값을 정할 때 보정 데이터에서 만족해야 할 정밀도
+        
+        Returns:
+            Tuple[LocalRegionClassifier, Dict]: (모델, 평가 데이터 평가 결과)
+        """
+        _require_numpy()
+        if len(samples) < 10:
+            raise ValueError(f"학습 데이터가 너무 적습니다: {len(samples)}개")
+        
+        training, calibration, test = split_samples(samples, calibration_ratio, test_ratio, seed)
+        if not training:
+            raise ValueError(f"보정/평가 데이터를 빼고 나니 학습 데이터가 없습니다: {len(samples)}개")
+        
+        classes = sorted({sample['region_code'] for sample in training})
+        class_index = {code: index for index, code in enumerate(classes)}
+        
+        vectorizer = CharNgramVectorizer(**vectorizer_options).fit(training)
+        features = vectorizer.transform(training)
+        labels = np.array([class_index[sample['region_code']] for sample in training])
+        targets = np.eye(len(classes), dtype=np.float32)[labels]
+        
+        # Adam 옵티마이저로 평균 교차 엔트로피 + L2 최소화 (전체 배치)
+        feature_count = len(vectorizer.vocabulary)
+        weights = np.zeros((feature_count, len(classes)), dtype=np.float32)
+        bias = np.zeros(len(classes), dtype=np.float32)
+        moments = [np.zeros_like(weights), np.zeros_like(bias)]
+        velocities = [np.zeros_like(weights), np.zeros_like(bias)]
+        beta1, beta2, eps = 0.9, 0.999, 1e-8
+        
+        for step in range(1, epochs + 1):
+            probabilities = _softmax(_sparse_dot(features, weights) + bias)
+            error = (probabilities - targets) / len(training)
+            gradients = [
+                _sparse_transpose_dot(features, error, feature_count) + l2 * weights,
+                error.sum(axis=0)
+            ]
+            for parameter, gradient, moment, velocity in zip((weights, bias), gradients, moments, velocities):
+                moment *= beta1
+                moment += (1 - beta1) * gradient
+                velocity *= beta2
+                velocity += (1 - beta2) * gradient * gradient
+                parameter -= (learning_rate * (moment / (1 - beta1 ** step)) /
+                              (np.sqrt(velocity / (1 - beta2 ** step)) + eps)).astype(np.float32)
+        
+        model = cls(vectorizer, weights, bias, classes)
+        
+        # 학습에 없던 지역 코드의 데이터는 보정/평가에서 제외
+        calibration = [sample for sample in calibration if sample['region_code'] in class_index]
+        test = [sample for sample in test if sample['region_code'] in class_index]
+        if calibration:
+            model._calibrate(calibration, target_precision)
+        
+        model.metadata = {
+            'trained_at': datetime.now().isoformat(),
+            'training_samples': len(training),
+            'calibration_samples': len(calibration),
+            'test_samples': len(test),
+            'calibration_ratio': calibration_ratio,
+            'test_ratio': test_ratio,
+            'seed': seed,
+            'features': feature_count,
+            'target_precision': target_precision
+        }
+        
+        # 임계값은 보정 데이터에서 목표 정밀도에 맞춘 값이므로 평가는 따로 뗀 데이터로만 함
+        return model, model.evaluate(test) if test else {}
+    
+    def _calibrate(self, holdout: List[Dict], target_precision: float, min_accepted: int = 5):
+        """보정 데이터로 온도와 채택 임계값을 정합니다."""
+        logits = self._logits(holdout)
+        labels = np.array([self.classes.index(sample['region_code']) for sample in holdout])
+        
+        # 음의 로그 가능도가 가장 작은 온도 선택
+        def negative_log_likelihood(temperature):
+            probabilities = _softmax(logits / temperature)
+            return -np.log(probabilities[np.arange(len(labels)), labels] + 1e-12).mean()
+        
+        self.temperature = float(min(np.logspace(-1.5, 1.5, 61), key=negative_log_likelihood))
+        
+        # 신뢰도 내림차순으로 누적 정밀도가 목표 이상인 가장 낮은 임계값
+        probabilities = _softmax(logits / self.temperature)
+        confidence = probabilities.max(axis=1)
+        correct = probabilities.argmax(axis=1) == labels
+        order = np.argsort(-confidence)
+        precision = np.cumsum(correct[order]) / np.arange(1, len(order) + 1)
+        
+        self.threshold = 1.01  # 목표를 만족하지 못하면 모두 Gemini로 보냄
+        for rank in range(len(order) - 1, min_accepted - 2, -1):
+            if precision[rank] >= target_precision:
+                self.threshold = float(confidence[order[rank]])
+                break
+    
+    def evaluate(self, samples: List[Dict]) -> Dict:
+        """
+        정확도, 임계값 기준 채택률/정밀도, 기대 보정 오차(ECE)를 계산합니다.
+        """
+        samples = [sample for sample in samples if sample['region_code'] in self.classes]
+        if not samples:
+            return {'samples': 0}
+        
+        probabilities = self.predict_proba(samples)
+        labels = np.array([self.classes.index(sample['region_code']) for sample in samples])
+        confidence = probabilities.max(axis=1)
+        correct = probabilities.argmax(axis=1) == labels
+        accepted = confidence >= self.threshold
+        
+        # 10구간 기대 보정 오차
+        bins = np.minimum((confidence * 10).astype(int), 9)
+        ece = sum(
+            abs(correct[bins == b].mean() - confidence[bins == b].mean()) * (bins == b).mean()
+            for b in range(10) if (bins == b).any()
+        )
+        
+        return {
+            'samples': len(samples),
+            'accuracy': round(float(correct.mean()), 4),
+            'threshold': round(self.threshold, 4),
+            'temperature': round(self.temperature, 4),
+            'coverage': round(float(accepted.mean()), 4),
+            'accepted_precision': round(float(correct[accepted].mean()), 4) if accepted.any() else None,
+            'expected_calibration_error': round(float(ece), 4)
+        }
+    
+    # ----- 저장/로드 -----
+    
+    def save(self, path: str = DEFAULT_MODEL_PATH):
+        """모델을 npz 파일로 저장 (pickle 미사용)"""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        vocabulary = sorted(self.vectorizer.vocabulary, key=self.vectorizer.vocabulary.get)
+        config = {
+            'ngram_range': list(self.vectorizer.ngram_range),
+            'min_df': self.vectorizer.min_df,
+            'max_features': self.vectorizer.max_features,
+            'temperature': self.temperature,
+            'threshold': self.threshold,
+            'metadata': self.metadata
+        }
+        
+        np.savez_compressed(
+            path,
+            vocabulary=np.array(vocabulary, dtype=str),
+            idf=self.vectorizer.idf,
+            weights=self.weights,
+            bias=self.bias,
+            classes=np.array(self.classes, dtype=str),
+            config=np.array(json.dumps(config, ensure_ascii=False))
+        )
+    
+    @classmethod
+    def load(cls, path: str = DEFAULT_MODEL_PATH) -> 'LocalRegionClassifier':
+        _require_numpy()
+        with np.load(path, allow_pickle=False) as archive:
+            config = json.loads(str(archive['config']))
+            vectorizer = CharNgramVectorizer(tuple(config['ngram_range']), config['min_df'], config['max_features'])
+            vectorizer.vocabulary = {feature: index for index, feature in enumerate(archive['vocabulary'].tolist())}
+            vectorizer.idf = archive['idf']
+            
+            return cls(
+                vectorizer,
+                archive['weights'],
+                archive['bias'],
+                archive['classes'].tolist(),
+                temperature=config['temperature'],
+                threshold=config['threshold'],
+                metadata=config.get('metadata')
+            )
+
+_local_classifier = None
+_local_classifier_loaded = False
+_local_classifier_lock = threading.Lock()
+
+def get_local_classifier() -> Optional[LocalRegionClassifier]:
+    """
+    모델 파일을 프로세스당 한 번만 로드해 반환합니다.
+    
+    numpy가 없거나 모델 파일이 없으면 None (로컬 분류 단계를 건너뜀)
+    """
+    global _local_classifier, _local_classifier_loaded
+    
+    if _local_classifier_loaded:
+        return _local_classifier
+    
+    with _local_classifier_lock:
+        if not _local_classifier_loaded:
+            if os.getenv('LOCAL_CLASSIFIER_ENABLED', 'true').lower() != 'true':
+                logger.info("로컬 분류기가 비활성화되어 있습니다.")
+            elif np is None:
+                logger.warning("numpy가 설치되지 않아 로컬 분류기를 사용할 수 없습니다.")
+            elif not os.path.exists(DEFAULT_MODEL_PATH):
+                logger.info(f"로컬 분류기 모델 파일이 없습니다: {DEFAULT_MODEL_PATH}")
+            else:
+                try:
+                    _local_classifier = LocalRegionClassifier.load(DEFAULT_MODEL_PATH)
+                    logger.info(f"로컬 분류기 로드 완료 - 지역 {len(_local_classifier.classes)}개, "
+                               f"임계값 {_local_classifier.threshold:.3f}")
+                except Exception as e:
+                    logger.error(f"로컬 분류기 로드 실패: {e}")
+            _local_classifier_loaded = True
+    
+    return _local_classifier
+
+def main():
+    import argparse
+    from app.models.announcement import AnnouncementModel
+    
+    parser = argparse.ArgumentParser(description="로컬 지역 분류기 학습/평가")
+    parser.add_argument('command', choices=['train', 'evaluate'])
+    parser.add_argument('--model', default=DEFAULT_MODEL_PATH, help="모델 파일 경로")
+    parser.add_argument('--min-ai-confidence', type=float, default=0.8,
+                        help="학습에 포함할 AI 분류 결과의 최소 신뢰도")
+    parser.add_argument('--target-precision', type=float, default=0.95,
+                        help="채택 임계값을 정할 검증 정밀도 목표")
+    parser.add_argument('--epochs', type=int, default=200)
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.INFO)
+    samples = AnnouncementModel.get_training_samples(min_ai_confidence=args.min_ai_confidence)
+    print(f"학습/평가 데이터: {len(samples)}개")
+    
+    if args.command == 'train':
+        model, report = LocalRegionClassifier.train(
+            samples, target_precision=args.target_precision, epochs=args.epochs
+        )
+        model.save(args.model)
+        print(f"모델 저장: {args.model}")
+    else:
+        model = LocalRegionClassifier.load(args.model)
+        if 'test_ratio' not in model.metadata:
+            parser.error("평가 분할 정보가 없는 모델입니다. 학습/보정 데이터로 평가하지 않도록 train으로 다시 학습해주세요.")
+        
+        # 학습 때와 같은 분할의 평가 데이터로만 평가 (학습 후 추가된 공고 중 평가 몫 포함)
+        _, _, test = split_samples(
+            samples, model.metadata['calibration_ratio'], model.metadata['test_ratio'], model.metadata['seed']
+        )
+        print(f"평가 데이터 (학습/보정 제외 분할): {len(test)}개")
+        report = model.evaluate(test)
+    
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+if __name__ == "__main__":
+    main()
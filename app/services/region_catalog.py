@@ -0,0 +1,373 @@
+"""
+데이터 기반 지역 카탈로그 및 지역명 매칭기
+
+regions 테이블의 지역 계층(parent_code)과 별칭(aliases)을 읽어
+하나의 Aho-Corasick 오토마톤으로 컴파일합니다.
+지역명의 '시/군' 접미사를 뗀 약칭(창원시 → 창원)도 자동으로 인식하며,
+같은 이름이 여러 지역에 있으면(고성군, 중구 등) 함께 언급된 광역시도로 구분합니다.
+"""
+
+import random
+import time
+import logging
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set
+
+from app.utils.aho_corasick import AhoCorasickAutomaton
+
+logger = logging.getLogger(__name__)
+
+# 키워드 매칭 대상 필드 (검색 순서)
+CLASSIFICATION_FIELDS = ['pblancNm', 'jrsdInsttNm', 'excInsttNm', 'bsnsSumryCn']
+FIELD_ORDER = {field: index for index, field in enumerate(CLASSIFICATION_FIELDS)}
+
+# 광역시도 이름에서 떼어낼 접미사 (긴 것부터)
+PROVINCE_SUFFIXES = ['특별자치시', '특별자치도', '특별시', '광역시']
+
+# 접미사를 떼면 일반 명사와 겹쳐 오분류가 잦은 약칭 (전체 이름으로만 인식)
+COMMON_WORD_STEMS = {
+    '고령', '예산', '부여', '음성', '영양', '상주', '진도', '경주', '장수', '화성',
+    '영광', '완주', '동해', '전주', '고양', '보은', '인제', '영동', '강진', '성주',
+    '장성', '구리'
+}
+
+# 약한 표기(자동 생성 약칭, 두 글자 자치구 이름) 뒤에 붙어도 지역명으로 보는 단어
+WEAK_FORM_SUFFIXES = ('지역', '소재', '관내')
+
+# 서비스 지역 밖의 약한 표기 매칭 신뢰도 - 키워드 분류 채택 기준(0.6)보다 낮아 로컬/AI 분류로 넘어감
+# (예: '구미 당기는', '서구 문화'처럼 경계가 맞아도 일반 단어일 수 있음)
+WEAK_OUTSIDE_CONFIDENCE = 0.5
+
+# 매칭 우선순위 (작을수록 우선)
+TIER_SERVED_MUNICIPAL = 0
+TIER_SERVED_PROVINCIAL = 1
+TIER_NATIONAL = 2
+TIER_OUTSIDE = 3
+
+@dataclass
+class KeywordMatch:
+    """키워드 매칭 결과"""
+    keyword: str
+    region_code: str
+    confidence: float
+    priority: int
+    field: str
+    start: int
+    end: int
+
+class RegionCatalog:
+    """지역 계층 카탈로그와 컴파일된 지역명 매칭기"""
+    
+    def __init__(self, regions: List[Dict], served_provinces: Optional[Set[str]] = None,
+                 home_province: str = 'GYEONGNAM'):
+        """
+        Args:
+            regions: [{'code', 'name', 'type', 'parent_code', 'aliases'}] 리스트
+            served_provinces: 세부 지역까지 분류할 광역시도 코드 집합
+                              (None이면 전체, 그 외 지역은 OTHER로 분류)
+            home_province: 이름이 겹치는 지역을 구분할 단서가 없을 때 우선할 광역시도
+        """
+        self.served_provinces = served_provinces
+        self.home_province = home_province
+        self.regions = {}
+        self._order = {}
+        
+        for index, region in enumerate(regions):
+            self.regions[region['code']] = {
+                'name': region['name'],
+                'type': region['type'],
+                'parent': region.get('parent_code'),
+                'aliases': list(region.get('aliases') or [])
+            }
+            self._order[region['code']] = index
+        
+        self._province_cache = {code: self._find_province(code) for code in self.regions}
+        self.automaton = self._compile()
+    
+    # ----- 계층 -----
+    
+    def _find_province(self, code: str) -> Optional[str]:
+        """지역의 광역시도 코드 (광역시도 자신이면 자기 코드, 없으면 None)"""
+        seen = set()
+        while code and code in self.regions and code not in seen:
+            seen.add(code)
+            if self.regions[code]['type'] == 'provincial':
+                return code
+            code = self.regions[code]['parent']
+        return None
+    
+    def province_of(self, code: str) -> Optional[str]:
+        return self._province_cache.get(code)
+    
+    def is_served(self, code: str) -> bool:
+        """세부 지역까지 분류하는 광역시도에 속하는지"""
+        province = self.province_of(code)
+        if province is None:
+            return False
+        return self.served_provinces is None or province in self.served_provinces
+    
+    def children_of(self, code: str) -> Dict[str, Dict]:
+        return {child: info for child, info in self.regions.items() if info['parent'] == code}
+    
+    # ----- 컴파일 -----
+    
+    def _surface_forms(self, code: str) -> Dict[str, bool]:
+        """지역을 가리키는 표기 목록 {표기: 자동 생성 약칭 여부}"""
+        region = self.regions[code]
+        name = region['name']
+        forms = {name: False}
+        
+        for alias in region['aliases']:
+            forms.setdefault(alias, False)
+        
+        stem = None
+        if region['type'] == 'provincial':
+            for suffix in PROVINCE_SUFFIXES:
+                if name.endswith(suffix):
+                    stem = name[:-len(suffix)]
+                    break
+            else:
+                if name.endswith('도') and len(name) == 3:
+                    stem = name[:-1]
+        elif region['type'] == 'municipal' and name[-1] in ('시', '군'):
+            # 자치구(~구)는 약칭이 너무 짧고 흔해서 전체 이름으로만 인식
+            stem = name[:-1]
+            if stem in COMMON_WORD_STEMS:
+                stem = None
+        
+        if stem and len(stem) >= 2:
+            parent = region['parent']
+            parent_forms = set()
+            if parent in self.regions:
+                parent_forms = {self.regions[parent]['name'], *self.regions[parent]['aliases']}
+            # 제주시 → '제주'처럼 상위 광역시도 약칭과 같으면 상위 지역이 우선
+            if stem not in parent_forms:
+                forms.setdefault(stem, True)
+        
+        return forms
+    
+    def _compile(self) -> AhoCorasickAutomaton:
+        """
+        모든 지역 표기를 하나의 오토마톤으로 컴파일 (같은 표기는 후보 목록으로 묶음)
+        
+        자동 생성 약칭과 두 글자 자치구 이름(서구, 중구)은 일반 단어에 섞여 나오기 쉬우므로
+        약한 표기(_weak_forms)로 따로 표시해 단어 경계에서만 인식합니다.
+        """
+        candidates = {}
+        strong_forms = set()
+        for code in self.regions:
+            short_name = self.regions[code]['type'] == 'municipal' and len(self.regions[code]['name']) <= 2
+            for form, is_stem in self._surface_forms(code).items():
+                candidates.setdefault(form.lower(), []).append(code)
+                if not is_stem and not (short_name and form == self.regions[code]['name']):
+                    strong_forms.add(form.lower())
+        
+        # 후보 중 하나라도 전체 이름/별칭으로 쓰는 표기는 약한 표기가 아님
+        self._weak_forms = set(candidates) - strong_forms
+        
+        automaton = AhoCorasickAutomaton()
+        for form, codes in candidates.items():
+            automaton.add(form, tuple(codes))
+        
+        self.surface_form_count = len(candidates)
+        return automaton.build()
+    
+    # ----- 매칭 -----
+    
+    @staticmethod
+    def _on_word_boundary(text: str, start: int, end: int) -> bool:
+        """매칭 앞뒤가 단어 경계인지 (뒤에 WEAK_FORM_SUFFIXES가 붙는 경우 포함)"""
+        if start > 0 and text[start - 1].isalnum():
+            return False
+        if end < len(text) and text[end].isalnum():
+            return text.startswith(WEAK_FORM_SUFFIXES, end)
+        return True
+    
+    def _scan(self, text: str, field: str) -> List[tuple]:
+        """
+        필드 텍스트의 원시 매칭 (더 긴 매칭에 포함된 짧은 매칭은 제거)
+        
+        약한 표기는 단어 경계에 있을 때만 인식합니다 (예: '이천만원'의 '이천', '신안산선'의 '안산' 제외).
+        """
+        text = text.lower()
+        hits = sorted(
+            (
+                (start, end, form, codes) for start, end, form, codes in self.automaton.iter_matches(text)
+                if form not in self._weak_forms or self._on_word_boundary(text, start, end)
+            ),
+            key=lambda hit: (hit[0], -(hit[1] - hit[0]))
+        )
+        
+        kept = []
+        for hit in hits:
+            # 예: '강서구' 안의 '서구', '창원시' 안의 '창원'
+            if any(other[0] <= hit[0] and hit[1] <= other[1] for other in kept):
+                continue
+            kept.append(hit)
+        
+        return [(field, *hit) for hit in kept]
+    
+    def _resolve(self, codes: tuple, context_provinces: Set[str]) -> str:
+        """같은 표기의 후보 지역 중 하나 선택"""
+        if len(codes) == 1:
+            return codes[0]
+        
+        def rank(code):
+            province = self.province_of(code)
+            return (
+                province not in context_provinces,          # 함께 언급된 광역시도 소속 우선
+                province != self.home_province,             # 기본 광역시도 우선
+                not self.is_served(code),                   # 서비스 지역 우선
+                self.regions[code]['type'] != 'provincial',  # 광역시도 우선 (광주 등)
+                self._order[code]
+            )
+        
+        return min(codes, key=rank)
+    
+    def _to_match(self, field, start, end, form, code) -> KeywordMatch:
+        """카탈로그 지역을 서비스 범위에 맞는 분류 결과로 변환"""
+        region = self.regions[code]
+        
+        if region['type'] == 'national':
+            region_code, tier = code, TIER_NATIONAL
+        elif region['type'] == 'other' or not self.is_served(code):
+            region_code, tier = 'OTHER', TIER_OUTSIDE
+        elif region['type'] == 'provincial':
+            region_code, tier = code, TIER_SERVED_PROVINCIAL
+        else:
+            region_code, tier = code, TIER_SERVED_MUNICIPAL
+        
+        if tier == TIER_OUTSIDE:
+            confidence = WEAK_OUTSIDE_CONFIDENCE if form in self._weak_forms else 0.8
+        else:
+            confidence = 0.9
+        
+        return KeywordMatch(
+            keyword=form,
+            region_code=region_code,
+            confidence=confidence,
+            priority=tier,
+            field=field,
+            start=start,
+            end=end
+        )
+    
+    def find_matches(self, fields: Dict[str, str]) -> List[KeywordMatch]:
+        """
+        여러 필드의 지역 매칭을 한 번에 수행합니다.
+        
+        Args:
+            fields: {필드명: 텍스트}
+            
+        Returns:
+            List[KeywordMatch]: 후보가 하나로 결정된 매칭 리스트
+        """
+        hits = []
+        for field, text in fields.items():
+            if text:
+                hits.extend(self._scan(text, field))
+        
+        if not hits:
+            return []
+        
+        # 광역시도가 하나로 정해지는 매칭에서 언급된 광역시도를 모아 중복 이름 구분에 사용
+        # (OTHER 별칭처럼 광역시도가 없는 후보는 무시)
+        context_provinces = set()
+        for _, _, _, _, codes in hits:
+            provinces = {self.province_of(code) for code in codes} - {None}
+            if len(provinces) == 1:
+                context_provinces |= provinces
+        
+        return [
+            self._to_match(field, start, end, form, self._resolve(codes, context_provinces))
+            for field, start, end, form, codes in hits
+        ]
+    
+    @staticmethod
+    def select_best_match(matches: List[KeywordMatch]) -> Optional[KeywordMatch]:
+        """가장 구체적인 서비스 지역 → 광역시도 → 전국 → 기타 순, 같은 등급은 앞쪽 필드/위치 우선"""
+        if not matches:
+            return None
+        return min(matches, key=lambda match: (match.priority, FIELD_ORDER.get(match.field, 0), match.start))
+    
+    def classify_fields(self, fields: Dict[str, str]) -> Optional[KeywordMatch]:
+        """필드 텍스트를 분류해 최적 매칭 반환 (없으면 None)"""
+        return self.select_best_match(self.find_matches(fields))
+
+def benchmark_region_catalog(base_regions: List[Dict], catalog_sizes=(250, 1000, 5000, 20000),
+                             document_count: int = 20000, seed: int = 42) -> List[Dict]:
+    """
+    카탈로그 크기별 키워드 분류 처리량 측정
+    
+    base_regions에 임의의 가상 시군을 추가해 카탈로그 크기를 늘리고,
+    같은 합성 공고 집합을 분류하는 데 걸린 시간을 비교합니다.
+    
+    Returns:
+        List[Dict]: [{'catalog_size', 'surface_forms', 'compile_seconds',
+                      'documents', 'classify_seconds', 'documents_per_second'}]
+    """
+    rng = random.Random(seed)
+    syllables = [chr(code) for code in range(0xAC00, 0xD7A4, 37)]
+    filler = ['지원사업', '중소기업', '기술개발', '공고', '모집', '창업', '수출', '바우처', '컨설팅', '스마트공장']
+    provinces = [region['code'] for region in base_regions if region['type'] == 'provincial'] or [None]
+    
+    synthetic = []
+    while len(base_regions) + len(synthetic) < max(catalog_sizes):
+        name = ''.join(rng.choice(syllables) for _ in range(rng.randint(2, 3))) + rng.choice('시군')
+        synthetic.append({
+            'code': f'SYN_{len(synthetic):05d}',
+            'name': name,
+            'type': 'municipal',
+            'parent_code': rng.choice(provinces),
+            'aliases': []
+        })
+    
+    all_regions = base_regions + synthetic
+    documents = []
+    for _ in range(document_count):
+        region = rng.choice(all_regions)
+        words = [rng.choice(filler) for _ in range(rng.randint(20, 60))]
+        words.insert(rng.randint(0, len(words)), region['name'])
+        documents.append({
+            'pblancNm': f"[{region['name']}] {' '.join(words[:8])}",
+            'jrsdInsttNm': rng.choice(filler),
+            'excInsttNm': rng.choice(filler),
+            'bsnsSumryCn': ' '.join(words)
+        })
+    
+    results = []
+    for size in catalog_sizes:
+        regions = all_regions[:max(size, len(base_regions))]
+        
+        compile_start = time.perf_counter()
+        catalog = RegionCatalog(regions, served_provinces=None)
+        compile_seconds = time.perf_counter() - compile_start
+        
+        classify_start = time.perf_counter()
+        for document in documents:
+            catalog.classify_fields({field: document.get(field) for field in CLASSIFICATION_FIELDS})
+        classify_seconds = time.perf_counter() - classify_start
+        
+        results.append({
+            'catalog_size': len(regions),
+            'surface_forms': catalog.surface_form_count,
+            'compile_seconds': round(compile_seconds, 3),
+            'documents': len(documents),
+            'classify_seconds': round(classify_seconds, 3),
+            'documents_per_second': round(len(documents) / classify_seconds) if classify_seconds else None
+        })
+    
+    return results
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    
+    from app.services.gyeongnam_region_service import gyeongnam_region_service
+    base = gyeongnam_region_service.get_catalog_source()
+    
+    print(f"기본 카탈로그: {len(base)}개 지역")
+    for row in benchmark_region_catalog(base):
+        print(f"  지역 {row['catalog_size']:>6}개 (표기 {row['surface_forms']:>6}개) | "
+              f"컴파일 {row['compile_seconds']:.3f}s | "
+              f"공고 {row['documents']}건 분류 {row['classify_seconds']:.2f}s "
+              f"({row['documents_per_second']}건/s)")
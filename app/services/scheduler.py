@@ -138,6 +138,18 @@ class DataCollectionScheduler:
             coalesce=True
         )
         
+        # 매일 새벽 3시 분류 통계 카운터 재계산
+        self.scheduler.add_job(
+            func=self._reconcile_classification_stats,
+            trigger='cron',
+            hour=3,
+            minute=0,
+            id='stats_reconciliation',
+            name='분류 통계 카운터 재계산',
+            max_instances=1,
+            coalesce=True
+        )
+        
         # 주간 데이터 정리 (옵션) - 매주 일요일 새벽 2시
         self.scheduler.add_job(
             func=self._weekly_cleanup,
@@ -156,7 +168,7 @@ class DataCollectionScheduler:
         try:
             logger.info("=== 스케줄된 데이터 수집 시작 ===")
             
-            # 수집할 데이터 수 (환경변수에서 설정 가능)
+            # 수집 기준점이 없을 때 가져올 데이터 수 (환경변수에서 설정 가능)
             search_cnt = int(os.getenv('SCHEDULED_SEARCH_COUNT', 50))
             
             # 데이터 수집 실행
@@ -164,9 +176,14 @@ class DataCollectionScheduler:
             
             # 결과 로깅
             logger.info(f"스케줄된 데이터 수집 완료:")
-            logger.info(f"  - 총 수집: {result.get('total_fetched', 0)}개")
-            logger.info(f"  - 신규 공고: {result.get('new_announcements', 0)}개")
+            logger.info(f"  - 총 수집: {result.get('total_fetched', 0)}개 ({result.get('pages_fetched', 0)}페이지)")
+            for tag, tag_yield in result.get('hashtag_yield', {}).items():
+                logger.info(f"    #{tag}: {tag_yield['fetched']}개 (이 해시태그에서만 {tag_yield['exclusive']}개)")
+            logger.info(f"  - 신규 공고: {result.get('new_announcements', 0)}개 "
+                       f"(변경된 기존 공고: {result.get('changed_announcements', 0)}개)")
             logger.info(f"  - 키워드 분류: {result.get('keyword_classified', 0)}개")
+            logger.info(f"  - 기관 인덱스 분류: {result.get('institution_classified', 0)}개")
+            logger.info(f"  - 로컬 분류: {result.get('local_classified', 0)}개")
             logger.info(f"  - AI 분류: {result.get('ai_classified', 0)}개")
             logger.info(f"  - 분류 실패: {result.get('classification_failed', 0)}개")
             
@@ -205,6 +222,21 @@ class DataCollectionScheduler:
         except Exception as e:
             logger.error(f"시스템 상태 확인 오류: {e}")
     
+    def _reconcile_classification_stats(self):
+        """분류 통계 카운터 재계산 작업"""
+        try:
+            logger.info("=== 분류 통계 카운터 재계산 시작 ===")
+            
+            from app.models.announcement import AnnouncementModel
+            result = AnnouncementModel.reconcile_classification_stats()
+            
+            logger.info(f"분류 통계 카운터 재계산 완료 - 불일치 {len(result['drift'])}건")
+            return result
+            
+        except Exception as e:
+            logger.error(f"분류 통계 카운터 재계산 오류: {e}")
+            return {'error': str(e)}
+    
     def _weekly_cleanup(self):
         """주간 데이터 정리 작업"""
         try:
@@ -217,7 +249,17 @@ class DataCollectionScheduler:
             logger.info(f"정리 기준 날짜: {cutoff_date}")
             
             # 현재는 로깅만 하고 실제 삭제는 하지 않음
-            logger.info("주간 데이터 정리 완료 (현재는 로깅만)")
+            
+            # 다른 모델/만료된 AI 분류 캐시 삭제
+            from app.models.ai_classification_cache import AIClassificationCacheModel
+            from .gemini_classifier import DEFAULT_MODEL_NAME
+            purged = AIClassificationCacheModel.purge_stale(
+                os.getenv('GEMINI_MODEL', DEFAULT_MODEL_NAME),
+                int(os.getenv('AI_CLASSIFICATION_CACHE_TTL_DAYS', '180'))
+            )
+            logger.info(f"AI 분류 캐시 정리: {purged}건 삭제")
+            
+            logger.info("주간 데이터 정리 완료 (공고 데이터는 현재 로깅만)")
             
         except Exception as e:
             logger.error(f"주간 데이터 정리 오류: {e}")
@@ -0,0 +1,97 @@
+"""
+Aho-Corasick 다중 패턴 문자열 매칭
+
+여러 키워드를 하나의 오토마톤으로 컴파일해 텍스트를 한 번만 훑으면서
+모든 키워드 출현 위치를 찾습니다. 검색 비용은 키워드 수와 무관하게
+텍스트 길이 + 매칭 수에 비례합니다.
+"""
+
+from collections import deque
+from typing import Any, Iterator, List, Tuple
+
+class AhoCorasickAutomaton:
+    """Aho-Corasick 오토마톤"""
+    
+    def __init__(self):
+        self._goto = [{}]       # 상태별 전이 테이블
+        self._fail = [0]        # 실패 링크
+        self._outputs = [[]]    # 상태에서 끝나는 (패턴, 값) 리스트
+        self._pattern_count = 0
+        self._built = False
+    
+    def add(self, pattern: str, value: Any = None) -> None:
+        """패턴 추가 (build() 이전에만 가능)"""
+        if self._built:
+            raise RuntimeError("이미 컴파일된 오토마톤에는 패턴을 추가할 수 없습니다.")
+        if not pattern:
+            raise ValueError("빈 패턴은 추가할 수 없습니다.")
+        
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._outputs.append([])
+            state = next_state
+        
+        self._outputs[state].append((pattern, value))
+        self._pattern_count += 1
+    
+    def build(self) -> 'AhoCorasickAutomaton':
+        """실패 링크 계산 (BFS)"""
+        queue = deque()
+        
+        for state in self._goto[0].values():
+            self._fail[state] = 0
+            queue.append(state)
+        
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                
+                # 실패 링크 상태의 출력도 이 상태에서 함께 출력
+                self._outputs[next_state] = (
+                    self._outputs[next_state] + self._outputs[self._fail[next_state]]
+                )
+        
+        self._built = True
+        return self
+    
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int, str, Any]]:
+        """
+        텍스트에서 모든 패턴 출현을 찾습니다 (겹치는 매칭 포함).
+        
+        Yields:
+            (시작 위치, 끝 위치(미포함), 패턴, 값)
+        """
+        if not self._built:
+            self.build()
+        
+        goto = self._goto
+        fail = self._fail
+        outputs = self._outputs
+        state = 0
+        
+        for index, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            
+            for pattern, value in outputs[state]:
+                yield index + 1 - len(pattern), index + 1, pattern, value
+    
+    def find_all(self, text: str) -> List[Tuple[int, int, str, Any]]:
+        """iter_matches 결과를 리스트로 반환"""
+        return list(self.iter_matches(text))
+    
+    def __len__(self) -> int:
+        return self._pattern_count
@@ -0,0 +1,83 @@
+"""
+프로세스 내 LRU + TTL 쿼리 캐시
+"""
+
+import time
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable
+
+class TTLLRUCache:
+    """크기 제한(LRU)과 만료 시간(TTL)을 함께 적용하는 스레드 안전 캐시"""
+    
+    def __init__(self, max_size: int = 256, ttl_seconds: float = 300.0):
+        if max_size < 1:
+            raise ValueError(f"max_size는 1 이상이어야 합니다: {max_size}")
+        
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries = OrderedDict()  # key -> (만료 시각, 값)
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._stats = {
+            'hits': 0,
+            'misses': 0,
+            'evictions': 0,
+            'expirations': 0,
+            'invalidations': 0
+        }
+    
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """
+        캐시된 값을 반환하고, 없거나 만료되었으면 loader()로 채웁니다.
+        
+        loader가 예외를 던지면 캐시하지 않고 그대로 전파합니다.
+        loader 실행 중 invalidate()가 호출되면 결과를 캐시하지 않습니다.
+        """
+        now = time.monotonic()
+        
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    self._stats['hits'] += 1
+                    return value
+                del self._entries[key]
+                self._stats['expirations'] += 1
+            
+            self._stats['misses'] += 1
+            generation = self._generation
+        
+        # DB 조회는 잠금 밖에서 수행
+        value = loader()
+        
+        with self._lock:
+            if generation == self._generation:
+                self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+                    self._stats['evictions'] += 1
+        
+        return value
+    
+    def invalidate(self) -> None:
+        """모든 항목 무효화"""
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+            self._stats['invalidations'] += 1
+    
+    def get_stats(self) -> Dict:
+        """캐시 통계 반환"""
+        with self._lock:
+            lookups = self._stats['hits'] + self._stats['misses']
+            return {
+                'size': len(self._entries),
+                'max_size': self.max_size,
+                'ttl_seconds': self.ttl_seconds,
+                **self._stats,
+                'hit_rate': round(self._stats['hits'] / lookups * 100, 2) if lookups else 0.0
+            }
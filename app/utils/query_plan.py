@@ -0,0 +1,124 @@
+"""
+핫 쿼리 실행계획 점검 유틸리티
+
+EXPLAIN (FORMAT JSON) 결과를 분석해 공고 조회 핫 쿼리가
+migrations/001_announcement_hot_path_indexes.sql의 인덱스를 사용하는지 확인합니다.
+"""
+
+import json
+import logging
+from typing import List, Dict
+
+from config.database import DatabaseManager
+
+logger = logging.getLogger(__name__)
+
+# (이름, 쿼리, 파라미터, 사용되어야 하는 인덱스)
+HOT_QUERIES = [
+    (
+        'announcements_latest',
+        """
+        SELECT a.id FROM announcements a
+        WHERE a.is_active = true
+        ORDER BY a.created_at DESC, a.id DESC
+        LIMIT 50
+        """,
+        (),
+        'idx_announcements_active_created'
+    ),
+    (
+        'announcements_by_regions',
+        """
+        SELECT a.id FROM announcements a
+        WHERE a.region_code = ANY(%s) AND a.is_active = true
+        ORDER BY a.created_at DESC, a.id DESC
+        LIMIT 50
+        """,
+        (['GYEONGNAM', 'GYEONGNAM_01'],),
+        'idx_announcements_active_region_created'
+    ),
+    (
+        'announcements_by_status',
+        """
+        SELECT a.id FROM announcements a
+        WHERE a.classification_status = %s AND a.is_active = true
+        ORDER BY a.created_at DESC, a.id DESC
+        LIMIT 50
+        """,
+        ('classified',),
+        'idx_announcements_active_status_created'
+    ),
+    (
+        'unclassified_announcements',
+        """
+        SELECT id FROM announcements
+        WHERE region_code IS NULL
+          AND is_active = true
+          AND classification_status = 'pending'
+        ORDER BY created_at DESC
+        LIMIT 100
+        """,
+        (),
+        'idx_announcements_unclassified'
+    )
+]
+
+def _collect_index_names(plan: Dict) -> List[str]:
+    """실행계획 트리에서 사용된 인덱스 이름을 모두 수집"""
+    names = []
+    if 'Index Name' in plan:
+        names.append(plan['Index Name'])
+    for child in plan.get('Plans', []):
+        names.extend(_collect_index_names(child))
+    return names
+
+def check_hot_query_plans(disable_seqscan: bool = False) -> List[Dict]:
+    """
+    핫 쿼리의 실행계획을 확인합니다.
+    
+    Args:
+        disable_seqscan: True면 enable_seqscan을 끄고 확인
+                         (데이터가 적은 개발 DB에서 인덱스 사용 가능 여부만 검증할 때)
+    
+    Returns:
+        List[Dict]: 쿼리별 {'name', 'expected_index', 'used_indexes', 'uses_expected_index', 'total_cost'}
+    """
+    results = []
+    
+    with DatabaseManager.get_db_transaction() as (cursor, connection):
+        if disable_seqscan:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+        
+        for name, sql, params, expected_index in HOT_QUERIES:
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+            plan_json = cursor.fetchone()['QUERY PLAN']
+            if isinstance(plan_json, str):
+                plan_json = json.loads(plan_json)
+            
+            plan = plan_json[0]['Plan']
+            used_indexes = _collect_index_names(plan)
+            
+            results.append({
+                'name': name,
+                'expected_index': expected_index,
+                'used_indexes': used_indexes,
+                'uses_expected_index': expected_index in used_indexes,
+                'total_cost': plan.get('Total Cost')
+            })
+    
+    return results
+
+if __name__ == "__main__":
+    import sys
+    
+    logging.basicConfig(level=logging.INFO)
+    results = check_hot_query_plans(disable_seqscan='--force-index' in sys.argv)
+    
+    all_ok = True
+    for result in results:
+        status = 'OK' if result['uses_expected_index'] else 'MISSING'
+        all_ok = all_ok and result['uses_expected_index']
+        print(f"[{status}] {result['name']}: 기대 인덱스 {result['expected_index']}, "
+              f"사용 인덱스 {result['used_indexes'] or '없음'}, 비용 {result['total_cost']}")
+    
+    sys.exit(0 if all_ok else 1)
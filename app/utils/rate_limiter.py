@@ -0,0 +1,145 @@
+"""
+외부 API 호출용 토큰 버킷 속도 제한기
+"""
+
+import time
+import threading
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+class TokenBucket:
+    """분당 허용량을 일정 속도로 채우는 스레드 안전 토큰 버킷"""
+    
+    def __init__(self, per_minute: float, capacity: Optional[float] = None):
+        if per_minute <= 0:
+            raise ValueError(f"per_minute는 0보다 커야 합니다: {per_minute}")
+        
+        self.rate = per_minute / 60.0
+        self.capacity = capacity if capacity is not None else per_minute
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _refill(self, now: float):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+    
+    def try_acquire(self, amount: float = 1.0) -> float:
+        """
+        토큰을 차감하고 0을 반환합니다. 부족하면 차감하지 않고 필요한 대기 시간(초)을 반환합니다.
+        
+        용량보다 큰 요청은 버킷이 가득 찼을 때 허용해 영원히 막히지 않게 합니다.
+        """
+        amount = min(amount, self.capacity)
+        
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens >= amount:
+                self._tokens -= amount
+                return 0.0
+            return (amount - self._tokens) / self.rate
+    
+    def refund(self, amount: float):
+        """예약했지만 사용하지 않은 토큰 반환 (음수면 예약보다 더 쓴 만큼 추가 차감)"""
+        with self._lock:
+            self._tokens = min(self.capacity, self._tokens + amount)
+    
+    def drain(self):
+        """남은 토큰을 비워 버킷이 다시 채워질 때까지 호출을 늦춤 (429 응답 시)"""
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens = min(self._tokens, 0.0)
+
+class RateLimiter:
+    """
+    분당 요청 수(RPM), 분당 토큰 수(TPM), 동시 실행 수를 함께 제한합니다.
+    
+    429 응답을 받으면 backoff()로 모든 스레드의 호출을 일정 시간 멈춥니다.
+    """
+    
+    def __init__(self, requests_per_minute: float, tokens_per_minute: Optional[float] = None,
+                 max_in_flight: int = 4):
+        if max_in_flight < 1:
+            raise ValueError(f"max_in_flight는 1 이상이어야 합니다: {max_in_flight}")
+        
+        self.requests = TokenBucket(requests_per_minute)
+        self.tokens = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        self.max_in_flight = max_in_flight
+        self._in_flight = threading.BoundedSemaphore(max_in_flight)
+        self._lock = threading.Lock()
+        self._paused_until = 0.0
+        self._stats = {
+            'acquired': 0,
+            'throttled': 0,
+            'wait_seconds': 0.0,
+            'backoffs': 0
+        }
+    
+    def _wait_for_pause(self):
+        while True:
+            with self._lock:
+                remaining = self._paused_until - time.monotonic()
+            if remaining <= 0:
+                return
+            time.sleep(remaining)
+    
+    def _acquire_quota(self, estimated_tokens: float) -> float:
+        """RPM/TPM 한도를 모두 확보할 때까지 대기하고 대기한 시간(초)을 반환"""
+        waited = 0.0
+        while True:
+            self._wait_for_pause()
+            
+            delay = self.requests.try_acquire(1)
+            if delay == 0 and self.tokens is not None:
+                delay = self.tokens.try_acquire(estimated_tokens)
+                if delay > 0:
+                    self.requests.refund(1)
+            
+            if delay == 0:
+                return waited
+            
+            time.sleep(delay)
+            waited += delay
+    
+    @contextmanager
+    def acquire(self, estimated_tokens: float = 0):
+        """
+        호출 한 건의 슬롯을 확보합니다.
+        
+        Args:
+            estimated_tokens: 이 호출이 사용할 것으로 예상되는 토큰 수 (TPM 계산용)
+        """
+        start = time.monotonic()
+        with self._in_flight:
+            waited = self._acquire_quota(estimated_tokens)
+            
+            with self._lock:
+                self._stats['acquired'] += 1
+                if waited > 0:
+                    self._stats['throttled'] += 1
+                self._stats['wait_seconds'] += time.monotonic() - start
+            
+            yield
+    
+    def record_usage(self, reserved_tokens: float, actual_tokens: float):
+        """예약한 토큰 수와 실제 사용량의 차이를 TPM 버킷에 반영"""
+        if self.tokens is not None and actual_tokens:
+            self.tokens.refund(reserved_tokens - actual_tokens)
+    
+    def backoff(self, seconds: float):
+        """모든 호출을 seconds초 동안 멈춤 (이미 더 길게 멈춰 있으면 유지)"""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._stats['backoffs'] += 1
+        
+        self.requests.drain()
+        if self.tokens is not None:
+            self.tokens.drain()
+    
+    def get_stats(self) -> Dict:
+        with self._lock:
+            return {
+                **self._stats,
+                'wait_seconds': round(self._stats['wait_seconds'], 3),
+                'max_in_flight': self.max_in_flight
+            }
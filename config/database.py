@@ -3,6 +3,10 @@
 """
 
 import os
+import time
+import threading
+import logging
+from collections import deque
 import psycopg2
 import psycopg2.extras
 from contextlib import contextmanager
@@ -11,6 +15,8 @@ from dotenv import load_dotenv
 # 환경변수 로드
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 # 데이터베이스 설정
 DB_CONFIG = {
     'host': os.getenv('SUPABASE_HOST'),
@@ -20,12 +26,232 @@ DB_CONFIG = {
     'port': int(os.getenv('SUPABASE_PORT', '5432'))
 }
 
+# 커넥션 풀 설정
+POOL_CONFIG = {
+    'min_size': int(os.getenv('DB_POOL_MIN_SIZE', '1')),
+    'max_size': int(os.getenv('DB_POOL_MAX_SIZE', '10')),
+    'checkout_timeout': float(os.getenv('DB_POOL_TIMEOUT', '10')),
+    'health_check_interval': float(os.getenv('DB_POOL_HEALTH_CHECK_INTERVAL', '30')),
+    'max_idle_time': float(os.getenv('DB_POOL_MAX_IDLE_TIME', '300'))
+}
+
+class PoolTimeoutError(Exception):
+    """커넥션 풀에서 제한 시간 내에 연결을 얻지 못한 경우"""
+    pass
+
+class ConnectionPool:
+    """스레드 안전 PostgreSQL 커넥션 풀"""
+    
+    def __init__(self, db_config, min_size=1, max_size=10, checkout_timeout=10.0,
+                 health_check_interval=30.0, max_idle_time=300.0):
+        if min_size < 0 or max_size < 1 or min_size > max_size:
+            raise ValueError(f"잘못된 풀 크기 설정: min={min_size}, max={max_size}")
+        
+        self.db_config = db_config
+        self.min_size = min_size
+        self.max_size = max_size
+        self.checkout_timeout = checkout_timeout
+        self.health_check_interval = health_check_interval
+        self.max_idle_time = max_idle_time
+        
+        self._idle = deque()  # (connection, 반환 시각)
+        self._in_use = set()
+        self._opening = 0
+        self._closed = False
+        self._condition = threading.Condition(threading.Lock())
+        
+        self._stats = {
+            'checkouts': 0,
+            'timeouts': 0,
+            'connections_opened': 0,
+            'connections_discarded': 0,
+            'health_check_failures': 0,
+            'total_wait_time': 0.0,
+            'max_wait_time': 0.0
+        }
+        
+        for _ in range(min_size):
+            try:
+                self._idle.append((self._open_connection(), time.monotonic()))
+            except Exception as e:
+                logger.warning(f"커넥션 풀 초기 연결 생성 실패: {e}")
+                break
+    
+    def _open_connection(self):
+        """새 데이터베이스 연결 생성"""
+        connection = psycopg2.connect(**self.db_config)
+        connection.autocommit = True
+        with self._condition:
+            self._stats['connections_opened'] += 1
+        return connection
+    
+    def _is_healthy(self, connection, idle_since):
+        """유휴 연결이 재사용 가능한지 확인"""
+        if connection.closed:
+            return False
+        
+        if time.monotonic() - idle_since < self.health_check_interval:
+            return True
+        
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            return True
+        except Exception as e:
+            with self._condition:
+                self._stats['health_check_failures'] += 1
+            logger.warning(f"유휴 연결 상태 확인 실패: {e}")
+            return False
+    
+    def _close_quietly(self, connection):
+        try:
+            connection.close()
+        except Exception:
+            pass
+    
+    def getconn(self):
+        """풀에서 연결을 가져옵니다. 제한 시간 초과 시 PoolTimeoutError 발생"""
+        start = time.monotonic()
+        deadline = start + self.checkout_timeout
+        
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise PoolTimeoutError("커넥션 풀이 닫혔습니다.")
+                
+                if self._idle:
+                    connection, idle_since = self._idle.pop()
+                    break
+                
+                if len(self._in_use) + self._opening < self.max_size:
+                    self._opening += 1
+                    connection, idle_since = None, None
+                    break
+                
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._stats['timeouts'] += 1
+                    raise PoolTimeoutError(
+                        f"{self.checkout_timeout}초 내에 데이터베이스 연결을 얻지 못했습니다. "
+                        f"(사용 중: {len(self._in_use)}/{self.max_size})"
+                    )
+                self._condition.wait(remaining)
+        
+        # 네트워크 작업(연결 생성, 상태 확인)은 잠금 밖에서 수행
+        if connection is not None and not self._is_healthy(connection, idle_since):
+            self._close_quietly(connection)
+            with self._condition:
+                self._stats['connections_discarded'] += 1
+                self._opening += 1
+            connection = None
+        
+        if connection is None:
+            try:
+                connection = self._open_connection()
+            finally:
+                with self._condition:
+                    self._opening -= 1
+                    self._condition.notify()
+        
+        wait_time = time.monotonic() - start
+        with self._condition:
+            self._in_use.add(connection)
+            self._stats['checkouts'] += 1
+            self._stats['total_wait_time'] += wait_time
+            self._stats['max_wait_time'] = max(self._stats['max_wait_time'], wait_time)
+        
+        return connection
+    
+    def putconn(self, connection, discard=False):
+        """연결을 풀에 반환합니다. discard=True면 연결을 폐기합니다."""
+        if not discard and not connection.closed:
+            try:
+                # 진행 중인 트랜잭션이 남아 있으면 정리
+                if connection.status != psycopg2.extensions.STATUS_READY:
+                    connection.rollback()
+                if not connection.autocommit:
+                    connection.autocommit = True
+            except Exception:
+                discard = True
+        
+        with self._condition:
+            self._in_use.discard(connection)
+            
+            if discard or connection.closed or self._closed:
+                self._close_quietly(connection)
+                self._stats['connections_discarded'] += 1
+            else:
+                self._idle.append((connection, time.monotonic()))
+                self._prune_idle()
+            
+            self._condition.notify()
+    
+    def _prune_idle(self):
+        """최소 크기를 넘는 오래된 유휴 연결 정리 (잠금 보유 상태에서 호출)"""
+        now = time.monotonic()
+        while (len(self._idle) + len(self._in_use) > self.min_size
+               and self._idle and now - self._idle[0][1] > self.max_idle_time):
+            connection, _ = self._idle.popleft()
+            self._close_quietly(connection)
+            self._stats['connections_discarded'] += 1
+    
+    def closeall(self):
+        """모든 유휴 연결을 닫고 풀을 종료합니다."""
+        with self._condition:
+            self._closed = True
+            while self._idle:
+                connection, _ = self._idle.popleft()
+                self._close_quietly(connection)
+            self._condition.notify_all()
+    
+    def get_stats(self):
+        """풀 상태 통계 반환"""
+        with self._condition:
+            checkouts = self._stats['checkouts']
+            return {
+                'min_size': self.min_size,
+                'max_size': self.max_size,
+                'in_use': len(self._in_use),
+                'idle': len(self._idle),
+                **self._stats,
+                'total_wait_time': round(self._stats['total_wait_time'], 4),
+                'max_wait_time': round(self._stats['max_wait_time'], 4),
+                'average_wait_time': round(self._stats['total_wait_time'] / checkouts, 4) if checkouts else 0.0
+            }
+
 class DatabaseManager:
     """데이터베이스 연결 관리자 - PostgreSQL"""
     
+    _pool = None
+    _pool_lock = threading.Lock()
+    
+    @classmethod
+    def get_pool(cls):
+        """전역 커넥션 풀 반환 (최초 호출 시 생성)"""
+        if cls._pool is None:
+            with cls._pool_lock:
+                if cls._pool is None:
+                    cls._pool = ConnectionPool(DB_CONFIG, **POOL_CONFIG)
+        return cls._pool
+    
+    @classmethod
+    def get_pool_stats(cls):
+        """커넥션 풀 통계 반환 (풀이 아직 없으면 빈 dict)"""
+        if cls._pool is None:
+            return {}
+        return cls._pool.get_stats()
+    
+    @classmethod
+    def close_pool(cls):
+        """커넥션 풀 종료"""
+        with cls._pool_lock:
+            if cls._pool is not None:
+                cls._pool.closeall()
+                cls._pool = None
+    
     @staticmethod
     def get_connection():
-        """데이터베이스 연결 반환"""
+        """풀을 거치지 않는 독립 데이터베이스 연결 반환"""
         try:
             connection = psycopg2.connect(**DB_CONFIG)
             connection.autocommit = True
@@ -34,45 +260,83 @@ class DatabaseManager:
             print(f"데이터베이스 연결 오류: {e}")
             raise e
     
+    @staticmethod
+    def _is_connection_error(error):
+        """연결 자체가 손상된 오류인지 확인"""
+        return isinstance(error, (psycopg2.OperationalError, psycopg2.InterfaceError))
+    
     @staticmethod
     @contextmanager
     def get_db_connection():
-        """Context manager로 데이터베이스 연결 관리"""
+        """Context manager로 풀 연결 관리"""
+        pool = DatabaseManager.get_pool()
         connection = None
+        discard = False
         try:
-            connection = DatabaseManager.get_connection()
+            connection = pool.getconn()
             yield connection
         except Exception as e:
             if connection:
-                connection.rollback()
+                discard = DatabaseManager._is_connection_error(e)
+                if not discard and not connection.closed:
+                    connection.rollback()
             raise e
         finally:
             if connection:
-                connection.close()
+                pool.putconn(connection, discard=discard)
     
     @staticmethod
     @contextmanager
     def get_db_cursor(connection=None):
-        """Context manager로 커서 관리"""
-        should_close_connection = connection is None
+        """Context manager로 커서 관리 (연결을 넘기지 않으면 풀에서 가져옴)"""
+        pool = None
         cursor = None
+        discard = False
         
         try:
             if connection is None:
-                connection = DatabaseManager.get_connection()
+                pool = DatabaseManager.get_pool()
+                connection = pool.getconn()
             
             cursor = connection.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
             yield cursor, connection
             
         except Exception as e:
             if connection:
-                connection.rollback()
+                discard = DatabaseManager._is_connection_error(e)
+                if not discard and not connection.closed:
+                    connection.rollback()
             raise e
         finally:
-            if cursor:
+            if cursor and not cursor.closed:
                 cursor.close()
-            if should_close_connection and connection:
-                connection.close()
+            if pool and connection:
+                pool.putconn(connection, discard=discard)
+
+    @staticmethod
+    @contextmanager
+    def get_db_transaction():
+        """
+        Context manager로 단일 트랜잭션 관리
+        
+        블록 안의 모든 문장을 하나의 트랜잭션으로 묶어 정상 종료 시 커밋,
+        예외 발생 시 롤백합니다.
+        """
+        with DatabaseManager.get_db_connection() as connection:
+            connection.autocommit = False
+            cursor = connection.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
+            try:
+                yield cursor, connection
+                connection.commit()
+            except Exception:
+                if not connection.closed:
+                    connection.rollback()
+                raise
+            finally:
+                if not cursor.closed:
+                    cursor.close()
+                if not connection.closed:
+                    connection.autocommit = True
 
 def test_database_connection():
     """데이터베이스 연결 테스트"""
@@ -87,4 +351,5 @@ def test_database_connection():
         return False
 
 if __name__ == "__main__":
-    test_database_connection()
\ No newline at end of file
+    test_database_connection()
+    print(DatabaseManager.get_pool_stats())
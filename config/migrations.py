@@ -0,0 +1,88 @@
+"""
+데이터베이스 마이그레이션 실행기
+
+migrations/ 디렉터리의 NNN_설명.sql 파일을 버전 순서대로 적용하고
+schema_migrations 테이블에 적용 이력을 기록합니다.
+각 마이그레이션은 하나의 트랜잭션으로 실행됩니다.
+"""
+
+import os
+import re
+import logging
+from typing import List, Dict
+
+from config.database import DatabaseManager
+
+logger = logging.getLogger(__name__)
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'migrations')
+MIGRATION_FILE_PATTERN = re.compile(r'^(\d+)_[\w\-]+\.sql$')
+
+def list_migrations() -> List[Dict]:
+    """마이그레이션 파일 목록을 버전 순으로 반환"""
+    migrations = []
+    
+    for filename in os.listdir(MIGRATIONS_DIR):
+        match = MIGRATION_FILE_PATTERN.match(filename)
+        if match:
+            migrations.append({
+                'version': match.group(1),
+                'filename': filename,
+                'path': os.path.join(MIGRATIONS_DIR, filename)
+            })
+    
+    return sorted(migrations, key=lambda migration: int(migration['version']))
+
+def get_applied_versions() -> set:
+    """이미 적용된 마이그레이션 버전 집합 반환"""
+    with DatabaseManager.get_db_cursor() as (cursor, connection):
+        cursor.execute("""
+        CREATE TABLE IF NOT EXISTS schema_migrations (
+            version VARCHAR(20) PRIMARY KEY,
+            filename VARCHAR(200) NOT NULL,
+            applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        """)
+        cursor.execute("SELECT version FROM schema_migrations")
+        return {row['version'] for row in cursor.fetchall()}
+
+def apply_migrations() -> List[str]:
+    """
+    아직 적용되지 않은 마이그레이션을 순서대로 적용합니다.
+    
+    Returns:
+        List[str]: 이번에 적용된 마이그레이션 파일명 리스트
+    """
+    applied_versions = get_applied_versions()
+    applied_now = []
+    
+    for migration in list_migrations():
+        if migration['version'] in applied_versions:
+            continue
+        
+        with open(migration['path'], encoding='utf-8') as f:
+            sql = f.read()
+        
+        logger.info(f"마이그레이션 적용 중: {migration['filename']}")
+        
+        with DatabaseManager.get_db_transaction() as (cursor, connection):
+            cursor.execute(sql)
+            cursor.execute(
+                "INSERT INTO schema_migrations (version, filename) VALUES (%s, %s)",
+                (migration['version'], migration['filename'])
+            )
+        
+        applied_now.append(migration['filename'])
+        logger.info(f"마이그레이션 적용 완료: {migration['filename']}")
+    
+    if not applied_now:
+        logger.info("적용할 마이그레이션이 없습니다.")
+    
+    return applied_now
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    applied = apply_migrations()
+    print(f"적용된 마이그레이션: {len(applied)}개")
+    for filename in applied:
+        print(f"  - {filename}")
@@ -0,0 +1,37 @@
+-- 001: 공고 조회 핫 쿼리에 맞춘 복합/부분 인덱스
+--
+-- 대상 쿼리 (app/models/announcement.py)
+--   1. get_announcements_by_regions (전체)
+--        WHERE is_active ORDER BY created_at DESC, id DESC LIMIT n
+--   2. get_announcements_by_regions (지역 필터)
+--        WHERE region_code = ANY(...) AND is_active ORDER BY created_at DESC, id DESC LIMIT n
+--   3. get_announcements_by_regions (관리자 상태 필터)
+--        WHERE classification_status = ... AND is_active ORDER BY created_at DESC, id DESC LIMIT n
+--   4. get_unclassified_announcements
+--        WHERE region_code IS NULL AND is_active AND classification_status = 'pending'
+--        ORDER BY created_at DESC LIMIT n
+
+-- 1. 활성 공고 최신순 (키셋 페이지네이션 (created_at, id) 포함)
+CREATE INDEX IF NOT EXISTS idx_announcements_active_created
+    ON announcements (created_at DESC, id DESC)
+    WHERE is_active = true;
+
+-- 2. 지역별 활성 공고 최신순
+CREATE INDEX IF NOT EXISTS idx_announcements_active_region_created
+    ON announcements (region_code, created_at DESC, id DESC)
+    WHERE is_active = true;
+
+-- 3. 분류 상태별 활성 공고 최신순
+CREATE INDEX IF NOT EXISTS idx_announcements_active_status_created
+    ON announcements (classification_status, created_at DESC, id DESC)
+    WHERE is_active = true;
+
+-- 4. 미분류 공고 (분류되면 인덱스에서 빠지므로 크기가 백로그 크기에 비례)
+CREATE INDEX IF NOT EXISTS idx_announcements_unclassified
+    ON announcements (created_at DESC)
+    WHERE region_code IS NULL AND is_active = true AND classification_status = 'pending';
+
+-- pblancId UNIQUE 제약조건이 이미 인덱스를 제공하므로 중복 인덱스 제거
+DROP INDEX IF EXISTS idx_announcements_pblancId;
+
+ANALYZE announcements;
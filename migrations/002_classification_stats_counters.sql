@@ -0,0 +1,64 @@
+-- 002: 분류 통계 카운터 테이블
+--
+-- get_classification_stats가 매번 announcements 전체를 집계하지 않도록
+-- 활성 공고 수를 (region_code, classification_method) 단위로 유지합니다.
+-- 미분류/분류 방법 없음은 빈 문자열('')로 저장합니다.
+-- 카운터는 announcements 트리거로 같은 트랜잭션 안에서 갱신됩니다.
+
+CREATE TABLE IF NOT EXISTS announcement_stats_counters (
+    region_code VARCHAR(20) NOT NULL DEFAULT '',
+    classification_method VARCHAR(20) NOT NULL DEFAULT '',
+    count BIGINT NOT NULL DEFAULT 0,
+    PRIMARY KEY (region_code, classification_method)
+);
+
+CREATE OR REPLACE FUNCTION announcement_stats_counters_apply()
+RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') AND COALESCE(OLD.is_active, false) THEN
+        INSERT INTO announcement_stats_counters (region_code, classification_method, count)
+        VALUES (COALESCE(OLD.region_code, ''), COALESCE(OLD.classification_method, ''), -1)
+        ON CONFLICT (region_code, classification_method)
+        DO UPDATE SET count = announcement_stats_counters.count - 1;
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') AND COALESCE(NEW.is_active, false) THEN
+        INSERT INTO announcement_stats_counters (region_code, classification_method, count)
+        VALUES (COALESCE(NEW.region_code, ''), COALESCE(NEW.classification_method, ''), 1)
+        ON CONFLICT (region_code, classification_method)
+        DO UPDATE SET count = announcement_stats_counters.count + 1;
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_announcement_stats_insert ON announcements;
+CREATE TRIGGER trg_announcement_stats_insert
+    AFTER INSERT ON announcements
+    FOR EACH ROW EXECUTE FUNCTION announcement_stats_counters_apply();
+
+DROP TRIGGER IF EXISTS trg_announcement_stats_update ON announcements;
+CREATE TRIGGER trg_announcement_stats_update
+    AFTER UPDATE OF region_code, classification_method, is_active ON announcements
+    FOR EACH ROW
+    WHEN (OLD.region_code IS DISTINCT FROM NEW.region_code
+          OR OLD.classification_method IS DISTINCT FROM NEW.classification_method
+          OR OLD.is_active IS DISTINCT FROM NEW.is_active)
+    EXECUTE FUNCTION announcement_stats_counters_apply();
+
+DROP TRIGGER IF EXISTS trg_announcement_stats_delete ON announcements;
+CREATE TRIGGER trg_announcement_stats_delete
+    AFTER DELETE ON announcements
+    FOR EACH ROW EXECUTE FUNCTION announcement_stats_counters_apply();
+
+-- 초기값 적재 (적재 중 쓰기를 막아 트리거 반영분과 겹치지 않도록 잠금)
+LOCK TABLE announcements IN SHARE ROW EXCLUSIVE MODE;
+
+DELETE FROM announcement_stats_counters;
+
+INSERT INTO announcement_stats_counters (region_code, classification_method, count)
+SELECT COALESCE(region_code, ''), COALESCE(classification_method, ''), COUNT(*)
+FROM announcements
+WHERE is_active = true
+GROUP BY COALESCE(region_code, ''), COALESCE(classification_method, '');
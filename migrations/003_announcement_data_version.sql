@@ -0,0 +1,32 @@
+-- 003: 공고 데이터 버전
+--
+-- announcements에 INSERT/UPDATE/DELETE 문이 실행될 때마다 버전을 1 올립니다.
+-- /api/announcements, /api/stats의 ETag가 이 값에서 만들어지므로
+-- 클라이언트는 데이터가 바뀌지 않았으면 304 응답을 받습니다.
+-- 행 단위가 아닌 문장 단위 트리거라 일괄 삽입/분류도 한 번만 갱신합니다.
+
+CREATE TABLE IF NOT EXISTS data_versions (
+    name VARCHAR(50) PRIMARY KEY,
+    version BIGINT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+INSERT INTO data_versions (name, version)
+VALUES ('announcements', 1)
+ON CONFLICT (name) DO NOTHING;
+
+CREATE OR REPLACE FUNCTION bump_announcements_data_version()
+RETURNS trigger AS $$
+BEGIN
+    UPDATE data_versions
+    SET version = version + 1,
+        updated_at = CURRENT_TIMESTAMP
+    WHERE name = 'announcements';
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_announcements_data_version ON announcements;
+CREATE TRIGGER trg_announcements_data_version
+    AFTER INSERT OR UPDATE OR DELETE ON announcements
+    FOR EACH STATEMENT EXECUTE FUNCTION bump_announcements_data_version();
@@ -0,0 +1,315 @@
+-- 004: 전국 지역 카탈로그
+--
+-- 경남 21개 지역에 더해 나머지 16개 광역시도와 그 하위 시군구를 regions에 추가합니다.
+-- (전국 17개 광역시도, 226개 자치 시군구 + 제주 행정시 2개)
+-- aliases는 키워드 분류기가 지역명 외에 함께 인식할 표기입니다.
+-- '시/군/구' 접미사를 뗀 약칭은 분류기가 지역명에서 자동으로 만들므로 여기에는 넣지 않습니다.
+
+ALTER TABLE regions ADD COLUMN IF NOT EXISTS aliases TEXT[] NOT NULL DEFAULT '{}';
+
+-- GYEONGNAM_01처럼 10자를 넘는 지역 코드를 저장할 수 있도록 확장
+-- (002의 UPDATE OF region_code 트리거가 컬럼에 의존하므로 잠시 내렸다가 같은 정의로 다시 생성)
+DROP TRIGGER IF EXISTS trg_announcement_stats_update ON announcements;
+ALTER TABLE announcements ALTER COLUMN region_code TYPE VARCHAR(20);
+CREATE TRIGGER trg_announcement_stats_update
+    AFTER UPDATE OF region_code, classification_method, is_active ON announcements
+    FOR EACH ROW
+    WHEN (OLD.region_code IS DISTINCT FROM NEW.region_code
+          OR OLD.classification_method IS DISTINCT FROM NEW.classification_method
+          OR OLD.is_active IS DISTINCT FROM NEW.is_active)
+    EXECUTE FUNCTION announcement_stats_counters_apply();
+
+-- 기존 지역 별칭 (기존 키워드 분류 사전과 동일)
+UPDATE regions SET aliases = ARRAY['전 지역', '모든 지역']::TEXT[] WHERE code = 'ALL';
+UPDATE regions SET aliases = ARRAY['경남']::TEXT[] WHERE code = 'GYEONGNAM';
+UPDATE regions SET aliases = ARRAY['수도권', '영남권', '호남권', '충청권']::TEXT[] WHERE code = 'OTHER';
+
+-- 서울특별시
+INSERT INTO regions (code, name, type, parent_code, aliases) VALUES
+    ('SEOUL', '서울특별시', 'provincial', NULL, ARRAY['서울', '서울시']::TEXT[]),
+    ('SEOUL_01', '종로구', 'municipal', 'SEOUL', '{}'::TEXT[]),
+    ('SEOUL_02', '중구', 'municipal', 'SEOUL', '{}'::TEXT[]),
+    ('SEOUL_03', '용산구', 'municipal', 'SEOUL', '{}'::TEXT[]),
+    ('SEOUL_04', '성동구', 'municipal', 'SEOUL', '{}'::TEXT[]),
+    ('SEOUL_05', '광진구', 'municipal', 'SEOUL', '{}'::TEXT[]),
+    ('SEOUL_06', '동대문구', 'municipal', 'SEOUL', '{}'::TEXT[]),
+    ('SEOUL_07', '중랑구', 'municipal', 'SEOUL', '{}'::TEXT[]),
+    ('SEOUL_08', '성북구', 'municipal', 'SEOUL', '{}'::TEXT[]),
+    ('SEOUL_09', '강북구', 'municipal', 'SEOUL', '{}'::TEXT[]),
+    ('SEOUL_10', '도봉구', 'municipal', 'SEOUL', '{}'::TEXT[]),
+    ('SEOUL_11', '노원구', 'municipal', 'SEOUL', '{}'::TEXT[]),
+    ('SEOUL_12', '은평구', 'municipal', 'SEOUL', '{}'::TEXT[]),
+    ('SEOUL_13', '서대문구', 'municipal', 'SEOUL', '{}'::TEXT[]),
+    ('SEOUL_14', '마포구', 'municipal', 'SEOUL', '{}'::TEXT[]),
+    ('SEOUL_15', '양천구', 'municipal', 'SEOUL', '{}'::TEXT[]),
+    ('SEOUL_16', '강서구', 'municipal', 'SEOUL', '{}'::TEXT[]),
+    ('SEOUL_17', '구로구', 'municipal', 'SEOUL', '{}'::TEXT[]),
+    ('SEOUL_18', '금천구', 'municipal', 'SEOUL', '{}'::TEXT[]),
+    ('SEOUL_19', '영등포구', 'municipal', 'SEOUL', '{}'::TEXT[]),
+    ('SEOUL_20', '동작구', 'municipal', 'SEOUL', '{}'::TEXT[]),
+    ('SEOUL_21', '관악구', 'municipal', 'SEOUL', '{}'::TEXT[]),
+    ('SEOUL_22', '서초구', 'municipal', 'SEOUL', '{}'::TEXT[]),
+    ('SEOUL_23', '강남구', 'municipal', 'SEOUL', '{}'::TEXT[]),
+    ('SEOUL_24', '송파구', 'municipal', 'SEOUL', '{}'::TEXT[]),
+    ('SEOUL_25', '강동구', 'municipal', 'SEOUL', '{}'::TEXT[])
+ON CONFLICT (code) DO NOTHING;
+
+-- 부산광역시
+INSERT INTO regions (code, name, type, parent_code, aliases) VALUES
+    ('BUSAN', '부산광역시', 'provincial', NULL, ARRAY['부산', '부산시']::TEXT[]),
+    ('BUSAN_01', '중구', 'municipal', 'BUSAN', '{}'::TEXT[]),
+    ('BUSAN_02', '서구', 'municipal', 'BUSAN', '{}'::TEXT[]),
+    ('BUSAN_03', '동구', 'municipal', 'BUSAN', '{}'::TEXT[]),
+    ('BUSAN_04', '영도구', 'municipal', 'BUSAN', '{}'::TEXT[]),
+    ('BUSAN_05', '부산진구', 'municipal', 'BUSAN', '{}'::TEXT[]),
+    ('BUSAN_06', '동래구', 'municipal', 'BUSAN', '{}'::TEXT[]),
+    ('BUSAN_07', '남구', 'municipal', 'BUSAN', '{}'::TEXT[]),
+    ('BUSAN_08', '북구', 'municipal', 'BUSAN', '{}'::TEXT[]),
+    ('BUSAN_09', '해운대구', 'municipal', 'BUSAN', '{}'::TEXT[]),
+    ('BUSAN_10', '사하구', 'municipal', 'BUSAN', '{}'::TEXT[]),
+    ('BUSAN_11', '금정구', 'municipal', 'BUSAN', '{}'::TEXT[]),
+    ('BUSAN_12', '강서구', 'municipal', 'BUSAN', '{}'::TEXT[]),
+    ('BUSAN_13', '연제구', 'municipal', 'BUSAN', '{}'::TEXT[]),
+    ('BUSAN_14', '수영구', 'municipal', 'BUSAN', '{}'::TEXT[]),
+    ('BUSAN_15', '사상구', 'municipal', 'BUSAN', '{}'::TEXT[]),
+    ('BUSAN_16', '기장군', 'municipal', 'BUSAN', '{}'::TEXT[])
+ON CONFLICT (code) DO NOTHING;
+
+-- 대구광역시
+INSERT INTO regions (code, name, type, parent_code, aliases) VALUES
+    ('DAEGU', '대구광역시', 'provincial', NULL, ARRAY['대구', '대구시']::TEXT[]),
+    ('DAEGU_01', '중구', 'municipal', 'DAEGU', '{}'::TEXT[]),
+    ('DAEGU_02', '동구', 'municipal', 'DAEGU', '{}'::TEXT[]),
+    ('DAEGU_03', '서구', 'municipal', 'DAEGU', '{}'::TEXT[]),
+    ('DAEGU_04', '남구', 'municipal', 'DAEGU', '{}'::TEXT[]),
+    ('DAEGU_05', '북구', 'municipal', 'DAEGU', '{}'::TEXT[]),
+    ('DAEGU_06', '수성구', 'municipal', 'DAEGU', '{}'::TEXT[]),
+    ('DAEGU_07', '달서구', 'municipal', 'DAEGU', '{}'::TEXT[]),
+    ('DAEGU_08', '달성군', 'municipal', 'DAEGU', '{}'::TEXT[]),
+    ('DAEGU_09', '군위군', 'municipal', 'DAEGU', '{}'::TEXT[])
+ON CONFLICT (code) DO NOTHING;
+
+-- 인천광역시
+INSERT INTO regions (code, name, type, parent_code, aliases) VALUES
+    ('INCHEON', '인천광역시', 'provincial', NULL, ARRAY['인천', '인천시']::TEXT[]),
+    ('INCHEON_01', '중구', 'municipal', 'INCHEON', '{}'::TEXT[]),
+    ('INCHEON_02', '동구', 'municipal', 'INCHEON', '{}'::TEXT[]),
+    ('INCHEON_03', '미추홀구', 'municipal', 'INCHEON', '{}'::TEXT[]),
+    ('INCHEON_04', '연수구', 'municipal', 'INCHEON', '{}'::TEXT[]),
+    ('INCHEON_05', '남동구', 'municipal', 'INCHEON', '{}'::TEXT[]),
+    ('INCHEON_06', '부평구', 'municipal', 'INCHEON', '{}'::TEXT[]),
+    ('INCHEON_07', '계양구', 'municipal', 'INCHEON', '{}'::TEXT[]),
+    ('INCHEON_08', '서구', 'municipal', 'INCHEON', '{}'::TEXT[]),
+    ('INCHEON_09', '강화군', 'municipal', 'INCHEON', '{}'::TEXT[]),
+    ('INCHEON_10', '옹진군', 'municipal', 'INCHEON', '{}'::TEXT[])
+ON CONFLICT (code) DO NOTHING;
+
+-- 광주광역시
+INSERT INTO regions (code, name, type, parent_code, aliases) VALUES
+    ('GWANGJU', '광주광역시', 'provincial', NULL, ARRAY['광주']::TEXT[]),
+    ('GWANGJU_01', '동구', 'municipal', 'GWANGJU', '{}'::TEXT[]),
+    ('GWANGJU_02', '서구', 'municipal', 'GWANGJU', '{}'::TEXT[]),
+    ('GWANGJU_03', '남구', 'municipal', 'GWANGJU', '{}'::TEXT[]),
+    ('GWANGJU_04', '북구', 'municipal', 'GWANGJU', '{}'::TEXT[]),
+    ('GWANGJU_05', '광산구', 'municipal', 'GWANGJU', '{}'::TEXT[])
+ON CONFLICT (code) DO NOTHING;
+
+-- 대전광역시
+INSERT INTO regions (code, name, type, parent_code, aliases) VALUES
+    ('DAEJEON', '대전광역시', 'provincial', NULL, ARRAY['대전', '대전시']::TEXT[]),
+    ('DAEJEON_01', '동구', 'municipal', 'DAEJEON', '{}'::TEXT[]),
+    ('DAEJEON_02', '중구', 'municipal', 'DAEJEON', '{}'::TEXT[]),
+    ('DAEJEON_03', '서구', 'municipal', 'DAEJEON', '{}'::TEXT[]),
+    ('DAEJEON_04', '유성구', 'municipal', 'DAEJEON', '{}'::TEXT[]),
+    ('DAEJEON_05', '대덕구', 'municipal', 'DAEJEON', '{}'::TEXT[])
+ON CONFLICT (code) DO NOTHING;
+
+-- 울산광역시
+INSERT INTO regions (code, name, type, parent_code, aliases) VALUES
+    ('ULSAN', '울산광역시', 'provincial', NULL, ARRAY['울산', '울산시']::TEXT[]),
+    ('ULSAN_01', '중구', 'municipal', 'ULSAN', '{}'::TEXT[]),
+    ('ULSAN_02', '남구', 'municipal', 'ULSAN', '{}'::TEXT[]),
+    ('ULSAN_03', '동구', 'municipal', 'ULSAN', '{}'::TEXT[]),
+    ('ULSAN_04', '북구', 'municipal', 'ULSAN', '{}'::TEXT[]),
+    ('ULSAN_05', '울주군', 'municipal', 'ULSAN', '{}'::TEXT[])
+ON CONFLICT (code) DO NOTHING;
+
+-- 세종특별자치시
+INSERT INTO regions (code, name, type, parent_code, aliases) VALUES
+    ('SEJONG', '세종특별자치시', 'provincial', NULL, ARRAY['세종', '세종시']::TEXT[])
+ON CONFLICT (code) DO NOTHING;
+
+-- 경기도
+INSERT INTO regions (code, name, type, parent_code, aliases) VALUES
+    ('GYEONGGI', '경기도', 'provincial', NULL, ARRAY['경기']::TEXT[]),
+    ('GYEONGGI_01', '수원시', 'municipal', 'GYEONGGI', '{}'::TEXT[]),
+    ('GYEONGGI_02', '성남시', 'municipal', 'GYEONGGI', '{}'::TEXT[]),
+    ('GYEONGGI_03', '의정부시', 'municipal', 'GYEONGGI', '{}'::TEXT[]),
+    ('GYEONGGI_04', '안양시', 'municipal', 'GYEONGGI', '{}'::TEXT[]),
+    ('GYEONGGI_05', '부천시', 'municipal', 'GYEONGGI', '{}'::TEXT[]),
+    ('GYEONGGI_06', '광명시', 'municipal', 'GYEONGGI', '{}'::TEXT[]),
+    ('GYEONGGI_07', '평택시', 'municipal', 'GYEONGGI', '{}'::TEXT[]),
+    ('GYEONGGI_08', '동두천시', 'municipal', 'GYEONGGI', '{}'::TEXT[]),
+    ('GYEONGGI_09', '안산시', 'municipal', 'GYEONGGI', '{}'::TEXT[]),
+    ('GYEONGGI_10', '고양시', 'municipal', 'GYEONGGI', '{}'::TEXT[]),
+    ('GYEONGGI_11', '과천시', 'municipal', 'GYEONGGI', '{}'::TEXT[]),
+    ('GYEONGGI_12', '구리시', 'municipal', 'GYEONGGI', '{}'::TEXT[]),
+    ('GYEONGGI_13', '남양주시', 'municipal', 'GYEONGGI', '{}'::TEXT[]),
+    ('GYEONGGI_14', '오산시', 'municipal', 'GYEONGGI', '{}'::TEXT[]),
+    ('GYEONGGI_15', '시흥시', 'municipal', 'GYEONGGI', '{}'::TEXT[]),
+    ('GYEONGGI_16', '군포시', 'municipal', 'GYEONGGI', '{}'::TEXT[]),
+    ('GYEONGGI_17', '의왕시', 'municipal', 'GYEONGGI', '{}'::TEXT[]),
+    ('GYEONGGI_18', '하남시', 'municipal', 'GYEONGGI', '{}'::TEXT[]),
+    ('GYEONGGI_19', '용인시', 'municipal', 'GYEONGGI', '{}'::TEXT[]),
+    ('GYEONGGI_20', '파주시', 'municipal', 'GYEONGGI', '{}'::TEXT[]),
+    ('GYEONGGI_21', '이천시', 'municipal', 'GYEONGGI', '{}'::TEXT[]),
+    ('GYEONGGI_22', '안성시', 'municipal', 'GYEONGGI', '{}'::TEXT[]),
+    ('GYEONGGI_23', '김포시', 'municipal', 'GYEONGGI', '{}'::TEXT[]),
+    ('GYEONGGI_24', '화성시', 'municipal', 'GYEONGGI', '{}'::TEXT[]),
+    ('GYEONGGI_25', '광주시', 'municipal', 'GYEONGGI', '{}'::TEXT[]),
+    ('GYEONGGI_26', '양주시', 'municipal', 'GYEONGGI', '{}'::TEXT[]),
+    ('GYEONGGI_27', '포천시', 'municipal', 'GYEONGGI', '{}'::TEXT[]),
+    ('GYEONGGI_28', '여주시', 'municipal', 'GYEONGGI', '{}'::TEXT[]),
+    ('GYEONGGI_29', '연천군', 'municipal', 'GYEONGGI', '{}'::TEXT[]),
+    ('GYEONGGI_30', '가평군', 'municipal', 'GYEONGGI', '{}'::TEXT[]),
+    ('GYEONGGI_31', '양평군', 'municipal', 'GYEONGGI', '{}'::TEXT[])
+ON CONFLICT (code) DO NOTHING;
+
+-- 강원특별자치도
+INSERT INTO regions (code, name, type, parent_code, aliases) VALUES
+    ('GANGWON', '강원특별자치도', 'provincial', NULL, ARRAY['강원', '강원도']::TEXT[]),
+    ('GANGWON_01', '춘천시', 'municipal', 'GANGWON', '{}'::TEXT[]),
+    ('GANGWON_02', '원주시', 'municipal', 'GANGWON', '{}'::TEXT[]),
+    ('GANGWON_03', '강릉시', 'municipal', 'GANGWON', '{}'::TEXT[]),
+    ('GANGWON_04', '동해시', 'municipal', 'GANGWON', '{}'::TEXT[]),
+    ('GANGWON_05', '태백시', 'municipal', 'GANGWON', '{}'::TEXT[]),
+    ('GANGWON_06', '속초시', 'municipal', 'GANGWON', '{}'::TEXT[]),
+    ('GANGWON_07', '삼척시', 'municipal', 'GANGWON', '{}'::TEXT[]),
+    ('GANGWON_08', '홍천군', 'municipal', 'GANGWON', '{}'::TEXT[]),
+    ('GANGWON_09', '횡성군', 'municipal', 'GANGWON', '{}'::TEXT[]),
+    ('GANGWON_10', '영월군', 'municipal', 'GANGWON', '{}'::TEXT[]),
+    ('GANGWON_11', '평창군', 'municipal', 'GANGWON', '{}'::TEXT[]),
+    ('GANGWON_12', '정선군', 'municipal', 'GANGWON', '{}'::TEXT[]),
+    ('GANGWON_13', '철원군', 'municipal', 'GANGWON', '{}'::TEXT[]),
+    ('GANGWON_14', '화천군', 'municipal', 'GANGWON', '{}'::TEXT[]),
+    ('GANGWON_15', '양구군', 'municipal', 'GANGWON', '{}'::TEXT[]),
+    ('GANGWON_16', '인제군', 'municipal', 'GANGWON', '{}'::TEXT[]),
+    ('GANGWON_17', '고성군', 'municipal', 'GANGWON', '{}'::TEXT[]),
+    ('GANGWON_18', '양양군', 'municipal', 'GANGWON', '{}'::TEXT[])
+ON CONFLICT (code) DO NOTHING;
+
+-- 충청북도
+INSERT INTO regions (code, name, type, parent_code, aliases) VALUES
+    ('CHUNGBUK', '충청북도', 'provincial', NULL, ARRAY['충북']::TEXT[]),
+    ('CHUNGBUK_01', '청주시', 'municipal', 'CHUNGBUK', '{}'::TEXT[]),
+    ('CHUNGBUK_02', '충주시', 'municipal', 'CHUNGBUK', '{}'::TEXT[]),
+    ('CHUNGBUK_03', '제천시', 'municipal', 'CHUNGBUK', '{}'::TEXT[]),
+    ('CHUNGBUK_04', '보은군', 'municipal', 'CHUNGBUK', '{}'::TEXT[]),
+    ('CHUNGBUK_05', '옥천군', 'municipal', 'CHUNGBUK', '{}'::TEXT[]),
+    ('CHUNGBUK_06', '영동군', 'municipal', 'CHUNGBUK', '{}'::TEXT[]),
+    ('CHUNGBUK_07', '증평군', 'municipal', 'CHUNGBUK', '{}'::TEXT[]),
+    ('CHUNGBUK_08', '진천군', 'municipal', 'CHUNGBUK', '{}'::TEXT[]),
+    ('CHUNGBUK_09', '괴산군', 'municipal', 'CHUNGBUK', '{}'::TEXT[]),
+    ('CHUNGBUK_10', '음성군', 'municipal', 'CHUNGBUK', '{}'::TEXT[]),
+    ('CHUNGBUK_11', '단양군', 'municipal', 'CHUNGBUK', '{}'::TEXT[])
+ON CONFLICT (code) DO NOTHING;
+
+-- 충청남도
+INSERT INTO regions (code, name, type, parent_code, aliases) VALUES
+    ('CHUNGNAM', '충청남도', 'provincial', NULL, ARRAY['충남']::TEXT[]),
+    ('CHUNGNAM_01', '천안시', 'municipal', 'CHUNGNAM', '{}'::TEXT[]),
+    ('CHUNGNAM_02', '공주시', 'municipal', 'CHUNGNAM', '{}'::TEXT[]),
+    ('CHUNGNAM_03', '보령시', 'municipal', 'CHUNGNAM', '{}'::TEXT[]),
+    ('CHUNGNAM_04', '아산시', 'municipal', 'CHUNGNAM', '{}'::TEXT[]),
+    ('CHUNGNAM_05', '서산시', 'municipal', 'CHUNGNAM', '{}'::TEXT[]),
+    ('CHUNGNAM_06', '논산시', 'municipal', 'CHUNGNAM', '{}'::TEXT[]),
+    ('CHUNGNAM_07', '계룡시', 'municipal', 'CHUNGNAM', '{}'::TEXT[]),
+    ('CHUNGNAM_08', '당진시', 'municipal', 'CHUNGNAM', '{}'::TEXT[]),
+    ('CHUNGNAM_09', '금산군', 'municipal', 'CHUNGNAM', '{}'::TEXT[]),
+    ('CHUNGNAM_10', '부여군', 'municipal', 'CHUNGNAM', '{}'::TEXT[]),
+    ('CHUNGNAM_11', '서천군', 'municipal', 'CHUNGNAM', '{}'::TEXT[]),
+    ('CHUNGNAM_12', '청양군', 'municipal', 'CHUNGNAM', '{}'::TEXT[]),
+    ('CHUNGNAM_13', '홍성군', 'municipal', 'CHUNGNAM', '{}'::TEXT[]),
+    ('CHUNGNAM_14', '예산군', 'municipal', 'CHUNGNAM', '{}'::TEXT[]),
+    ('CHUNGNAM_15', '태안군', 'municipal', 'CHUNGNAM', '{}'::TEXT[])
+ON CONFLICT (code) DO NOTHING;
+
+-- 전북특별자치도
+INSERT INTO regions (code, name, type, parent_code, aliases) VALUES
+    ('JEONBUK', '전북특별자치도', 'provincial', NULL, ARRAY['전북', '전라북도']::TEXT[]),
+    ('JEONBUK_01', '전주시', 'municipal', 'JEONBUK', '{}'::TEXT[]),
+    ('JEONBUK_02', '군산시', 'municipal', 'JEONBUK', '{}'::TEXT[]),
+    ('JEONBUK_03', '익산시', 'municipal', 'JEONBUK', '{}'::TEXT[]),
+    ('JEONBUK_04', '정읍시', 'municipal', 'JEONBUK', '{}'::TEXT[]),
+    ('JEONBUK_05', '남원시', 'municipal', 'JEONBUK', '{}'::TEXT[]),
+    ('JEONBUK_06', '김제시', 'municipal', 'JEONBUK', '{}'::TEXT[]),
+    ('JEONBUK_07', '완주군', 'municipal', 'JEONBUK', '{}'::TEXT[]),
+    ('JEONBUK_08', '진안군', 'municipal', 'JEONBUK', '{}'::TEXT[]),
+    ('JEONBUK_09', '무주군', 'municipal', 'JEONBUK', '{}'::TEXT[]),
+    ('JEONBUK_10', '장수군', 'municipal', 'JEONBUK', '{}'::TEXT[]),
+    ('JEONBUK_11', '임실군', 'municipal', 'JEONBUK', '{}'::TEXT[]),
+    ('JEONBUK_12', '순창군', 'municipal', 'JEONBUK', '{}'::TEXT[]),
+    ('JEONBUK_13', '고창군', 'municipal', 'JEONBUK', '{}'::TEXT[]),
+    ('JEONBUK_14', '부안군', 'municipal', 'JEONBUK', '{}'::TEXT[])
+ON CONFLICT (code) DO NOTHING;
+
+-- 전라남도
+INSERT INTO regions (code, name, type, parent_code, aliases) VALUES
+    ('JEONNAM', '전라남도', 'provincial', NULL, ARRAY['전남']::TEXT[]),
+    ('JEONNAM_01', '목포시', 'municipal', 'JEONNAM', '{}'::TEXT[]),
+    ('JEONNAM_02', '여수시', 'municipal', 'JEONNAM', '{}'::TEXT[]),
+    ('JEONNAM_03', '순천시', 'municipal', 'JEONNAM', '{}'::TEXT[]),
+    ('JEONNAM_04', '나주시', 'municipal', 'JEONNAM', '{}'::TEXT[]),
+    ('JEONNAM_05', '광양시', 'municipal', 'JEONNAM', '{}'::TEXT[]),
+    ('JEONNAM_06', '담양군', 'municipal', 'JEONNAM', '{}'::TEXT[]),
+    ('JEONNAM_07', '곡성군', 'municipal', 'JEONNAM', '{}'::TEXT[]),
+    ('JEONNAM_08', '구례군', 'municipal', 'JEONNAM', '{}'::TEXT[]),
+    ('JEONNAM_09', '고흥군', 'municipal', 'JEONNAM', '{}'::TEXT[]),
+    ('JEONNAM_10', '보성군', 'municipal', 'JEONNAM', '{}'::TEXT[]),
+    ('JEONNAM_11', '화순군', 'municipal', 'JEONNAM', '{}'::TEXT[]),
+    ('JEONNAM_12', '장흥군', 'municipal', 'JEONNAM', '{}'::TEXT[]),
+    ('JEONNAM_13', '강진군', 'municipal', 'JEONNAM', '{}'::TEXT[]),
+    ('JEONNAM_14', '해남군', 'municipal', 'JEONNAM', '{}'::TEXT[]),
+    ('JEONNAM_15', '영암군', 'municipal', 'JEONNAM', '{}'::TEXT[]),
+    ('JEONNAM_16', '무안군', 'municipal', 'JEONNAM', '{}'::TEXT[]),
+    ('JEONNAM_17', '함평군', 'municipal', 'JEONNAM', '{}'::TEXT[]),
+    ('JEONNAM_18', '영광군', 'municipal', 'JEONNAM', '{}'::TEXT[]),
+    ('JEONNAM_19', '장성군', 'municipal', 'JEONNAM', '{}'::TEXT[]),
+    ('JEONNAM_20', '완도군', 'municipal', 'JEONNAM', '{}'::TEXT[]),
+    ('JEONNAM_21', '진도군', 'municipal', 'JEONNAM', '{}'::TEXT[]),
+    ('JEONNAM_22', '신안군', 'municipal', 'JEONNAM', '{}'::TEXT[])
+ON CONFLICT (code) DO NOTHING;
+
+-- 경상북도
+INSERT INTO regions (code, name, type, parent_code, aliases) VALUES
+    ('GYEONGBUK', '경상북도', 'provincial', NULL, ARRAY['경북']::TEXT[]),
+    ('GYEONGBUK_01', '포항시', 'municipal', 'GYEONGBUK', '{}'::TEXT[]),
+    ('GYEONGBUK_02', '경주시', 'municipal', 'GYEONGBUK', '{}'::TEXT[]),
+    ('GYEONGBUK_03', '김천시', 'municipal', 'GYEONGBUK', '{}'::TEXT[]),
+    ('GYEONGBUK_04', '안동시', 'municipal', 'GYEONGBUK', '{}'::TEXT[]),
+    ('GYEONGBUK_05', '구미시', 'municipal', 'GYEONGBUK', '{}'::TEXT[]),
+    ('GYEONGBUK_06', '영주시', 'municipal', 'GYEONGBUK', '{}'::TEXT[]),
+    ('GYEONGBUK_07', '영천시', 'municipal', 'GYEONGBUK', '{}'::TEXT[]),
+    ('GYEONGBUK_08', '상주시', 'municipal', 'GYEONGBUK', '{}'::TEXT[]),
+    ('GYEONGBUK_09', '문경시', 'municipal', 'GYEONGBUK', '{}'::TEXT[]),
+    ('GYEONGBUK_10', '경산시', 'municipal', 'GYEONGBUK', '{}'::TEXT[]),
+    ('GYEONGBUK_11', '의성군', 'municipal', 'GYEONGBUK', '{}'::TEXT[]),
+    ('GYEONGBUK_12', '청송군', 'municipal', 'GYEONGBUK', '{}'::TEXT[]),
+    ('GYEONGBUK_13', '영양군', 'municipal', 'GYEONGBUK', '{}'::TEXT[]),
+    ('GYEONGBUK_14', '영덕군', 'municipal', 'GYEONGBUK', '{}'::TEXT[]),
+    ('GYEONGBUK_15', '청도군', 'municipal', 'GYEONGBUK', '{}'::TEXT[]),
+    ('GYEONGBUK_16', '고령군', 'municipal', 'GYEONGBUK', '{}'::TEXT[]),
+    ('GYEONGBUK_17', '성주군', 'municipal', 'GYEONGBUK', '{}'::TEXT[]),
+    ('GYEONGBUK_18', '칠곡군', 'municipal', 'GYEONGBUK', '{}'::TEXT[]),
+    ('GYEONGBUK_19', '예천군', 'municipal', 'GYEONGBUK', '{}'::TEXT[]),
+    ('GYEONGBUK_20', '봉화군', 'municipal', 'GYEONGBUK', '{}'::TEXT[]),
+    ('GYEONGBUK_21', '울진군', 'municipal', 'GYEONGBUK', '{}'::TEXT[]),
+    ('GYEONGBUK_22', '울릉군', 'municipal', 'GYEONGBUK', '{}'::TEXT[])
+ON CONFLICT (code) DO NOTHING;
+
+-- 제주특별자치도
+INSERT INTO regions (code, name, type, parent_code, aliases) VALUES
+    ('JEJU', '제주특별자치도', 'provincial', NULL, ARRAY['제주', '제주도']::TEXT[]),
+    ('JEJU_01', '제주시', 'municipal', 'JEJU', '{}'::TEXT[]),
+    ('JEJU_02', '서귀포시', 'municipal', 'JEJU', '{}'::TEXT[])
+ON CONFLICT (code) DO NOTHING;
@@ -0,0 +1,21 @@
+-- 005: AI 분류 결과 캐시
+--
+-- 같은 사업이 pblancId만 바뀌어 재공고되는 경우가 많아,
+-- 프롬프트에 들어가는 필드(공고명/소관기관/수행기관/사업개요 앞 200자/문의처)를
+-- 정규화한 해시로 Gemini 분류 결과를 저장하고 재사용합니다.
+-- 모델이 바뀌면 다른 키가 되므로 이전 모델의 결과는 사용되지 않습니다.
+
+CREATE TABLE IF NOT EXISTS ai_classification_cache (
+    content_hash CHAR(64) NOT NULL,
+    model_name VARCHAR(100) NOT NULL,
+    region_code VARCHAR(20) NOT NULL,
+    confidence DECIMAL(3,2),
+    reason TEXT,
+    hit_count INTEGER NOT NULL DEFAULT 0,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    last_hit_at TIMESTAMP,
+    PRIMARY KEY (content_hash, model_name)
+);
+
+CREATE INDEX IF NOT EXISTS idx_ai_classification_cache_created
+    ON ai_classification_cache (created_at);
@@ -0,0 +1,8 @@
+-- 006: 로컬 분류기 분류 방법 추가
+--
+-- 키워드 분류와 Gemini 사이에서 프로세스 내 로컬 분류기(app/services/local_classifier.py)가
+-- 분류한 공고는 classification_method = 'local'로 저장합니다.
+
+ALTER TABLE announcements DROP CONSTRAINT IF EXISTS announcements_classification_method_check;
+ALTER TABLE announcements ADD CONSTRAINT announcements_classification_method_check
+    CHECK (classification_method IN ('keyword', 'local', 'ai', 'manual'));
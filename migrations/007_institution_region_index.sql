@@ -0,0 +1,113 @@
+-- 007: 기관 → 지역 인덱스
+--
+-- 소관기관(jrsdInsttNm)/수행기관(excInsttNm)별로 분류된 지역의 공고 수(support)를 유지합니다.
+-- 예: 사천시산업진흥원 → GYEONGNAM_04 (12건)
+-- 키워드/로컬/AI/수동 분류 결과를 근거로 삼고, 인덱스 자신('institution')의 분류는 제외해
+-- 잘못된 매핑이 스스로 강화되지 않도록 합니다.
+-- 기관명은 공백을 제거하고 소문자로 정규화합니다 (InstitutionRegionIndex.normalize와 동일).
+-- updated_at으로 애플리케이션이 바뀐 행만 다시 읽어 메모리 인덱스를 갱신합니다.
+
+CREATE TABLE IF NOT EXISTS institution_region_stats (
+    institution VARCHAR(200) NOT NULL,
+    region_code VARCHAR(20) NOT NULL,
+    support INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP NOT NULL DEFAULT clock_timestamp(),
+    PRIMARY KEY (institution, region_code)
+);
+
+CREATE INDEX IF NOT EXISTS idx_institution_region_stats_updated
+    ON institution_region_stats (updated_at);
+
+ALTER TABLE announcements DROP CONSTRAINT IF EXISTS announcements_classification_method_check;
+ALTER TABLE announcements ADD CONSTRAINT announcements_classification_method_check
+    CHECK (classification_method IN ('keyword', 'institution', 'local', 'ai', 'manual'));
+
+CREATE OR REPLACE FUNCTION institution_region_normalize(name TEXT)
+RETURNS TEXT AS $$
+    SELECT NULLIF(lower(regexp_replace(COALESCE(name, ''), '\s+', '', 'g')), '');
+$$ LANGUAGE sql IMMUTABLE;
+
+CREATE OR REPLACE FUNCTION institution_region_stats_apply()
+RETURNS trigger AS $$
+DECLARE
+    inst_name TEXT;
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE')
+       AND OLD.region_code IS NOT NULL
+       AND OLD.classification_method IS DISTINCT FROM 'institution' THEN
+        -- 소관기관과 수행기관이 같으면 한 번만 반영
+        FOR inst_name IN
+            SELECT DISTINCT candidate
+            FROM unnest(ARRAY[institution_region_normalize(OLD.jrsdInsttNm),
+                              institution_region_normalize(OLD.excInsttNm)]) AS candidate
+            WHERE candidate IS NOT NULL
+        LOOP
+            UPDATE institution_region_stats
+            SET support = GREATEST(support - 1, 0), updated_at = clock_timestamp()
+            WHERE institution = inst_name
+              AND region_code = OLD.region_code;
+        END LOOP;
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE')
+       AND NEW.region_code IS NOT NULL
+       AND NEW.classification_method IS DISTINCT FROM 'institution' THEN
+        -- 소관기관과 수행기관이 같으면 한 번만 반영
+        FOR inst_name IN
+            SELECT DISTINCT candidate
+            FROM unnest(ARRAY[institution_region_normalize(NEW.jrsdInsttNm),
+                              institution_region_normalize(NEW.excInsttNm)]) AS candidate
+            WHERE candidate IS NOT NULL
+        LOOP
+            INSERT INTO institution_region_stats (institution, region_code, support)
+            VALUES (inst_name, NEW.region_code, 1)
+            ON CONFLICT (institution, region_code)
+            DO UPDATE SET support = institution_region_stats.support + 1, updated_at = clock_timestamp();
+        END LOOP;
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_institution_region_insert ON announcements;
+CREATE TRIGGER trg_institution_region_insert
+    AFTER INSERT ON announcements
+    FOR EACH ROW
+    WHEN (NEW.region_code IS NOT NULL)
+    EXECUTE FUNCTION institution_region_stats_apply();
+
+DROP TRIGGER IF EXISTS trg_institution_region_update ON announcements;
+CREATE TRIGGER trg_institution_region_update
+    AFTER UPDATE OF region_code, classification_method, jrsdInsttNm, excInsttNm ON announcements
+    FOR EACH ROW
+    WHEN (OLD.region_code IS DISTINCT FROM NEW.region_code
+          OR OLD.classification_method IS DISTINCT FROM NEW.classification_method
+          OR OLD.jrsdInsttNm IS DISTINCT FROM NEW.jrsdInsttNm
+          OR OLD.excInsttNm IS DISTINCT FROM NEW.excInsttNm)
+    EXECUTE FUNCTION institution_region_stats_apply();
+
+DROP TRIGGER IF EXISTS trg_institution_region_delete ON announcements;
+CREATE TRIGGER trg_institution_region_delete
+    AFTER DELETE ON announcements
+    FOR EACH ROW
+    WHEN (OLD.region_code IS NOT NULL)
+    EXECUTE FUNCTION institution_region_stats_apply();
+
+-- 초기값 적재 (적재 중 쓰기를 막아 트리거 반영분과 겹치지 않도록 잠금)
+LOCK TABLE announcements IN SHARE ROW EXCLUSIVE MODE;
+
+DELETE FROM institution_region_stats;
+
+INSERT INTO institution_region_stats (institution, region_code, support)
+SELECT institution, region_code, COUNT(*)
+FROM (
+    SELECT DISTINCT a.id, evidence.institution, a.region_code
+    FROM announcements a
+    CROSS JOIN LATERAL unnest(ARRAY[institution_region_normalize(a.jrsdInsttNm),
+                                    institution_region_normalize(a.excInsttNm)]) AS evidence(institution)
+    WHERE a.region_code IS NOT NULL
+      AND a.classification_method IS DISTINCT FROM 'institution'
+      AND evidence.institution IS NOT NULL
+) AS evidence
+GROUP BY institution, region_code;
@@ -0,0 +1,15 @@
+-- 008: 장시간 작업 체크포인트
+--
+-- 미분류 공고 일괄 분류(drain_classification_backlog)는 id 순으로 처리하며
+-- 앞에서부터 연속으로 끝난 묶음의 마지막 id를 여기에 저장합니다.
+-- 작업이 중단되면 다음 실행이 last_id 이후부터 이어서 처리하고,
+-- finished_at이 채워진 체크포인트는 처음부터 새로 시작합니다.
+
+CREATE TABLE IF NOT EXISTS job_checkpoints (
+    name VARCHAR(100) PRIMARY KEY,
+    last_id BIGINT NOT NULL DEFAULT 0,
+    processed INTEGER NOT NULL DEFAULT 0,
+    started_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    finished_at TIMESTAMP
+);
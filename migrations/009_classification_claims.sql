@@ -0,0 +1,14 @@
+-- 009: 분류 작업 임대(lease) 컬럼
+--
+-- 여러 앱 인스턴스/스케줄러 프로세스가 같은 미분류 공고를 중복 분류하지 않도록,
+-- 워커는 SELECT ... FOR UPDATE SKIP LOCKED로 공고를 골라 claimed_by와 만료 시각을 기록한 뒤 분류합니다.
+-- 분류 결과를 저장하면 임대가 해제되고, 워커가 죽으면 claim_expires_at 이후 다른 워커가 다시 가져갑니다.
+
+ALTER TABLE announcements ADD COLUMN IF NOT EXISTS claimed_by VARCHAR(100);
+ALTER TABLE announcements ADD COLUMN IF NOT EXISTS claim_expires_at TIMESTAMP;
+
+-- 미분류 조회/임대 조건(classification_status = 'pending')이 새로 삽입된 공고에도 맞도록
+-- 기본값을 지정하고, 상태 없이 들어간 기존 미분류 공고를 pending으로 맞춤
+ALTER TABLE announcements ALTER COLUMN classification_status SET DEFAULT 'pending';
+UPDATE announcements SET classification_status = 'pending'
+WHERE classification_status IS NULL AND region_code IS NULL;
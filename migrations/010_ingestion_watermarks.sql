@@ -0,0 +1,12 @@
+-- 010: 기업마당 증분 수집 기준점
+--
+-- 수집 대상(해시태그)별로 지금까지 빠짐없이 저장한 가장 최신 공고의
+-- (등록일시 creatPnttm, 공고 ID pblancId)를 보관합니다.
+-- 수집기는 최신 페이지부터 읽다가 이 기준점을 넘으면 멈추고, 저장이 끝난 범위까지만 기준점을 앞으로 옮깁니다.
+
+CREATE TABLE IF NOT EXISTS ingestion_watermarks (
+    source VARCHAR(100) PRIMARY KEY,
+    last_created_at TIMESTAMP NOT NULL,
+    last_pblanc_id VARCHAR(50) NOT NULL,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
@@ -0,0 +1,11 @@
+-- 011: 공고 변경 감지용 해시
+--
+-- content_hash: 조회수(inqireCo)/전체 건수(totCnt)를 제외한 원본 공고 필드의 SHA-256
+-- classification_hash: 지역 분류에 쓰이는 필드(공고명/소관기관/수행기관/사업개요/해시태그/문의처)의 SHA-256
+--
+-- 수집기는 같은 pblancId의 공고를 content_hash가 달라졌을 때만 다시 저장하고,
+-- classification_hash까지 달라졌을 때만 (수동 분류/검증된 공고 제외) 분류를 초기화해 다시 분류합니다.
+-- 기존 행은 NULL로 시작하며, 처음 다시 수집될 때 한 번 해시가 채워집니다 (이때는 분류를 초기화하지 않음).
+
+ALTER TABLE announcements ADD COLUMN IF NOT EXISTS content_hash CHAR(64);
+ALTER TABLE announcements ADD COLUMN IF NOT EXISTS classification_hash CHAR(64);
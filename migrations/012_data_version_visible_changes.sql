@@ -0,0 +1,56 @@
+-- 012: 보이는 데이터가 바뀐 경우에만 공고 데이터 버전 갱신
+--
+-- 003의 문장 단위 트리거는 행을 하나도 바꾸지 않은 UPDATE(내용이 같은 upsert)나
+-- 분류 임대(claimed_by/claim_expires_at)만 바꾸는 UPDATE에도 버전을 올려서
+-- 수집/일괄 분류/워커 임대 때마다 ETag와 조회 캐시 키가 무효화되었습니다.
+-- 전이 테이블(REFERENCING)로 실제로 바뀐 행을 보고, 임대 컬럼 외의 값이 달라졌을 때만 올립니다.
+-- 전이 테이블은 이벤트가 하나인 트리거에만 쓸 수 있어 INSERT/UPDATE/DELETE 트리거를 나눕니다.
+
+CREATE OR REPLACE FUNCTION bump_announcements_data_version()
+RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        IF NOT EXISTS (SELECT 1 FROM new_rows) THEN
+            RETURN NULL;
+        END IF;
+    ELSIF TG_OP = 'DELETE' THEN
+        IF NOT EXISTS (SELECT 1 FROM old_rows) THEN
+            RETURN NULL;
+        END IF;
+    ELSIF NOT EXISTS (
+        SELECT 1
+        FROM new_rows n
+        JOIN old_rows o ON o.id = n.id
+        WHERE to_jsonb(n) - 'claimed_by' - 'claim_expires_at'
+              IS DISTINCT FROM to_jsonb(o) - 'claimed_by' - 'claim_expires_at'
+    ) THEN
+        RETURN NULL;
+    END IF;
+
+    UPDATE data_versions
+    SET version = version + 1,
+        updated_at = CURRENT_TIMESTAMP
+    WHERE name = 'announcements';
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_announcements_data_version ON announcements;
+
+DROP TRIGGER IF EXISTS trg_announcements_data_version_insert ON announcements;
+CREATE TRIGGER trg_announcements_data_version_insert
+    AFTER INSERT ON announcements
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION bump_announcements_data_version();
+
+DROP TRIGGER IF EXISTS trg_announcements_data_version_update ON announcements;
+CREATE TRIGGER trg_announcements_data_version_update
+    AFTER UPDATE ON announcements
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION bump_announcements_data_version();
+
+DROP TRIGGER IF EXISTS trg_announcements_data_version_delete ON announcements;
+CREATE TRIGGER trg_announcements_data_version_delete
+    AFTER DELETE ON announcements
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION bump_announcements_data_version();
@@ -0,0 +1,75 @@
+"""
+Aho-Corasick 다중 패턴 매칭 테스트
+"""
+
+import unittest
+
+from app.utils.aho_corasick import AhoCorasickAutomaton
+
+
+def build(*patterns):
+    automaton = AhoCorasickAutomaton()
+    for pattern in patterns:
+        automaton.add(pattern, pattern.upper())
+    return automaton.build()
+
+
+class AhoCorasickTest(unittest.TestCase):
+    """겹치는 매칭과 실패 링크를 따라간 출력이 모두 나오는지 확인"""
+
+    def test_reports_overlapping_and_nested_matches(self):
+        automaton = build('he', 'she', 'his', 'hers')
+
+        matches = automaton.find_all('ushers')
+
+        self.assertEqual(sorted(matches), [
+            (1, 4, 'she', 'SHE'),
+            (2, 4, 'he', 'HE'),
+            (2, 6, 'hers', 'HERS'),
+        ])
+
+    def test_korean_prefix_and_suffix_patterns(self):
+        automaton = build('창원', '창원시', '원시')
+
+        matches = automaton.find_all('창원시청')
+
+        self.assertEqual(sorted(matches), [
+            (0, 2, '창원', '창원'),
+            (0, 3, '창원시', '창원시'),
+            (1, 3, '원시', '원시'),
+        ])
+
+    def test_recovers_after_partial_match(self):
+        automaton = build('김해시')
+
+        self.assertEqual(automaton.find_all('김해김해시'), [(2, 5, '김해시', '김해시')])
+        self.assertEqual(automaton.find_all('김해 시'), [])
+
+    def test_repeated_matches_are_all_reported(self):
+        automaton = build('aa')
+
+        self.assertEqual([match[0] for match in automaton.find_all('aaaa')], [0, 1, 2])
+
+    def test_same_pattern_keeps_every_value(self):
+        automaton = AhoCorasickAutomaton()
+        automaton.add('고성', 'GYEONGNAM_12')
+        automaton.add('고성', 'GANGWON_GOSEONG')
+
+        values = [match[3] for match in automaton.find_all('고성군')]
+
+        self.assertEqual(values, ['GYEONGNAM_12', 'GANGWON_GOSEONG'])
+        self.assertEqual(len(automaton), 2)
+
+    def test_builds_lazily_and_rejects_late_or_empty_patterns(self):
+        automaton = AhoCorasickAutomaton()
+        automaton.add('양산')
+        self.assertEqual(automaton.find_all('양산시'), [(0, 2, '양산', None)])
+
+        with self.assertRaises(RuntimeError):
+            automaton.add('밀양')
+        with self.assertRaises(ValueError):
+            AhoCorasickAutomaton().add('')
+
+
+if __name__ == '__main__':
+    unittest.main()
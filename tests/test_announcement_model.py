@@ -0,0 +1,101 @@
+"""
+공고 모델 배치 저장 테스트 (DB 없이 커서를 대체해 실행)
+"""
+
+import unittest
+from contextlib import contextmanager
+from unittest import mock
+
+import psycopg2
+
+from app.models.announcement import AnnouncementModel
+
+
+def make_announcements(count):
+    return [{'pblancId': f'PBLN_{i:03d}', 'pblancNm': f'공고 {i}'} for i in range(count)]
+
+
+class FakeConnection:
+    def __init__(self):
+        self.closed = 0
+
+    def rollback(self):
+        if self.closed:
+            raise psycopg2.InterfaceError('connection already closed')
+
+    def commit(self):
+        pass
+
+
+class WriteInChunksTest(unittest.TestCase):
+    """_write_in_chunks가 중간에 연결이 끊겨도 저장하지 못한 행을 실패로 돌려주는지 확인"""
+
+    def patch_cursor(self, connection):
+        @contextmanager
+        def get_db_cursor():
+            yield mock.Mock(), connection
+        return mock.patch('app.models.announcement.DatabaseManager.get_db_cursor', get_db_cursor)
+
+    def test_connection_lost_mid_way_reports_remaining_rows_as_failed(self):
+        announcements = make_announcements(5)
+        connection = FakeConnection()
+
+        def execute_values(cursor, sql, values, page_size, fetch):
+            if values[0][0] == 'PBLN_000':
+                return [{'id': 1, 'pblancId': 'PBLN_000'}, {'id': 2, 'pblancId': 'PBLN_001'}]
+            connection.closed = 2
+            raise psycopg2.OperationalError('server closed the connection unexpectedly')
+
+        with self.patch_cursor(connection), \
+                mock.patch('psycopg2.extras.execute_values', side_effect=execute_values):
+            result = AnnouncementModel.bulk_insert_announcements(announcements, chunk_size=2)
+
+        self.assertEqual([row['pblancId'] for row in result['inserted']], ['PBLN_000', 'PBLN_001'])
+        self.assertEqual([row['pblancId'] for row in result['failed']], ['PBLN_002', 'PBLN_003', 'PBLN_004'])
+        self.assertEqual(result['duplicates'], [])
+
+    def test_pool_timeout_reports_every_row_as_failed(self):
+        @contextmanager
+        def get_db_cursor():
+            raise TimeoutError('연결 풀 대기 시간 초과')
+            yield
+
+        announcements = make_announcements(3)
+        with mock.patch('app.models.announcement.DatabaseManager.get_db_cursor', get_db_cursor):
+            result = AnnouncementModel.upsert_announcements(announcements)
+
+        self.assertEqual(len(result['failed']), 3)
+        self.assertEqual(result['unchanged'], [])
+        self.assertEqual(result['failed'][0]['error'], '연결 풀 대기 시간 초과')
+
+    def test_row_level_retry_keeps_rows_written_before_disconnect(self):
+        announcements = make_announcements(3)
+        connection = FakeConnection()
+        cursor = mock.Mock()
+        written = []
+
+        def execute(sql, row_values):
+            if row_values[0] == 'PBLN_001':
+                connection.closed = 2
+                raise psycopg2.OperationalError('server closed the connection unexpectedly')
+            written.append({'id': len(written) + 1, 'pblancId': row_values[0]})
+
+        cursor.execute.side_effect = execute
+        cursor.fetchone.side_effect = lambda: written[-1]
+
+        @contextmanager
+        def get_db_cursor():
+            yield cursor, connection
+
+        with mock.patch('app.models.announcement.DatabaseManager.get_db_cursor', get_db_cursor), \
+                mock.patch('psycopg2.extras.execute_values',
+                           side_effect=psycopg2.DataError('value too long')):
+            result = AnnouncementModel.bulk_insert_announcements(announcements)
+
+        self.assertEqual([row['pblancId'] for row in result['inserted']], ['PBLN_000'])
+        self.assertEqual([row['pblancId'] for row in result['failed']], ['PBLN_001', 'PBLN_002'])
+        self.assertEqual(result['duplicates'], [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,125 @@
+"""
+Gemini 분류기 배치 계획/동시 실행 테스트 (API 호출 없이 배치 처리를 대체해 실행)
+"""
+
+import os
+import time
+import unittest
+from unittest import mock
+
+from app.services import gemini_classifier
+from app.services.gemini_classifier import AIClassificationResult, GeminiClassifier
+
+
+def make_classifier(**env):
+    settings = {
+        'GEMINI_TARGET_PROMPT_TOKENS': '6000',
+        'GEMINI_MAX_BATCH_SIZE': '25',
+        'GEMINI_MAX_CONCURRENCY': '4',
+        'GEMINI_ITEM_RETRY_ATTEMPTS': '2',
+        'GEMINI_RPM': '6000',
+        'GEMINI_TPM': '100000000',
+        'AI_CLASSIFICATION_CACHE': 'false',
+        **env
+    }
+    with mock.patch.object(gemini_classifier, 'genai', mock.Mock()), \
+            mock.patch.dict(os.environ, settings):
+        return GeminiClassifier('test-key')
+
+
+def make_announcements(count, summary=''):
+    return [{'pblancId': f'PBLN_{i:03d}', 'pblancNm': f'공고 {i}', 'bsnsSumryCn': summary}
+            for i in range(count)]
+
+
+def echo_results(batch, region_code='ALL'):
+    return [AIClassificationResult(region_code=region_code, confidence=0.9, reason=item['pblancId'])
+            for item in batch]
+
+
+class PlanBatchesTest(unittest.TestCase):
+    """_plan_batches가 공고 순서를 지키면서 크기/토큰 한도에 맞춰 묶는지 확인"""
+
+    def test_keeps_order_and_respects_size_cap(self):
+        classifier = make_classifier(GEMINI_MAX_BATCH_SIZE='4', GEMINI_TARGET_PROMPT_TOKENS='1000000')
+        announcements = make_announcements(10)
+
+        batches = classifier._plan_batches(announcements)
+
+        self.assertEqual([len(batch) for batch in batches], [4, 4, 2])
+        self.assertEqual([item for batch in batches for item in batch], announcements)
+
+    def test_splits_on_prompt_token_budget(self):
+        classifier = make_classifier(GEMINI_MAX_BATCH_SIZE='100')
+        announcements = make_announcements(12, summary='가' * 200)
+        overhead = classifier._estimate_prompt_tokens(classifier._create_batch_prompt([]))
+        per_item = (classifier._estimate_prompt_tokens(classifier._format_announcement(1, announcements[0])) +
+                    classifier.output_tokens_per_item)
+        classifier.target_prompt_tokens = overhead + per_item * 5
+
+        batches = classifier._plan_batches(announcements)
+
+        self.assertEqual([len(batch) for batch in batches], [5, 5, 2])
+
+    def test_oversized_announcement_goes_alone(self):
+        classifier = make_classifier(GEMINI_TARGET_PROMPT_TOKENS='1')
+
+        batches = classifier._plan_batches(make_announcements(3))
+
+        self.assertEqual([len(batch) for batch in batches], [1, 1, 1])
+
+    def test_shrunken_cap_limits_next_plan(self):
+        classifier = make_classifier(GEMINI_MAX_BATCH_SIZE='8', GEMINI_TARGET_PROMPT_TOKENS='1000000')
+        classifier._batch_size_cap = 3
+
+        batches = classifier._plan_batches(make_announcements(7))
+
+        self.assertEqual([len(batch) for batch in batches], [3, 3, 1])
+
+
+class ClassifyUncachedTest(unittest.TestCase):
+    """배치를 동시에 실행해도 결과가 입력 공고 순서대로 돌아오는지 확인"""
+
+    def test_results_follow_input_order_when_batches_finish_out_of_order(self):
+        classifier = make_classifier(GEMINI_MAX_BATCH_SIZE='3', GEMINI_TARGET_PROMPT_TOKENS='1000000')
+        announcements = make_announcements(10)
+
+        def process_batch(batch):
+            # 앞 배치일수록 늦게 끝나도록 지연
+            time.sleep(0.05 * (10 - int(batch[0]['pblancId'][-3:])) / 10)
+            return echo_results(batch)
+
+        with mock.patch.object(classifier, '_process_batch', side_effect=process_batch):
+            results = classifier._classify_uncached(announcements)
+
+        self.assertEqual([result.reason for result in results],
+                         [item['pblancId'] for item in announcements])
+
+    def test_failed_items_are_retried_and_cap_shrinks(self):
+        classifier = make_classifier(GEMINI_MAX_BATCH_SIZE='4', GEMINI_TARGET_PROMPT_TOKENS='1000000')
+        announcements = make_announcements(4)
+        calls = []
+
+        def process_batch(batch):
+            calls.append([item['pblancId'] for item in batch])
+            results = echo_results(batch)
+            if len(calls) == 1:
+                results[1] = AIClassificationResult(region_code=None, confidence=0.0)
+            return results
+
+        with mock.patch.object(classifier, '_process_batch', side_effect=process_batch):
+            results = classifier._classify_uncached(announcements)
+
+        self.assertEqual(calls, [['PBLN_000', 'PBLN_001', 'PBLN_002', 'PBLN_003'], ['PBLN_001']])
+        self.assertEqual([result.reason for result in results],
+                         [item['pblancId'] for item in announcements])
+        self.assertEqual(classifier._batch_size_cap, 2)
+
+        # 온전한 응답이 오면 한 건씩 복구
+        with mock.patch.object(classifier, '_process_batch', side_effect=echo_results):
+            classifier._classify_uncached(make_announcements(2))
+        self.assertEqual(classifier._batch_size_cap, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+"""
+기업마당 응답 스트리밍 파서 테스트 (바이트 조각 경계를 바꿔 가며 실행)
+"""
+
+import json
+import unittest
+
+from app.services.bizinfo_api import iter_json_array
+
+ITEMS = [
+    {'pblancId': 'PBLN_001', 'pblancNm': '[경남] 창원 "스마트공장" 지원', 'bsnsSumryCn': '경로 C:\\data\\공고'},
+    {'pblancId': 'PBLN_002', 'pblancNm': '괄호 ] } [ { 가 든 제목', 'refrncNm': '055-000-0000\n담당자'},
+    {'pblancId': 'PBLN_003', 'pblancNm': 'café \u00e9 \U0001F680', 'hashtags': '경남,창업'},
+]
+
+
+def encode(payload):
+    return json.dumps(payload, ensure_ascii=False).encode('utf-8')
+
+
+def split_every(data, size):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+class IterJsonArrayTest(unittest.TestCase):
+    """iter_json_array가 조각 경계와 상관없이 같은 항목을 내보내고, 잘린 응답은 오류로 알리는지 확인"""
+
+    def test_whole_body_in_one_chunk(self):
+        data = encode({'reqErr': '', 'jsonArray': ITEMS})
+
+        self.assertEqual(list(iter_json_array([data])), ITEMS)
+
+    def test_every_chunk_size_yields_the_same_items(self):
+        data = encode({'totCnt': 3, 'jsonArray': ITEMS})
+
+        for size in (1, 2, 3, 7, 64):
+            with self.subTest(size=size):
+                self.assertEqual(list(iter_json_array(split_every(data, size))), ITEMS)
+
+    def test_split_right_after_escape_backslash(self):
+        data = encode({'jsonArray': ITEMS})
+        for escaped in (b'\\"', b'\\\\', b'\\n'):
+            cut = data.index(escaped) + 1
+            with self.subTest(escaped=escaped):
+                self.assertEqual(list(iter_json_array([data[:cut], data[cut:]])), ITEMS)
+
+    def test_split_inside_multibyte_character(self):
+        data = encode({'jsonArray': ITEMS})
+        cut = data.index('창원'.encode('utf-8')) + 1
+
+        self.assertEqual(list(iter_json_array([data[:cut], data[cut:]])), ITEMS)
+
+    def test_key_split_across_chunks_and_other_arrays_ignored(self):
+        data = b'{"meta": [1, 2], "json' + b'Array"  :\n [' + encode(ITEMS[0]) + b']}'
+
+        self.assertEqual(list(iter_json_array(split_every(data, 5))), ITEMS[:1])
+
+    def test_empty_array(self):
+        self.assertEqual(list(iter_json_array([b'{"jsonArray": []}'])), [])
+
+    def test_truncated_array_raises_after_complete_items(self):
+        data = encode({'jsonArray': ITEMS})
+        cut = data.index(b'PBLN_003')
+        received = []
+
+        with self.assertRaises(json.JSONDecodeError):
+            for item in iter_json_array(split_every(data[:cut], 16)):
+                received.append(item)
+
+        self.assertEqual(received, ITEMS[:2])
+
+    def test_truncated_before_closing_bracket_raises(self):
+        data = encode({'jsonArray': ITEMS})
+        cut = data.rindex(b']')
+
+        with self.assertRaises(json.JSONDecodeError):
+            list(iter_json_array([data[:cut]]))
+
+    def test_missing_key_raises(self):
+        with self.assertRaises(json.JSONDecodeError):
+            list(iter_json_array([b'{"reqErr": "invalid key"}']))
+
+    def test_custom_key(self):
+        data = encode({'items': ITEMS[:2]})
+
+        self.assertEqual(list(iter_json_array(split_every(data, 3), key='items')), ITEMS[:2])
+
+
+if __name__ == '__main__':
+    unittest.main()
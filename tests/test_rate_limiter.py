@@ -0,0 +1,91 @@
+"""
+토큰 버킷 속도 제한기 테스트 (시계를 고정해 대기 시간을 결정적으로 확인)
+"""
+
+import unittest
+from unittest import mock
+
+from app.utils.rate_limiter import TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TokenBucketTest(unittest.TestCase):
+    """TokenBucket의 차감/대기 시간/환불/비우기 동작 확인"""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        patcher = mock.patch('app.utils.rate_limiter.time.monotonic', self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_rejects_non_positive_rate(self):
+        with self.assertRaises(ValueError):
+            TokenBucket(0)
+
+    def test_try_acquire_spends_tokens_until_empty(self):
+        bucket = TokenBucket(per_minute=60)  # 초당 1개, 용량 60
+
+        self.assertEqual(bucket.try_acquire(59), 0.0)
+        self.assertEqual(bucket.try_acquire(1), 0.0)
+        # 부족하면 차감하지 않고 채워질 때까지의 시간을 돌려줌
+        self.assertAlmostEqual(bucket.try_acquire(3), 3.0)
+        self.assertAlmostEqual(bucket.try_acquire(3), 3.0)
+
+    def test_tokens_refill_with_elapsed_time(self):
+        bucket = TokenBucket(per_minute=60)
+        bucket.try_acquire(60)
+
+        self.clock.now += 2.5
+        self.assertAlmostEqual(bucket.try_acquire(3), 0.5)
+        self.assertEqual(bucket.try_acquire(2), 0.0)
+
+    def test_refill_never_exceeds_capacity(self):
+        bucket = TokenBucket(per_minute=60, capacity=10)
+
+        self.clock.now += 3600
+        self.assertEqual(bucket.try_acquire(10), 0.0)
+        self.assertAlmostEqual(bucket.try_acquire(1), 1.0)
+
+    def test_request_larger_than_capacity_waits_for_full_bucket(self):
+        bucket = TokenBucket(per_minute=60, capacity=10)
+
+        self.assertEqual(bucket.try_acquire(500), 0.0)
+        self.assertAlmostEqual(bucket.try_acquire(500), 10.0)
+
+    def test_refund_returns_unused_tokens_up_to_capacity(self):
+        bucket = TokenBucket(per_minute=60, capacity=10)
+        bucket.try_acquire(10)
+
+        bucket.refund(4)
+        self.assertEqual(bucket.try_acquire(4), 0.0)
+
+        bucket.refund(100)
+        self.assertEqual(bucket.try_acquire(10), 0.0)
+
+    def test_negative_refund_charges_overuse(self):
+        bucket = TokenBucket(per_minute=60, capacity=10)
+        bucket.try_acquire(10)
+
+        bucket.refund(-5)
+        self.assertAlmostEqual(bucket.try_acquire(1), 6.0)
+
+    def test_drain_empties_bucket_but_keeps_debt(self):
+        bucket = TokenBucket(per_minute=60, capacity=10)
+
+        bucket.drain()
+        self.assertAlmostEqual(bucket.try_acquire(2), 2.0)
+
+        bucket.refund(-3)
+        bucket.drain()
+        self.assertAlmostEqual(bucket.try_acquire(1), 4.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+"""
+지역 카탈로그 매칭 테스트 (regions 테이블 대신 작은 지역 목록으로 실행)
+"""
+
+import unittest
+
+from app.services.region_catalog import RegionCatalog, WEAK_OUTSIDE_CONFIDENCE
+
+REGIONS = [
+    {'code': 'ALL', 'name': '전국', 'type': 'national', 'parent_code': None},
+    {'code': 'OTHER', 'name': '기타', 'type': 'other', 'parent_code': None},
+    {'code': 'GYEONGNAM', 'name': '경상남도', 'type': 'provincial', 'parent_code': None, 'aliases': ['경남']},
+    {'code': 'GYEONGNAM_01', 'name': '창원시', 'type': 'municipal', 'parent_code': 'GYEONGNAM'},
+    {'code': 'GYEONGNAM_05', 'name': '김해시', 'type': 'municipal', 'parent_code': 'GYEONGNAM'},
+    {'code': 'GYEONGNAM_12', 'name': '고성군', 'type': 'municipal', 'parent_code': 'GYEONGNAM'},
+    {'code': 'GANGWON', 'name': '강원특별자치도', 'type': 'provincial', 'parent_code': None, 'aliases': ['강원도']},
+    {'code': 'GANGWON_GOSEONG', 'name': '고성군', 'type': 'municipal', 'parent_code': 'GANGWON'},
+    {'code': 'GYEONGGI', 'name': '경기도', 'type': 'provincial', 'parent_code': None},
+    {'code': 'GYEONGGI_ICHEON', 'name': '이천시', 'type': 'municipal', 'parent_code': 'GYEONGGI'},
+    {'code': 'GYEONGGI_ANSAN', 'name': '안산시', 'type': 'municipal', 'parent_code': 'GYEONGGI'},
+    {'code': 'GYEONGGI_GWANGJU', 'name': '광주시', 'type': 'municipal', 'parent_code': 'GYEONGGI'},
+    {'code': 'GWANGJU', 'name': '광주광역시', 'type': 'provincial', 'parent_code': None},
+    {'code': 'GYEONGBUK', 'name': '경상북도', 'type': 'provincial', 'parent_code': None, 'aliases': ['경북']},
+    {'code': 'GYEONGBUK_GUMI', 'name': '구미시', 'type': 'municipal', 'parent_code': 'GYEONGBUK'},
+    {'code': 'BUSAN', 'name': '부산광역시', 'type': 'provincial', 'parent_code': None},
+    {'code': 'BUSAN_SEO', 'name': '서구', 'type': 'municipal', 'parent_code': 'BUSAN'},
+    {'code': 'BUSAN_GANGSEO', 'name': '강서구', 'type': 'municipal', 'parent_code': 'BUSAN'},
+    {'code': 'INCHEON', 'name': '인천광역시', 'type': 'provincial', 'parent_code': None},
+    {'code': 'INCHEON_SEO', 'name': '서구', 'type': 'municipal', 'parent_code': 'INCHEON'},
+]
+
+
+def classify(catalog, title):
+    return catalog.classify_fields({'pblancNm': title})
+
+
+class SurfaceFormTest(unittest.TestCase):
+    """전체 이름/별칭(강한 표기)과 자동 약칭/두 글자 자치구(약한 표기)의 경계 규칙 확인"""
+
+    def setUp(self):
+        self.catalog = RegionCatalog(REGIONS, served_provinces={'GYEONGNAM'})
+
+    def test_full_name_matches_inside_words(self):
+        match = classify(self.catalog, '창원시청 주관 지원사업')
+
+        self.assertEqual((match.region_code, match.keyword, match.confidence), ('GYEONGNAM_01', '창원시', 0.9))
+
+    def test_auto_stem_matches_on_word_boundary_or_locality_suffix(self):
+        for title in ('창원 기업 지원', '[김해] 수출 바우처', '창원 소재 기업', '김해지역 소상공인', '창원관내 기업'):
+            with self.subTest(title=title):
+                self.assertIn(classify(self.catalog, title).region_code, ('GYEONGNAM_01', 'GYEONGNAM_05'))
+
+    def test_auto_stem_inside_word_is_ignored(self):
+        for title in ('이천만원 한도 융자', '신안산선 역세권 창업', '창원리스 지원'):
+            with self.subTest(title=title):
+                self.assertIsNone(classify(self.catalog, title))
+
+    def test_strong_outside_match_is_confident(self):
+        match = classify(self.catalog, '이천시 중소기업 지원')
+
+        self.assertEqual((match.region_code, match.confidence), ('OTHER', 0.8))
+
+    def test_weak_outside_match_falls_below_keyword_threshold(self):
+        for title in ('구미 당기는 신제품 개발', '서구 문화 행사'):
+            with self.subTest(title=title):
+                match = classify(self.catalog, title)
+                self.assertEqual((match.region_code, match.confidence), ('OTHER', WEAK_OUTSIDE_CONFIDENCE))
+
+    def test_longer_match_hides_contained_shorter_one(self):
+        matches = self.catalog.find_matches({'pblancNm': '강서구 창원시 공동 사업'})
+
+        self.assertEqual([match.keyword for match in matches], ['강서구', '창원시'])
+
+    def test_served_municipality_beats_province_and_outside(self):
+        match = classify(self.catalog, '경기도 기업의 경남 창원 이전 지원')
+
+        self.assertEqual(match.region_code, 'GYEONGNAM_01')
+
+
+class ResolveTest(unittest.TestCase):
+    """같은 이름의 지역(고성군, 서구, 광주) 구분 확인"""
+
+    def setUp(self):
+        self.catalog = RegionCatalog(REGIONS, served_provinces={'GYEONGNAM'})
+
+    def test_prefers_province_mentioned_in_the_same_announcement(self):
+        self.assertEqual(classify(self.catalog, '강원도 고성군 관광 지원').region_code, 'OTHER')
+        self.assertEqual(classify(self.catalog, '경남 고성군 어업 지원').region_code, 'GYEONGNAM_12')
+
+    def test_context_from_another_field_is_used(self):
+        matches = self.catalog.find_matches({
+            'pblancNm': '고성군 관광 지원',
+            'jrsdInsttNm': '강원특별자치도',
+        })
+
+        self.assertEqual(matches[0].keyword, '고성군')
+        self.assertEqual(matches[0].region_code, 'OTHER')
+
+    def test_defaults_to_home_province_without_context(self):
+        self.assertEqual(classify(self.catalog, '고성군 어업 지원').region_code, 'GYEONGNAM_12')
+        self.assertEqual(
+            self.catalog._resolve(('GANGWON_GOSEONG', 'GYEONGNAM_12'), set()), 'GYEONGNAM_12'
+        )
+
+    def test_prefers_provincial_region_when_nothing_else_decides(self):
+        self.assertEqual(self.catalog._resolve(('GYEONGGI_GWANGJU', 'GWANGJU'), set()), 'GWANGJU')
+        self.assertEqual(
+            self.catalog._resolve(('GYEONGGI_GWANGJU', 'GWANGJU'), {'GYEONGGI'}), 'GYEONGGI_GWANGJU'
+        )
+
+    def test_falls_back_to_catalog_order(self):
+        self.assertEqual(self.catalog._resolve(('INCHEON_SEO', 'BUSAN_SEO'), set()), 'BUSAN_SEO')
+        self.assertEqual(self.catalog._resolve(('INCHEON_SEO', 'BUSAN_SEO'), {'INCHEON'}), 'INCHEON_SEO')
+
+    def test_serving_every_province_keeps_municipal_codes(self):
+        catalog = RegionCatalog(REGIONS, served_provinces=None)
+
+        self.assertEqual(classify(catalog, '강원도 고성군 관광 지원').region_code, 'GANGWON_GOSEONG')
+
+
+if __name__ == '__main__':
+    unittest.main()